@@ -0,0 +1,123 @@
+# tests/helpers.py
+#
+# Utilidades comunes de las pruebas. Los módulos de wavl/ se importan por
+# nombre (como en los benchmarks), así que se agrega wavl/ a sys.path.
+
+import math
+import os
+import sys
+
+WAVL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "wavl")
+if WAVL_DIR not in sys.path:
+    sys.path.insert(0, WAVL_DIR)
+
+
+def height(root) -> int:
+    # Altura en aristas (árbol vacío = -1), sin recursión
+    if root is None:
+        return -1
+    level, depth = [root], -1
+    while level:
+        depth += 1
+        level = [c for node in level for c in (node.left, node.right) if c is not None]
+    return depth
+
+
+def height_bound(n: int) -> float:
+    # Cota de altura de un WAVL con inserciones y eliminaciones
+    return 2 * math.log2(n) + 1 if n > 0 else -1
+
+
+def sizes_ok(root) -> bool:
+    # Cada nodo guarda el tamaño de su subárbol (order_stats=True)
+    if root is None:
+        return True
+    stack, order = [root], []
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(c for c in (node.left, node.right) if c is not None)
+    for node in reversed(order):
+        expected = 1 + sum(c.size for c in (node.left, node.right) if c is not None)
+        if node.size != expected:
+            return False
+    return True
+
+
+def array_keys(tree) -> list:
+    # Recorrido in-order de un ArrayWAVLTree (índices, NIL = -1)
+    nodes, out, stack, i = tree._nodes, [], [], tree.root
+    while stack or i != -1:
+        while i != -1:
+            stack.append(i)
+            i = nodes.left[i]
+        i = stack.pop()
+        out.append(nodes.key[i])
+        i = nodes.right[i]
+    return out
+
+
+def array_wavl_ok(tree) -> bool:
+    # Reglas de rango WAVL y punteros parent sobre los arreglos de nodos
+    nodes = tree._nodes
+    if tree.root == -1:
+        return True
+    if nodes.parent[tree.root] != -1:
+        return False
+    stack = [tree.root]
+    while stack:
+        i = stack.pop()
+        children = (nodes.left[i], nodes.right[i])
+        for c in children:
+            rank_c = -1 if c == -1 else nodes.rank[c]
+            if nodes.rank[i] - rank_c not in (1, 2):
+                return False
+            if c != -1:
+                if nodes.parent[c] != i:
+                    return False
+                stack.append(c)
+        if children == (-1, -1) and nodes.rank[i] != 0:
+            return False
+    return True
+
+
+def avl_ok(root) -> bool:
+    # Alturas guardadas correctas y factor de balance en {-1, 0, 1}
+    def check(node):
+        if node is None:
+            return -1
+        hl, hr = check(node.left), check(node.right)
+        if hl is None or hr is None or abs(hl - hr) > 1:
+            return None
+        h = 1 + max(hl, hr)
+        return h if node.height == h else None
+    return check(root) is not None
+
+
+def rbt_ok(root) -> bool:
+    # Raíz negra, sin rojo con hijo rojo y misma altura negra en toda ruta
+    from rbt import RED
+
+    def black_height(node):
+        if node is None:
+            return 1
+        for child in (node.left, node.right):
+            if child is not None and node.color == RED and child.color == RED:
+                return None
+        hl, hr = black_height(node.left), black_height(node.right)
+        if hl is None or hl != hr:
+            return None
+        return hl + (node.color != RED)
+    return root is None or (root.color != RED and black_height(root) is not None)
+
+
+def checker_for(tree):
+    # Validador de balance según el tipo de árbol
+    from avl import AVLTree
+    from rbt import RBTree
+    from utils_wavl import is_valid_wavl
+    if isinstance(tree, AVLTree):
+        return avl_ok
+    if isinstance(tree, RBTree):
+        return rbt_ok
+    return is_valid_wavl
@@ -0,0 +1,113 @@
+# tests/test_array_wavl.py
+
+import random
+import unittest
+from helpers import array_keys, array_wavl_ok, height_bound
+from array_wavl import ArrayWAVLTree
+
+
+def array_height(tree) -> int:
+    nodes = tree._nodes
+    level, depth = ([tree.root] if tree.root != -1 else []), -1
+    while level:
+        depth += 1
+        level = [c for i in level for c in (nodes.left[i], nodes.right[i]) if c != -1]
+    return depth
+
+
+class TestArrayWAVL(unittest.TestCase):
+    def build(self, keys):
+        tree = ArrayWAVLTree()
+        for key in keys:
+            tree.insert(key)
+        return tree
+
+    def test_random_insert_delete_against_model(self):
+        rng = random.Random(11)
+        tree = ArrayWAVLTree()
+        model = []
+        for i in range(10_000):
+            key = rng.randrange(500)
+            if rng.random() < 0.6:
+                tree.insert(key)
+                model.append(key)
+            else:
+                tree.delete(key)
+                if key in model:
+                    model.remove(key)
+            if i % 500 == 0:
+                self.assertTrue(array_wavl_ok(tree))
+                self.assertLessEqual(array_height(tree), height_bound(len(model)))
+        self.assertEqual(array_keys(tree), sorted(model))
+
+    def test_duplicates(self):
+        tree = self.build([3, 1, 3, 3, 2, 1])
+        self.assertEqual(array_keys(tree), [1, 1, 2, 3, 3, 3])
+        tree.delete(3)
+        self.assertEqual(array_keys(tree), [1, 1, 2, 3, 3])
+        self.assertTrue(array_wavl_ok(tree))
+
+    def test_split_drops_every_copy(self):
+        # Regresión: el descenso se detenía en la primera copia de `key`
+        tree = self.build(list(range(30)) + [0, 1])
+        left, right = tree.split(1)
+        self.assertEqual(array_keys(left), [0, 0])
+        self.assertEqual(array_keys(right), list(range(2, 30)))
+        self.assertEqual(tree.root, -1)
+
+    def test_split_random_with_duplicates(self):
+        rng = random.Random(12)
+        for _ in range(50):
+            keys = [rng.randrange(60) for _ in range(rng.randrange(1, 200))]
+            tree = self.build(keys)
+            key = rng.randrange(-1, 61)
+            left, right = tree.split(key)
+            self.assertEqual(array_keys(left), sorted(k for k in keys if k < key))
+            self.assertEqual(array_keys(right), sorted(k for k in keys if k > key))
+            self.assertTrue(array_wavl_ok(left))
+            self.assertTrue(array_wavl_ok(right))
+
+    def test_split_releases_dropped_nodes(self):
+        tree = self.build([5] * 10 + list(range(10)))
+        slots = len(tree._nodes)
+        left, right = tree.split(5)
+        for key in range(10):
+            left.insert(100 + key)
+        self.assertEqual(len(tree._nodes), slots)
+
+    def test_join_with_duplicates(self):
+        rng = random.Random(13)
+        for _ in range(30):
+            keys = sorted(rng.randrange(40) for _ in range(rng.randrange(1, 150)))
+            cut = rng.randrange(len(keys) + 1)
+            left = ArrayWAVLTree()
+            for key in keys[:cut]:
+                left.insert(key)
+            right = ArrayWAVLTree(left._nodes)
+            for key in keys[cut:]:
+                right.insert(key)
+            joined = left.join(right)
+            self.assertEqual(array_keys(joined), keys)
+            self.assertTrue(array_wavl_ok(joined))
+
+    def test_join_across_stores(self):
+        left = self.build(range(5))
+        right = self.build(range(5, 300))
+        joined = left.join(right)
+        self.assertEqual(array_keys(joined), list(range(300)))
+        self.assertTrue(array_wavl_ok(joined))
+
+    def test_join_with_empty_side_returns_new_tree(self):
+        for left_keys, right_keys in (([], [1, 2]), ([1, 2], []), ([], [])):
+            left = self.build(left_keys)
+            right = ArrayWAVLTree(left._nodes)
+            for key in right_keys:
+                right.insert(key)
+            joined = left.join(right)
+            self.assertIsNot(joined, left)
+            self.assertEqual(array_keys(joined), left_keys + right_keys)
+            self.assertEqual((left.root, right.root), (-1, -1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+# tests/test_batch.py
+
+import random
+import unittest
+from helpers import checker_for, sizes_ok
+from tree_wavl import WAVLTree
+from avl import AVLTree
+from rbt import RBTree
+
+TREES = (WAVLTree, AVLTree, RBTree)
+
+
+class TestBatch(unittest.TestCase):
+    def test_insert_many_matches_insert(self):
+        rng = random.Random(18)
+        for cls in TREES:
+            for _ in range(10):
+                base = [rng.randrange(500) for _ in range(rng.randrange(0, 300))]
+                batch = [rng.randrange(500) for _ in range(rng.randrange(0, 300))]
+                tree = cls.from_sorted(base, order_stats=True)
+                tree.insert_many(batch)
+                self.assertEqual(list(tree), sorted(base + batch))
+                self.assertTrue(checker_for(tree)(tree.root))
+                self.assertTrue(sizes_ok(tree.root))
+
+    def test_insert_many_into_empty_tree(self):
+        for cls in TREES:
+            tree = cls()
+            tree.insert_many(iter([5, 1, 3, 1]))
+            self.assertEqual(list(tree), [1, 1, 3, 5])
+
+    def test_delete_many_matches_delete(self):
+        rng = random.Random(19)
+        for cls in TREES:
+            for _ in range(10):
+                base = [rng.randrange(300) for _ in range(rng.randrange(0, 400))]
+                batch = [rng.randrange(320) for _ in range(rng.randrange(0, 300))]
+                one_by_one = cls.from_sorted(base)
+                for key in batch:
+                    one_by_one.delete(key)
+                tree = cls.from_sorted(base, order_stats=True)
+                tree.delete_many(batch)
+                self.assertEqual(list(tree), list(one_by_one))
+                self.assertTrue(checker_for(tree)(tree.root))
+                self.assertTrue(sizes_ok(tree.root))
+
+    def test_delete_many_everything(self):
+        for cls in TREES:
+            tree = cls.from_sorted(range(100))
+            tree.delete_many(list(range(100)) + [5, 200])
+            self.assertIsNone(tree.root)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# tests/test_bplus.py
+
+import random
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from bplus_tree import BPlusTree
+
+
+def bplus_ok(tree) -> bool:
+    """
+    Verifica ocupación (fanout // 2 .. fanout salvo la raíz), hojas a la
+    misma profundidad, separadores y que la cadena de hojas coincida con el
+    recorrido del árbol.
+    """
+    minimum, fanout = tree.fanout // 2, tree.fanout
+    leaves, depths = [], set()
+
+    def walk(node, depth, lo, hi, is_root):
+        if any(a > b for a, b in zip(node.keys, node.keys[1:])):
+            return False
+        if node.children is None:
+            fill = len(node.keys)
+            leaves.append(node)
+            depths.add(depth)
+        else:
+            fill = len(node.children)
+            if len(node.keys) != fill - 1:
+                return False
+        if fill > fanout or (not is_root and fill < minimum):
+            return False
+        if any((lo is not None and k < lo) or (hi is not None and k > hi) for k in node.keys):
+            return False
+        if node.children is None:
+            return True
+        bounds = [lo] + node.keys + [hi]
+        return all(walk(child, depth + 1, bounds[i], bounds[i + 1], False)
+                   for i, child in enumerate(node.children))
+
+    if not walk(tree.root, 0, None, None, True) or len(depths) > 1:
+        return False
+    for left, right in zip(leaves, leaves[1:]):
+        if left.next is not right:
+            return False
+    chained = [k for leaf in leaves for k in leaf.keys]
+    return leaves[-1].next is None and len(chained) == tree.size
+
+
+class TestBPlusTree(unittest.TestCase):
+    def test_random_insert_delete_against_model(self):
+        rng = random.Random(21)
+        for fanout in (4, 5, 16):
+            tree = BPlusTree(fanout)
+            model = []
+            for i in range(5_000):
+                key = rng.randrange(400)
+                if rng.random() < 0.6:
+                    tree.insert(key)
+                    model.append(key)
+                else:
+                    tree.delete(key)
+                    if key in model:
+                        model.remove(key)
+                if i % 250 == 0:
+                    self.assertTrue(bplus_ok(tree), (fanout, i))
+            self.assertTrue(bplus_ok(tree))
+            self.assertEqual(list(tree), sorted(model))
+            self.assertEqual(len(tree), len(model))
+            self.assertGreater(tree.split_count, 0)
+            self.assertGreater(tree.merge_count, 0)
+
+    def test_search_returns_leaf(self):
+        tree = BPlusTree.from_sorted(range(0, 200, 2), fanout=4)
+        for key in range(200):
+            leaf = tree.search(key)
+            if key % 2:
+                self.assertIsNone(leaf)
+                self.assertNotIn(key, tree)
+            else:
+                self.assertIn(key, leaf.keys)
+                self.assertIn(key, tree)
+
+    def test_duplicates_across_leaves(self):
+        # Las copias de una clave pueden repartirse entre varias hojas
+        tree = BPlusTree(4)
+        tree.insert_many([1] * 20 + [0, 2])
+        self.assertTrue(bplus_ok(tree))
+        for _ in range(20):
+            self.assertIsNotNone(tree.search(1))
+            tree.delete(1)
+            self.assertTrue(bplus_ok(tree))
+        self.assertIsNone(tree.search(1))
+        self.assertEqual(list(tree), [0, 2])
+
+    def test_range(self):
+        rng = random.Random(22)
+        keys = sorted(rng.randrange(1000) for _ in range(800))
+        tree = BPlusTree.from_sorted(keys, fanout=8)
+        for _ in range(100):
+            lo, hi = sorted(rng.randrange(-10, 1010) for _ in range(2))
+            self.assertEqual(list(tree.range(lo, hi)), [k for k in keys if lo <= k < hi])
+        self.assertEqual(list(tree.range()), keys)
+        self.assertEqual(list(tree.range(hi=50)), [k for k in keys if k < 50])
+        self.assertEqual(list(tree.range(lo=950)), [k for k in keys if k >= 950])
+
+    def test_from_sorted(self):
+        for n in (0, 1, 4, 5, 63, 64, 65, 1000):
+            tree = BPlusTree.from_sorted(reversed(range(n)), fanout=4)
+            self.assertTrue(bplus_ok(tree), n)
+            self.assertEqual(list(tree), list(range(n)))
+        tree = BPlusTree.from_sorted(range(1000), fanout=10)
+        self.assertEqual(tree.height(), 2)   # 100 hojas, 10 internos, raíz
+        tree.delete_many(range(0, 1000, 3))
+        tree.insert_many(range(1000, 1100))
+        self.assertTrue(bplus_ok(tree))
+        self.assertEqual(list(tree), [k for k in range(1100) if k >= 1000 or k % 3])
+
+    def test_shrinks_to_single_leaf(self):
+        tree = BPlusTree.from_sorted(range(500), fanout=4)
+        tree.delete_many(range(500))
+        self.assertEqual((len(tree), tree.height(), list(tree)), (0, 0, []))
+        tree.delete(1)
+        self.assertTrue(bplus_ok(tree))
+
+    def test_fanout_minimum(self):
+        with self.assertRaises(ValueError):
+            BPlusTree(3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# tests/test_delete.py
+
+import random
+import unittest
+from helpers import height, height_bound
+from tree_wavl import WAVLTree
+from utils_wavl import is_valid_wavl
+
+
+class TestDelete(unittest.TestCase):
+    def test_random_insert_delete_against_model(self):
+        rng = random.Random(3)
+        tree = WAVLTree()
+        model = []
+        for i in range(20_000):
+            key = rng.randrange(2000)
+            if rng.random() < 0.55:
+                tree.insert(key)
+                model.append(key)
+            else:
+                tree.delete(key)
+                if key in model:
+                    model.remove(key)
+            if i % 1000 == 0:
+                self.assertTrue(is_valid_wavl(tree.root))
+                self.assertLessEqual(height(tree.root), height_bound(len(model)))
+        self.assertEqual(list(tree), sorted(model))
+
+    def test_delete_missing_key_is_noop(self):
+        tree = WAVLTree.from_sorted(range(10))
+        tree.delete(42)
+        self.assertEqual(list(tree), list(range(10)))
+
+    def test_delete_all(self):
+        rng = random.Random(4)
+        keys = list(range(3000))
+        tree = WAVLTree.from_sorted(keys)
+        rng.shuffle(keys)
+        for i, key in enumerate(keys):
+            tree.delete(key)
+            if i % 300 == 0:
+                self.assertTrue(is_valid_wavl(tree.root))
+                self.assertLessEqual(height(tree.root), height_bound(len(keys) - i - 1))
+        self.assertIsNone(tree.root)
+
+    def test_delete_many(self):
+        tree = WAVLTree.from_sorted(range(1000))
+        tree.delete_many(range(0, 1000, 3))
+        self.assertEqual(list(tree), [k for k in range(1000) if k % 3])
+        self.assertTrue(is_valid_wavl(tree.root))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# tests/test_finger.py
+
+import random
+import unittest
+from helpers import checker_for, sizes_ok
+from avl import AVLTree
+from map_wavl import WAVLMap
+from rbt import RBTree
+from tree_wavl import WAVLTree
+
+TREES = (WAVLTree, AVLTree, RBTree)
+
+
+class TestFinger(unittest.TestCase):
+    def test_local_walk_against_model(self):
+        # Paseo aleatorio de distancia corta, con búsquedas e inserciones
+        for cls in TREES:
+            rng = random.Random(51)
+            tree = cls(order_stats=True)
+            finger = tree.finger()
+            model = []
+            key = 500
+            for _ in range(3000):
+                key = max(0, key + rng.randint(-8, 8))
+                if rng.random() < 0.5:
+                    finger.insert(key)
+                    model.append(key)
+                    self.assertEqual(finger.node.key, key)
+                else:
+                    found = finger.search(key)
+                    self.assertEqual(found is not None, key in model)
+                    if found is not None:
+                        self.assertEqual(found.key, key)
+            self.assertEqual(list(tree), sorted(model))
+            self.assertTrue(checker_for(tree)(tree.root), cls.__name__)
+            self.assertTrue(sizes_ok(tree.root))
+
+    def test_edges_and_empty_tree(self):
+        for cls in TREES:
+            tree = cls()
+            finger = tree.finger(7)
+            self.assertIsNone(finger.search(7))
+            # Serie de tiempo: claves crecientes al final, y algunas al principio
+            for key in range(100):
+                finger.insert(key)
+            for key in range(-1, -20, -1):
+                finger.insert(key)
+            self.assertEqual(list(tree), list(range(-19, 100)))
+            self.assertTrue(checker_for(tree)(tree.root))
+            self.assertEqual(finger.search(99).key, 99)
+            self.assertEqual(finger.search(-19).key, -19)
+
+    def test_stale_finger_restarts_from_root(self):
+        for cls in TREES:
+            tree = cls.from_sorted(range(200))
+            finger = tree.finger(150)
+            self.assertEqual(finger.node.key, 150)
+            # Cambios por otro camino: el nodo recordado sale del árbol
+            tree.delete(150)
+            tree.delete_many(range(100, 200, 2))
+            tree.insert(1000)
+            self.assertIsNone(finger.search(150))
+            self.assertEqual(finger.search(151).key, 151)
+            self.assertEqual(finger.search(1000).key, 1000)
+            finger.insert(150)
+            self.assertEqual(finger.search(150).key, 150)
+            self.assertTrue(checker_for(tree)(tree.root))
+
+    def test_map_upsert(self):
+        tree = WAVLMap()
+        tree.insert_many((k, str(k)) for k in range(0, 100, 2))
+        finger = tree.finger(50)
+        finger.insert(51)
+        finger.insert(50)      # ya existe: conserva el valor
+        self.assertEqual(len(tree), 51)
+        self.assertEqual((tree[50], tree[51]), ("50", None))
+        self.assertEqual(finger.search(52).value, "52")
+        self.assertTrue(checker_for(tree)(tree.root))
+
+
+if __name__ == "__main__":
+    unittest.main()
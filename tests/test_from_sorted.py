@@ -0,0 +1,53 @@
+# tests/test_from_sorted.py
+
+import random
+import unittest
+from helpers import checker_for, height, height_bound, sizes_ok
+from tree_wavl import WAVLTree
+from avl import AVLTree
+from rbt import RBTree
+
+TREES = (WAVLTree, AVLTree, RBTree)
+
+
+class TestFromSorted(unittest.TestCase):
+    def test_every_size_is_balanced(self):
+        for cls in TREES:
+            for n in range(0, 70):
+                tree = cls.from_sorted(range(n), order_stats=True)
+                self.assertEqual(list(tree), list(range(n)))
+                self.assertTrue(checker_for(tree)(tree.root), f"{cls.__name__} n={n}")
+                self.assertTrue(sizes_ok(tree.root))
+                # Perfectamente balanceado: altura floor(log2 n)
+                self.assertEqual(height(tree.root), n.bit_length() - 1)
+
+    def test_unsorted_input_with_duplicates(self):
+        rng = random.Random(16)
+        keys = [rng.randrange(50) for _ in range(300)]
+        for cls in TREES:
+            tree = cls.from_sorted(keys)
+            self.assertEqual(list(tree), sorted(keys))
+            self.assertTrue(checker_for(tree)(tree.root))
+
+    def test_mutations_after_bulk_load(self):
+        rng = random.Random(17)
+        for cls in TREES:
+            tree = cls.from_sorted(range(0, 2000, 2), order_stats=True)
+            model = list(range(0, 2000, 2))
+            for _ in range(2000):
+                key = rng.randrange(2000)
+                if rng.random() < 0.5:
+                    tree.insert(key)
+                    model.append(key)
+                else:
+                    tree.delete(key)
+                    if key in model:
+                        model.remove(key)
+            self.assertEqual(list(tree), sorted(model))
+            self.assertTrue(checker_for(tree)(tree.root))
+            self.assertTrue(sizes_ok(tree.root))
+            self.assertLessEqual(height(tree.root), height_bound(len(model)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# tests/test_frozen_view.py
+
+import bisect
+import random
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from avl import AVLTree
+from frozen_view import FrozenView, eytzinger_layout
+from rbt import RBTree
+from tree_wavl import WAVLTree
+
+
+class TestFrozenView(unittest.TestCase):
+    def test_eytzinger_layout(self):
+        self.assertEqual(eytzinger_layout([]), [None])
+        self.assertEqual(eytzinger_layout([1, 2, 3, 4, 5, 6, 7]), [None, 4, 2, 6, 1, 3, 5, 7])
+        for n in range(1, 70):
+            layout = eytzinger_layout(list(range(n)))
+            # In-order del árbol implícito = claves ordenadas
+            for k in range(1, n + 1):
+                if 2 * k <= n:
+                    self.assertLess(layout[2 * k], layout[k])
+                if 2 * k + 1 <= n:
+                    self.assertGreater(layout[2 * k + 1], layout[k])
+
+    def test_queries_match_sorted_list(self):
+        rng = random.Random(41)
+        for n in (0, 1, 2, 7, 8, 100, 513):
+            keys = sorted(rng.randrange(3 * n + 1) for _ in range(n))
+            for eytzinger in (False, True):
+                view = FrozenView(keys, eytzinger)
+                self.assertEqual(view.eytzinger, eytzinger)
+                self.assertEqual((len(view), list(view), list(reversed(view))),
+                                 (n, keys, keys[::-1]))
+                for q in range(-2, 3 * n + 3):
+                    self.assertEqual(view.search(q), q in keys, (n, eytzinger, q))
+                    self.assertEqual(q in view, q in keys)
+                    lower = [k for k in keys if k <= q]
+                    upper = [k for k in keys if k >= q]
+                    self.assertEqual(view.floor(q), lower[-1] if lower else None)
+                    self.assertEqual(view.ceiling(q), upper[0] if upper else None)
+                    self.assertEqual(view.rank(q), bisect.bisect_left(keys, q))
+                lo, hi = n // 3, 2 * n
+                self.assertEqual(list(view.range(lo, hi)), [k for k in keys if lo <= k < hi])
+                self.assertEqual(view.count_range(lo, hi), len([k for k in keys if lo <= k < hi]))
+                self.assertEqual(list(view.range()), keys)
+                self.assertEqual(view.count_range(hi, lo), 0)
+
+    def test_select(self):
+        view = FrozenView([2, 4, 6])
+        self.assertEqual([view.select(i) for i in (0, 2, -1, -3)], [2, 6, 6, 2])
+        for i in (3, -4):
+            with self.assertRaises(IndexError):
+                view.select(i)
+
+    def test_freeze_cache(self):
+        for cls in (WAVLTree, AVLTree, RBTree):
+            tree = cls()
+            for key in (5, 1, 9, 1):
+                tree.insert(key)
+            view = tree.freeze()
+            self.assertEqual(list(view), [1, 1, 5, 9])
+            self.assertIs(tree.freeze(), view)
+            # Con eytzinger reutiliza las claves y se cachea la vista con layout
+            fast = tree.freeze(eytzinger=True)
+            self.assertTrue(fast.eytzinger)
+            self.assertIs(fast._keys, view._keys)
+            self.assertIs(tree.freeze(), fast)
+            # Una mutación invalida el caché; la vista vieja no cambia
+            tree.insert(3)
+            fresh = tree.freeze()
+            self.assertIsNot(fresh, fast)
+            self.assertEqual(list(fresh), [1, 1, 3, 5, 9])
+            self.assertEqual(list(fast), [1, 1, 5, 9])
+            tree.delete(9)
+            self.assertEqual(list(tree.freeze()), [1, 1, 3, 5])
+            tree.delete(100)    # no existe
+            self.assertIn(5, tree.freeze(eytzinger=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+# tests/test_insert.py
+
+import random
+import unittest
+from helpers import height, height_bound
+from tree_wavl import WAVLTree
+from utils_wavl import is_valid_wavl
+
+
+class TestInsert(unittest.TestCase):
+    def assertBalanced(self, tree, n):
+        self.assertTrue(is_valid_wavl(tree.root))
+        self.assertLessEqual(height(tree.root), height_bound(n))
+
+    def test_random_inserts_keep_rank_rules(self):
+        rng = random.Random(1)
+        tree = WAVLTree()
+        keys = rng.sample(range(100_000), 3000)
+        for i, key in enumerate(keys, 1):
+            tree.insert(key)
+            if i % 250 == 0:
+                self.assertBalanced(tree, i)
+        self.assertEqual(list(tree), sorted(keys))
+
+    def test_sequential_inserts_rotate(self):
+        # Regresión: _fix_insert solo promovía y el árbol se volvía una lista
+        tree = WAVLTree()
+        for key in range(5000):
+            tree.insert(key)
+        self.assertBalanced(tree, 5000)
+        self.assertGreater(tree.rotation_count, 0)
+
+    def test_duplicates(self):
+        tree = WAVLTree()
+        for key in [5, 3, 5, 5, 1, 3]:
+            tree.insert(key)
+        self.assertEqual(list(tree), [1, 3, 3, 5, 5, 5])
+        self.assertTrue(is_valid_wavl(tree.root))
+
+    def test_insert_many_and_from_sorted(self):
+        rng = random.Random(2)
+        keys = [rng.randrange(10_000) for _ in range(2000)]
+        tree = WAVLTree.from_sorted(keys[:1000])
+        tree.insert_many(keys[1000:])
+        self.assertEqual(list(tree), sorted(keys))
+        self.assertBalanced(tree, len(keys))
+
+
+if __name__ == "__main__":
+    unittest.main()
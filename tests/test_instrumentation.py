@@ -0,0 +1,116 @@
+# tests/test_instrumentation.py
+
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from instrumentation import Instrumentation, LogHistogram
+from search_cache import SearchCache
+from tree_wavl import WAVLTree
+from avl import AVLTree
+from array_wavl import ArrayWAVLTree
+
+
+class TestLogHistogram(unittest.TestCase):
+    def test_small_values_are_exact(self):
+        hist = LogHistogram()
+        for value in range(1, 11):
+            hist.record(value)
+        self.assertEqual(hist.percentile(50), 5)
+        self.assertEqual(hist.percentile(100), 10)
+        self.assertEqual(hist.mean(), 5.5)
+
+    def test_relative_error(self):
+        hist = LogHistogram(sub_bucket_bits=4)
+        for value in range(1, 100_001):
+            hist.record(value)
+        for q in (50, 90, 99):
+            exact = q * 1000
+            self.assertLessEqual(abs(hist.percentile(q) - exact) / exact, 1 / 16)
+
+    def test_merge(self):
+        a, b = LogHistogram(), LogHistogram()
+        a.record(3)
+        b.record(1000)
+        a.merge(b)
+        self.assertEqual((a.total, a.min, a.max), (2, 3, 1000))
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_counts_each_call(self):
+        for cls in (WAVLTree, AVLTree, ArrayWAVLTree):
+            tree = cls()
+            with Instrumentation(tree) as inst:
+                for key in range(100):
+                    tree.insert(key)
+                tree.search(5)
+            report = inst.report()
+            self.assertEqual(report["insert"]["latency"]["count"], 100)
+            self.assertEqual(report["search"]["latency"]["count"], 1)
+            self.assertGreater(report["insert"]["rotations"]["max"], 0)
+
+    def test_disable_restores_class_methods(self):
+        tree = WAVLTree()
+        inst = Instrumentation(tree)
+        inst.enable()
+        inst.disable()
+        for op in Instrumentation.OPERATIONS:
+            self.assertNotIn(op, tree.__dict__)
+        tree.insert(1)
+        self.assertEqual(inst.latency["insert"].total, 0)
+
+
+class TestWrapperComposition(unittest.TestCase):
+    OPS = ("search", "insert", "delete", "_insert_from", "_remove_node")
+
+    def assertClean(self, tree):
+        for op in self.OPS:
+            self.assertNotIn(op, tree.__dict__)
+
+    def test_every_enable_disable_order(self):
+        for first_cache in (False, True):
+            for disable_first_enabled in (False, True):
+                tree = WAVLTree.from_sorted(range(100))
+                inst = Instrumentation(tree)
+                cache = SearchCache(tree, size=16)
+                a, b = (cache, inst) if first_cache else (inst, cache)
+                a.enable()
+                b.enable()
+                tree.search(5)
+                tree.search(5)
+                # Con la caché arriba, el acierto no llega a la instrumentación
+                self.assertEqual(inst.latency["search"].total, 2 if first_cache else 1)
+                self.assertEqual(cache.hits, 1)
+                (a if disable_first_enabled else b).disable()
+                (b if disable_first_enabled else a).disable()
+                self.assertClean(tree)
+
+    def test_stale_lower_wrapper_passes_through(self):
+        # Con A debajo de B: desactivar A deja un envoltorio muerto que no mide
+        tree = WAVLTree.from_sorted(range(10))
+        inst = Instrumentation(tree)
+        cache = SearchCache(tree)
+        inst.enable()
+        cache.enable()
+        inst.disable()
+        tree.search(3)
+        self.assertEqual(inst.latency["search"].total, 0)
+        self.assertEqual(cache.misses, 1)
+        cache.disable()
+        self.assertNotIn("search", tree.__dict__)
+
+    def test_reenable_after_out_of_order_disable(self):
+        tree = WAVLTree.from_sorted(range(10))
+        inst = Instrumentation(tree)
+        cache = SearchCache(tree)
+        inst.enable()
+        cache.enable()
+        inst.disable()
+        inst.enable()
+        cache.disable()
+        tree.search(1)
+        self.assertEqual(inst.latency["search"].total, 1)
+        inst.disable()
+        self.assertClean(tree)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# tests/test_map_wavl.py
+
+import random
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from map_wavl import WAVLMap
+from utils_wavl import is_valid_wavl
+
+
+class TestWAVLMap(unittest.TestCase):
+    def test_against_dict(self):
+        rng = random.Random(22)
+        wmap, model = WAVLMap(order_stats=True), {}
+        for _ in range(5000):
+            key = rng.randrange(300)
+            op = rng.random()
+            if op < 0.5:
+                wmap[key] = model[key] = rng.random()
+            elif op < 0.7:
+                self.assertEqual(wmap.pop(key, None), model.pop(key, None))
+            else:
+                self.assertEqual(wmap.get(key), model.get(key))
+        self.assertEqual(list(wmap.items()), sorted(model.items()))
+        self.assertEqual(len(wmap), len(model))
+        self.assertTrue(is_valid_wavl(wmap.root))
+        self.assertEqual(wmap.select(0), min(model))
+
+    def test_upsert_keeps_one_node(self):
+        wmap = WAVLMap()
+        wmap[1] = "a"
+        wmap.insert(1, "b")
+        self.assertEqual(len(wmap), 1)
+        self.assertEqual(wmap[1], "b")
+        self.assertEqual(wmap.setdefault(1, "c"), "b")
+        self.assertEqual(wmap.setdefault(2, "c"), "c")
+
+    def test_missing_keys(self):
+        wmap = WAVLMap.from_sorted([(1, "a")])
+        with self.assertRaises(KeyError):
+            wmap[2]
+        with self.assertRaises(KeyError):
+            del wmap[2]
+        self.assertNotIn(2, wmap)
+        self.assertEqual(wmap.pop(2, "x"), "x")
+
+    def test_hit_path_after_two_child_delete(self):
+        # El último nodo recordado hereda otra clave al borrar su predecesor
+        wmap = WAVLMap.from_sorted((k, str(k)) for k in range(15))
+        root_key = wmap.root.key
+        self.assertEqual(wmap.get(root_key + 1), str(root_key + 1))
+        del wmap[root_key]
+        self.assertIsNone(wmap.get(root_key))
+        self.assertEqual(wmap.get(root_key + 1), str(root_key + 1))
+
+    def test_from_sorted_and_insert_many_last_value_wins(self):
+        wmap = WAVLMap.from_sorted([(2, "a"), (1, "b"), (2, "c")])
+        self.assertEqual(list(wmap.items()), [(1, "b"), (2, "c")])
+        wmap.insert_many([(3, "d"), (1, "e")])
+        self.assertEqual(dict(wmap.items()), {1: "e", 2: "c", 3: "d"})
+        self.assertEqual(len(wmap), 3)
+
+    def test_split_lengths(self):
+        for order_stats in (False, True):
+            wmap = WAVLMap.from_sorted(((k, k) for k in range(10)), order_stats=order_stats)
+            left, right = wmap.split(4)
+            self.assertEqual((len(left), len(right), len(wmap)), (4, 5, 0))
+            self.assertEqual(list(right.values()), [5, 6, 7, 8, 9])
+
+
+if __name__ == "__main__":
+    unittest.main()
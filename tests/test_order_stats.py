@@ -0,0 +1,58 @@
+# tests/test_order_stats.py
+
+import bisect
+import random
+import unittest
+from helpers import sizes_ok
+from tree_wavl import WAVLTree
+from avl import AVLTree
+from rbt import RBTree
+
+
+class TestOrderStats(unittest.TestCase):
+    def check(self, cls):
+        rng = random.Random(8)
+        tree = cls(order_stats=True)
+        model = []
+        for i in range(6000):
+            key = rng.randrange(1000)
+            if rng.random() < 0.6:
+                tree.insert(key)
+                bisect.insort(model, key)
+            else:
+                tree.delete(key)
+                j = bisect.bisect_left(model, key)
+                if j < len(model) and model[j] == key:
+                    del model[j]
+            if i % 500 == 0:
+                self.assertTrue(sizes_ok(tree.root))
+                for j in range(0, len(model), 37):
+                    self.assertEqual(tree.select(j), model[j])
+                for q in range(0, 1000, 71):
+                    self.assertEqual(tree.rank(q), bisect.bisect_left(model, q))
+                    self.assertEqual(tree.count_range(q, q + 50),
+                                     bisect.bisect_left(model, q + 50) - bisect.bisect_left(model, q))
+        self.assertEqual(tree.count_range(), len(model))
+
+    def test_wavl(self):
+        self.check(WAVLTree)
+
+    def test_avl(self):
+        self.check(AVLTree)
+
+    def test_rbt(self):
+        self.check(RBTree)
+
+    def test_select_out_of_range(self):
+        tree = WAVLTree.from_sorted(range(5), order_stats=True)
+        self.assertEqual(tree.select(-1), 4)
+        with self.assertRaises(IndexError):
+            tree.select(5)
+
+    def test_requires_order_stats(self):
+        with self.assertRaises(RuntimeError):
+            WAVLTree().select(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# tests/test_persistent.py
+
+import random
+import unittest
+from helpers import height, height_bound, sizes_ok
+from persistent_wavl import PersistentWAVLTree
+from utils_wavl import is_valid_wavl
+
+
+class TestPersistent(unittest.TestCase):
+    def test_random_versions_stay_valid(self):
+        rng = random.Random(7)
+        tree = PersistentWAVLTree()
+        versions = [(tree, [])]
+        model = []
+        for i in range(4000):
+            key = rng.randrange(1500)
+            if rng.random() < 0.6:
+                tree = tree.insert(key)
+                model.append(key)
+            else:
+                tree = tree.delete(key)
+                if key in model:
+                    model.remove(key)
+            if i % 400 == 0:
+                versions.append((tree, sorted(model)))
+                self.assertTrue(is_valid_wavl(tree.root, check_parents=False))
+                self.assertLessEqual(height(tree.root), height_bound(len(model)))
+                self.assertTrue(sizes_ok(tree.root))
+        # Las versiones viejas no cambian con las escrituras posteriores
+        for version, keys in versions:
+            self.assertEqual(list(version), keys)
+            self.assertEqual(len(version), len(keys))
+
+    def test_insert_does_not_mutate_previous_version(self):
+        base = PersistentWAVLTree.from_sorted(range(100))
+        newer = base.insert(1000).delete(50)
+        self.assertIn(50, base)
+        self.assertNotIn(1000, base)
+        self.assertEqual(len(base), 100)
+        self.assertNotIn(50, newer)
+        self.assertIn(1000, newer)
+
+
+if __name__ == "__main__":
+    unittest.main()
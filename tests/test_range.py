@@ -0,0 +1,66 @@
+# tests/test_range.py
+
+import bisect
+import random
+import types
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from tree_wavl import WAVLTree
+from avl import AVLTree
+from rbt import RBTree
+
+TREES = (WAVLTree, AVLTree, RBTree)
+
+
+class TestRange(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(20)
+        self.keys = sorted(rng.randrange(1000) for _ in range(400))
+
+    def test_iteration_order(self):
+        for cls in TREES:
+            tree = cls.from_sorted(self.keys)
+            self.assertEqual(list(tree), self.keys)
+            self.assertEqual(list(reversed(tree)), self.keys[::-1])
+
+    def test_range_against_bisect(self):
+        rng = random.Random(21)
+        for cls in TREES:
+            tree = cls.from_sorted(self.keys)
+            for _ in range(200):
+                lo, hi = sorted(rng.randrange(-10, 1010) for _ in range(2))
+                expected = self.keys[bisect.bisect_left(self.keys, lo):bisect.bisect_left(self.keys, hi)]
+                self.assertEqual(list(tree.range(lo, hi)), expected)
+            self.assertEqual(list(tree.range()), self.keys)
+            self.assertEqual(list(tree.range(hi=self.keys[3])), self.keys[:bisect.bisect_left(self.keys, self.keys[3])])
+
+    def test_neighbours_against_bisect(self):
+        keys = self.keys
+        for cls in TREES:
+            tree = cls.from_sorted(keys)
+            for q in range(-5, 1005, 7):
+                i = bisect.bisect_right(keys, q)
+                j = bisect.bisect_left(keys, q)
+                self.assertEqual(tree.floor(q), keys[i - 1] if i else None)
+                self.assertEqual(tree.ceiling(q), keys[j] if j < len(keys) else None)
+                self.assertEqual(tree.predecessor(q), keys[j - 1] if j else None)
+                self.assertEqual(tree.successor(q), keys[i] if i < len(keys) else None)
+
+    def test_range_is_lazy(self):
+        for cls in TREES:
+            tree = cls.from_sorted(range(10**5))
+            it = tree.range(10, None)
+            self.assertIsInstance(it, types.GeneratorType)
+            self.assertEqual([next(it) for _ in range(3)], [10, 11, 12])
+
+    def test_empty_tree(self):
+        for cls in TREES:
+            tree = cls()
+            self.assertEqual(list(tree), [])
+            self.assertEqual(list(tree.range(0, 10)), [])
+            self.assertIsNone(tree.floor(1))
+            self.assertIsNone(tree.successor(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+# tests/test_search.py
+
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from tree_wavl import WAVLTree
+
+
+class TestSearch(unittest.TestCase):
+    def setUp(self):
+        self.tree = WAVLTree.from_sorted(range(0, 200, 2))
+
+    def test_existing_keys(self):
+        for key in range(0, 200, 2):
+            node = self.tree.search(key)
+            self.assertIsNotNone(node)
+            self.assertEqual(node.key, key)
+
+    def test_missing_keys(self):
+        for key in (-1, 1, 99, 200, 1000):
+            self.assertIsNone(self.tree.search(key))
+
+    def test_empty_tree(self):
+        self.assertIsNone(WAVLTree().search(1))
+
+    def test_floor_ceiling_range(self):
+        self.assertEqual(self.tree.floor(7), 6)
+        self.assertEqual(self.tree.ceiling(7), 8)
+        self.assertIsNone(self.tree.floor(-1))
+        self.assertEqual(list(self.tree.range(10, 20)), [10, 12, 14, 16, 18])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# tests/test_search_cache.py
+
+import random
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from search_cache import SearchCache
+from tree_wavl import WAVLTree
+from avl import AVLTree
+from rbt import RBTree
+from map_wavl import WAVLMap
+
+
+def found_key(node):
+    return None if node is None else node.key
+
+
+class TestSearchCache(unittest.TestCase):
+    def test_hits_and_misses(self):
+        for policy in ("lru", "clock"):
+            tree = WAVLTree.from_sorted(range(100))
+            with SearchCache(tree, size=8, policy=policy) as cache:
+                for _ in range(3):
+                    tree.search(7)
+                tree.search(1000)
+            self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_eviction_keeps_capacity(self):
+        for policy in ("lru", "clock"):
+            tree = WAVLTree.from_sorted(range(100))
+            with SearchCache(tree, size=4, policy=policy) as cache:
+                for key in range(50):
+                    tree.search(key)
+                self.assertEqual(len(cache.entries), 4)
+                self.assertEqual(cache.entries.evictions, 46)
+
+    def test_two_child_delete_invalidates_successor(self):
+        # El nodo borrado hereda la clave del sucesor y el nodo del sucesor sale
+        for cls in (WAVLTree, AVLTree, RBTree):
+            tree = cls.from_sorted(range(31))
+            root_key = tree.root.key
+            succ_key = root_key + 1
+            with SearchCache(tree) as cache:
+                stale = tree.search(succ_key)
+                tree.delete(root_key)
+                node = tree.search(succ_key)
+                # delete busca (y cachea) root_key: se descartan las dos claves
+                self.assertEqual(cache.invalidations, 2)
+            self.assertIsNot(node, stale)
+            self.assertIs(node, tree.search(succ_key))
+            self.assertIsNone(tree.search(root_key))
+
+    def test_missing_key_cached_then_inserted(self):
+        tree = WAVLTree.from_sorted(range(0, 20, 2))
+        with SearchCache(tree):
+            self.assertIsNone(tree.search(5))
+            tree.insert(5)
+            self.assertEqual(found_key(tree.search(5)), 5)
+
+    def test_batch_ops_invalidate(self):
+        tree = WAVLTree.from_sorted(range(0, 200, 2))
+        with SearchCache(tree) as cache:
+            for key in range(200):
+                tree.search(key)
+            tree.insert_many(range(1, 200, 4))
+            tree.delete_many(range(0, 200, 8))
+            for key in range(200):
+                expected = None if (key % 8 == 0 or key % 4 == 3) else key
+                self.assertEqual(found_key(tree.search(key)), expected)
+            self.assertEqual(cache.flushes, 0)
+
+    def test_random_ops_match_uncached_tree(self):
+        rng = random.Random(14)
+        tree, plain = WAVLTree(), WAVLTree()
+        with SearchCache(tree, size=32, policy="clock"):
+            for _ in range(5000):
+                key = rng.randrange(100)
+                op = rng.random()
+                if op < 0.3:
+                    tree.insert(key)
+                    plain.insert(key)
+                elif op < 0.5:
+                    tree.delete(key)
+                    plain.delete(key)
+                else:
+                    self.assertEqual(found_key(tree.search(key)), found_key(plain.search(key)))
+
+    def test_version_flush_on_split(self):
+        tree = WAVLTree.from_sorted(range(50))
+        with SearchCache(tree) as cache:
+            self.assertEqual(found_key(tree.search(10)), 10)
+            # split no pasa por los hooks: self queda vacío y sube _version
+            tree.split(25)
+            self.assertIsNone(tree.search(10))
+            self.assertEqual(cache.flushes, 1)
+
+    def test_map_upsert(self):
+        wmap = WAVLMap()
+        with SearchCache(wmap):
+            self.assertIsNone(wmap.search(3))
+            wmap[3] = "a"
+            self.assertEqual(wmap.search(3).value, "a")
+
+    def test_disable_restores_class_methods(self):
+        tree = WAVLTree.from_sorted(range(10))
+        cache = SearchCache(tree)
+        cache.enable()
+        cache.disable()
+        self.assertEqual(tree.__dict__.keys() & {"search", "insert", "_insert_from", "_remove_node"}, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# tests/test_search_many.py
+
+import random
+import unittest
+from unittest import mock
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+import utils_bst
+from avl import AVLTree
+from rbt import RBTree
+from tree_wavl import WAVLTree
+
+TREES = (WAVLTree, AVLTree, RBTree)
+
+
+class TestSearchMany(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(31)
+        self.keys = [rng.randrange(2000) for _ in range(1000)]
+        self.queries = [rng.randrange(-10, 2010) for _ in range(600)]
+
+    def build(self, cls):
+        tree = cls()
+        for key in self.keys:
+            tree.insert(key)
+        return tree
+
+    def expected_index(self, key):
+        flat = sorted(self.keys)
+        return flat.index(key) if key in flat else -1
+
+    def check(self, tree):
+        present = set(self.keys)
+        self.assertEqual(list(tree.search_many(self.queries)), [q in present for q in self.queries])
+        # return_index: posición de la primera ocurrencia en sorted_keys()
+        self.assertEqual(list(tree.search_many(self.queries, return_index=True)),
+                         [self.expected_index(q) for q in self.queries])
+        self.assertEqual(list(tree.sorted_keys()), sorted(self.keys))
+
+    def test_matches_search(self):
+        for cls in TREES:
+            self.check(self.build(cls))
+
+    def test_without_numpy(self):
+        with mock.patch.object(utils_bst, "np", None):
+            for cls in TREES:
+                tree = self.build(cls)
+                self.check(tree)
+                self.assertIsInstance(tree.search_many([1, 2]), list)
+
+    def test_small_batch_does_not_flatten(self):
+        for cls in TREES:
+            tree = self.build(cls)
+            present = set(self.keys)
+            small = self.queries[:10]
+            self.assertEqual(list(tree.search_many(small)), [q in present for q in small])
+            self.assertIsNone(tree._keys_cache)
+
+    def test_cache_follows_mutations(self):
+        for cls in TREES:
+            tree = self.build(cls)
+            tree.sorted_keys()
+            missing = next(k for k in range(2000) if k not in set(self.keys))
+            self.assertFalse(tree.search_many([missing])[0])
+            tree.insert(missing)
+            self.assertTrue(tree.search_many([missing])[0])
+            tree.delete(missing)
+            self.assertFalse(tree.search_many([missing])[0])
+            self.assertEqual(list(tree.sorted_keys()), sorted(self.keys))
+
+    def test_empty_tree(self):
+        for cls in TREES:
+            tree = cls()
+            self.assertEqual(list(tree.search_many(range(300))), [False] * 300)
+            self.assertEqual(list(tree.search_many([1, 2], return_index=True)), [-1, -1])
+            with mock.patch.object(utils_bst, "np", None):
+                self.assertEqual(tree.search_many([1], return_index=True), [-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
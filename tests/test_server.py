@@ -0,0 +1,81 @@
+# tests/test_server.py
+
+import asyncio
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+import server_wavl as srv
+from server_wavl import WAVLClient, WAVLServer, decode_frames, encode_frame
+
+
+class TestFrames(unittest.TestCase):
+    def test_round_trip_and_partial_frame(self):
+        data = encode_frame(srv.OP_INSERT, 1, [1, -2, 2 ** 62]) + encode_frame(srv.OP_SEARCH, 2, [7])
+        frames, consumed = decode_frames(data[:-3])
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(frames[0][:3], (srv.OP_INSERT, 0, 1))
+        self.assertEqual(frames[0][3].tolist(), [1, -2, 2 ** 62])
+        frames, consumed = decode_frames(data)
+        self.assertEqual((len(frames), consumed), (2, len(data)))
+
+    def test_oversized_frame_is_skipped_whole(self):
+        # n sin signo: 0xFFFFFFFF no puede volverse negativo
+        header = srv._HEADER.pack(srv.OP_SEARCH, 0, 9, 0xFFFFFFFF)
+        frames, consumed = decode_frames(header, max_keys=srv.MAX_FRAME_KEYS)
+        self.assertEqual(frames, [(srv.OP_SEARCH, 0, 9, None)])
+        self.assertEqual(consumed, len(header) + 8 * 0xFFFFFFFF)
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = WAVLServer()
+        await self.server.start(port=0)
+        self.host, self.port = self.server.address[:2]
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_pipelined_requests(self):
+        async with await WAVLClient.connect(self.host, self.port) as client:
+            await asyncio.gather(*(client.insert(k) for k in range(100)))
+            found = await asyncio.gather(*(client.search(k) for k in range(95, 105)))
+            self.assertEqual(found, [True] * 5 + [False] * 5)
+            await client.delete_many(range(0, 100, 2))
+            self.assertEqual(await client.range(10, 20), [11, 13, 15, 17, 19])
+            self.assertEqual(await client.range(hi=4), [1, 3])
+            self.assertEqual(len(await client.range()), 50)
+        self.assertGreater(self.server.batched_writes, self.server.batches)
+
+    async def test_writes_visible_to_later_reads(self):
+        async with await WAVLClient.connect(self.host, self.port) as client:
+            # gather envía el INSERT antes que el SEARCH en la misma lectura
+            _, found = await asyncio.gather(client.insert(42), client.search(42))
+            self.assertTrue(found)
+
+    async def test_errors_keep_connection_usable(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        big = srv.MAX_FRAME_KEYS + 1
+        writer.write(srv._HEADER.pack(srv.OP_INSERT, 0, 1, big))
+        writer.write(b"\0" * (8 * big))
+        writer.write(encode_frame(99, 2, [1]))
+        writer.write(encode_frame(srv.OP_INSERT, 3, [5]))
+        writer.write(encode_frame(srv.OP_SEARCH, 4, [5]))
+        await writer.drain()
+        replies, buffer = [], bytearray()
+        while len(replies) < 4:
+            buffer += await reader.read(1 << 16)
+            frames, consumed = decode_frames(buffer)
+            del buffer[:consumed]
+            replies += [(status, req_id) for status, _, req_id, _ in frames]
+        self.assertEqual(sorted(replies, key=lambda r: r[1]),
+                         [(srv.ST_ERROR, 1), (srv.ST_ERROR, 2), (srv.ST_OK, 3), (srv.ST_OK, 4)])
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_client_raises_on_error(self):
+        async with await WAVLClient.connect(self.host, self.port) as client:
+            with self.assertRaises(ValueError):
+                await client._request(srv.OP_SEARCH, (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# tests/test_sharded.py
+
+import bisect
+import random
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from sharded_wavl import ShardedWAVL
+
+
+class TestShardedWAVL(unittest.TestCase):
+    def make(self, **kwargs):
+        kwargs.setdefault("processes", 3)
+        kwargs.setdefault("key_range", (0, 3000))
+        sharded = ShardedWAVL(**kwargs)
+        self.addCleanup(sharded.close)
+        return sharded
+
+    def test_against_model(self):
+        rng = random.Random(23)
+        sharded = self.make(batch_size=64)
+        model = []
+        for _ in range(3000):
+            key = rng.randrange(3000)
+            if rng.random() < 0.6:
+                sharded.insert(key)
+                bisect.insort(model, key)
+            else:
+                sharded.delete(key)
+                i = bisect.bisect_left(model, key)
+                if i < len(model) and model[i] == key:
+                    del model[i]
+        self.assertEqual(sharded.range(), model)
+        self.assertEqual(len(sharded), len(model))
+        probes = list(range(0, 3000, 7))
+        self.assertEqual(sharded.search_many(probes), [k in model for k in probes])
+
+    def test_pending_writes_keep_call_order(self):
+        sharded = self.make(batch_size=1000)
+        sharded.insert(5)
+        sharded.delete(5)
+        sharded.delete(6)
+        sharded.insert(6)
+        self.assertEqual(sharded.range(), [6])
+
+    def test_insert_many_after_pending_delete(self):
+        # Regresión: insert_many enviaba el lote antes de la eliminación pendiente
+        sharded = self.make(batch_size=1000)
+        sharded.insert_many([1, 2])
+        sharded.delete(1)
+        sharded.insert_many([1])
+        self.assertEqual(sharded.range(), [1, 2])
+
+    def test_range_across_shards(self):
+        sharded = self.make()
+        sharded.insert_many(range(0, 3000, 10))
+        self.assertEqual(sharded.range(950, 2050), list(range(950, 2050, 10)))
+        self.assertEqual(sharded.range(hi=30), [0, 10, 20])
+        self.assertIn(1500, sharded)
+        self.assertNotIn(1505, sharded)
+
+    def test_rebalance_moves_boundaries(self):
+        sharded = self.make(min_rebalance=100)
+        keys = list(range(0, 500))            # todo cae en el primer shard
+        sharded.insert_many(keys)
+        self.assertGreater(sharded.rebalance_count, 0)
+        self.assertLessEqual(max(sharded.sizes), sharded.imbalance * len(keys) / 3)
+        self.assertEqual(sharded.range(), keys)
+        self.assertEqual(sharded.boundaries, sorted(sharded.boundaries))
+
+    def test_bad_boundaries(self):
+        with self.assertRaises(ValueError):
+            ShardedWAVL(processes=3, boundaries=[10])
+
+
+if __name__ == "__main__":
+    unittest.main()
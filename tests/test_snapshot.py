@@ -0,0 +1,73 @@
+# tests/test_snapshot.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from tree_wavl import WAVLTree
+from map_wavl import WAVLMap
+from snapshot import SnapshotView
+from utils_wavl import is_valid_wavl
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "tree.wvl")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        rng = random.Random(15)
+        keys = sorted(rng.randrange(-10**12, 10**12) for _ in range(5000))
+        tree = WAVLTree.from_sorted(keys, order_stats=True)
+        self.assertEqual(tree.save(self.path), len(keys))
+        loaded = WAVLTree.load(self.path, mmap=False)
+        self.assertEqual(list(loaded), keys)
+        self.assertTrue(loaded.order_stats)
+        self.assertTrue(is_valid_wavl(loaded.root))
+
+    def test_mmap_view_queries_before_inflate(self):
+        keys = list(range(0, 1000, 3))
+        WAVLTree.from_sorted(keys).save(self.path)
+        with WAVLTree.load(self.path) as view:
+            self.assertIsInstance(view, SnapshotView)
+            self.assertEqual(len(view), len(keys))
+            self.assertIn(300, view)
+            self.assertNotIn(301, view)
+            self.assertEqual((view.floor(301), view.ceiling(301)), (300, 303))
+            self.assertEqual(list(view.range(10, 20)), [12, 15, 18])
+            self.assertEqual((view.select(-1), view.rank(10)), (999, 4))
+            tree = view.inflate()
+        self.assertEqual(list(tree), keys)
+
+    def test_empty_tree(self):
+        WAVLTree().save(self.path)
+        with WAVLTree.load(self.path) as view:
+            self.assertEqual(len(view), 0)
+            self.assertIsNone(view.floor(1))
+        self.assertIsNone(WAVLTree.load(self.path, mmap=False).root)
+
+    def test_rejects_non_integer_keys(self):
+        with self.assertRaises(ValueError):
+            WAVLTree.from_sorted(["a", "b"]).save(self.path)
+
+    def test_bad_magic(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 32)
+        with self.assertRaises(ValueError):
+            WAVLTree.load(self.path, mmap=False)
+
+    def test_map_is_rejected(self):
+        wmap = WAVLMap.from_sorted([(1, "a")])
+        with self.assertRaises(TypeError):
+            wmap.save(self.path)
+        with self.assertRaises(TypeError):
+            WAVLMap.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# tests/test_split_join.py
+
+import random
+import unittest
+from helpers import height, height_bound, sizes_ok
+from tree_wavl import WAVLTree
+from map_wavl import WAVLMap
+from utils_wavl import is_valid_wavl
+
+
+class TestSplitJoin(unittest.TestCase):
+    def assertValid(self, tree, order_stats=False):
+        n = len(list(tree))
+        self.assertTrue(is_valid_wavl(tree.root))
+        self.assertLessEqual(height(tree.root), height_bound(n))
+        if order_stats:
+            self.assertTrue(sizes_ok(tree.root))
+
+    def random_tree(self, rng, order_stats):
+        tree = WAVLTree(order_stats=order_stats)
+        for _ in range(400):
+            tree.insert(rng.randrange(300))
+        for _ in range(100):
+            tree.delete(rng.randrange(300))
+        return tree
+
+    def test_split_partitions_with_duplicates(self):
+        rng = random.Random(5)
+        for trial in range(60):
+            order_stats = trial % 2 == 0
+            tree = self.random_tree(rng, order_stats)
+            keys = list(tree)
+            key = rng.randrange(-1, 301)
+            left, right = tree.split(key)
+            self.assertEqual(list(left), [k for k in keys if k < key])
+            self.assertEqual(list(right), [k for k in keys if k > key])
+            self.assertIsNone(tree.root)
+            self.assertValid(left, order_stats)
+            self.assertValid(right, order_stats)
+
+    def test_split_keep_equal(self):
+        tree = WAVLTree.from_sorted([1, 2, 2, 2, 3, 4])
+        left, right = tree.split(2, keep_equal=True)
+        self.assertEqual(list(left), [1])
+        self.assertEqual(list(right), [2, 2, 2, 3, 4])
+
+    def test_join_after_split(self):
+        rng = random.Random(6)
+        for trial in range(40):
+            order_stats = trial % 2 == 0
+            tree = self.random_tree(rng, order_stats)
+            keys = list(tree)
+            left, right = tree.split(rng.randrange(300), keep_equal=True)
+            joined = left.join(right)
+            self.assertEqual(list(joined), keys)
+            self.assertValid(joined, order_stats)
+
+    def test_join_uneven_ranks(self):
+        small = WAVLTree.from_sorted(range(3))
+        big = WAVLTree.from_sorted(range(10, 5000))
+        joined = small.join(big)
+        self.assertEqual(list(joined), list(range(3)) + list(range(10, 5000)))
+        self.assertValid(joined)
+
+    def test_join_empty_left(self):
+        empty = WAVLTree()
+        other = WAVLTree.from_sorted([1, 2, 3], order_stats=True)
+        joined = empty.join(other)
+        self.assertIsNot(joined, empty)
+        self.assertIsNot(joined, other)
+        self.assertEqual(list(joined), [1, 2, 3])
+        self.assertTrue(joined.order_stats)
+        self.assertIsNone(empty.root)
+        self.assertIsNone(other.root)
+
+    def test_join_empty_right(self):
+        tree = WAVLTree.from_sorted([1, 2, 3])
+        empty = WAVLTree()
+        joined = tree.join(empty)
+        self.assertIsNot(joined, tree)
+        self.assertEqual(list(joined), [1, 2, 3])
+        self.assertIsNone(tree.root)
+        self.assertIsNone(empty.root)
+
+    def test_join_both_empty(self):
+        joined = WAVLTree().join(WAVLTree())
+        self.assertIsNone(joined.root)
+
+    def test_map_join_counts(self):
+        left = WAVLMap.from_sorted([(1, "a")])
+        for other in (WAVLMap(), WAVLMap.from_sorted([(2, "b")])):
+            joined = left.join(other)
+            self.assertEqual((len(left), len(other)), (0, 0))
+            left = joined
+        self.assertEqual(dict(left.items()), {1: "a", 2: "b"})
+        self.assertEqual(len(WAVLMap().join(left)), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# tests/test_wal.py
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from helpers import WAVL_DIR  # noqa: F401  (agrega wavl/ a sys.path)
+from utils_wavl import is_valid_wavl
+from wal import DurableWAVLTree, read_log
+
+
+class TestWAL(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def wal_path(self, tree):
+        return os.path.join(self.dir, f"wal-{tree.generation}.log")
+
+    def test_replay_after_reopen(self):
+        with DurableWAVLTree(self.dir, group_commit=16) as tree:
+            for key in range(100):
+                tree.insert(key)
+            tree.delete_many(range(0, 100, 2))
+        reopened = DurableWAVLTree(self.dir)
+        self.assertEqual(list(reopened), list(range(1, 100, 2)))
+        self.assertEqual(reopened.replayed, 150)
+        self.assertTrue(is_valid_wavl(reopened.tree.root))
+        reopened.close()
+
+    def test_torn_tail_is_discarded_and_trimmed(self):
+        with DurableWAVLTree(self.dir, group_commit=1) as tree:
+            for key in range(10):
+                tree.insert(key)
+            path = self.wal_path(tree)
+        # Caída a mitad de un registro: quedan bytes sueltos al final
+        with open(path, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        reopened = DurableWAVLTree(self.dir)
+        self.assertEqual(list(reopened), list(range(10)))
+        reopened.insert(10)
+        reopened.close()
+        _, records, valid = read_log(path)
+        self.assertEqual(len(records), 11)
+        self.assertEqual(valid, os.path.getsize(path))
+
+    def test_corrupt_record_stops_replay(self):
+        with DurableWAVLTree(self.dir, group_commit=1) as tree:
+            for key in range(10):
+                tree.insert(key)
+            path = self.wal_path(tree)
+        # Se corrompe el CRC del séptimo registro: se reaplican los seis primeros
+        offset = 16 + 6 * 13 + 9
+        with open(path, "r+b") as f:
+            f.seek(offset)
+            crc = f.read(1)
+            f.seek(offset)
+            f.write(bytes([crc[0] ^ 0xFF]))
+        reopened = DurableWAVLTree(self.dir)
+        self.assertEqual(list(reopened), list(range(6)))
+        reopened.close()
+
+    def test_unsynced_records_are_lost(self):
+        tree = DurableWAVLTree(self.dir, group_commit=1000)
+        tree.insert(1)
+        tree.sync()
+        tree.insert(2)
+        # Caída sin sync: se abandona el objeto sin cerrarlo
+        tree._log.close()
+        reopened = DurableWAVLTree(self.dir)
+        self.assertEqual(list(reopened), [1])
+        reopened.close()
+
+    def test_checkpoint_and_empty_wal_after_crash(self):
+        with DurableWAVLTree(self.dir) as tree:
+            tree.insert_many(range(50))
+            tree.checkpoint()
+            tree.insert(99)
+            generation = tree.generation
+        # Caída en el checkpoint siguiente: snapshot nuevo con su WAL vacío
+        os.replace(os.path.join(self.dir, f"snapshot-{generation}.wvl"),
+                   os.path.join(self.dir, f"snapshot-{generation + 1}.wvl"))
+        open(os.path.join(self.dir, f"wal-{generation + 1}.log"), "wb").close()
+        reopened = DurableWAVLTree(self.dir)
+        self.assertEqual(list(reopened), list(range(50)))
+        self.assertEqual(reopened.generation, generation + 1)
+        reopened.close()
+
+    def test_max_delay_syncs_without_more_writes(self):
+        tree = DurableWAVLTree(self.dir, group_commit=1000, max_delay=0.01)
+        tree.insert(1)
+        deadline = time.monotonic() + 2
+        while tree.sync_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(tree.sync_count, 1)
+        tree.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# tests/test_workloads.py
+
+import collections
+import os
+import sys
+import tempfile
+import unittest
+from helpers import WAVL_DIR
+from tree_wavl import WAVLTree
+
+sys.path.insert(0, os.path.join(WAVL_DIR, "benchmarks", "scripts"))
+import workloads  # noqa: E402
+from workloads import SEARCH, INSERT, DELETE  # noqa: E402
+
+DISTINCT = ("random", "sequential", "descending", "clustered", "sawtooth", "k_swaps")
+
+
+class TestKeyStreams(unittest.TestCase):
+    def test_deterministic_and_sized(self):
+        for name in workloads.STREAMS:
+            a = workloads.key_stream(name, 1000, seed=3)
+            self.assertEqual(a, workloads.key_stream(name, 1000, seed=3), name)
+            self.assertEqual(len(a), 1000, name)
+
+    def test_distinct_streams(self):
+        for name in DISTINCT:
+            for n in (1, 7, 1000):
+                keys = workloads.key_stream(name, n, seed=1)
+                self.assertEqual(len(set(keys)), n, f"{name} n={n}")
+
+    def test_zipf_is_skewed(self):
+        keys = workloads.zipf_keys(20_000, seed=4, universe=1000)
+        top = collections.Counter(keys).most_common(1)[0][1]
+        # Uniforme daría ~20 por clave; con s=1.1 la más popular lleva miles
+        self.assertGreater(top, 1000)
+
+    def test_k_swaps_is_nearly_sorted(self):
+        keys = workloads.k_swaps_keys(10_000, seed=5, k=10)
+        self.assertEqual(sorted(keys), list(range(1, 10_001)))
+        self.assertLessEqual(sum(a != b for a, b in zip(keys, range(1, 10_001))), 20)
+
+
+class TestTraces(unittest.TestCase):
+    def check_live_keys(self, initial, trace):
+        # Búsquedas y eliminaciones apuntan a claves vivas; inserciones a nuevas
+        live = set(initial)
+        for op, key in trace:
+            if op == INSERT:
+                self.assertNotIn(key, live)
+                live.add(key)
+            else:
+                self.assertIn(key, live)
+                if op == DELETE:
+                    live.remove(key)
+        return live
+
+    def test_mixed_trace_proportions(self):
+        initial = workloads.random_keys(1000, seed=6)
+        trace = workloads.read_heavy_trace(initial, 20_000, seed=6)
+        counts = collections.Counter(op for op, _ in trace)
+        self.assertAlmostEqual(counts[SEARCH] / len(trace), 0.95, delta=0.01)
+        self.check_live_keys(initial, trace)
+        self.check_live_keys(initial, workloads.write_heavy_trace(initial, 5000, seed=7))
+
+    def test_replay_matches_model(self):
+        initial = workloads.random_keys(500, seed=8)
+        trace = workloads.write_heavy_trace(initial, 3000, seed=8)
+        live = self.check_live_keys(initial, trace)
+        tree = WAVLTree.from_sorted(initial)
+        self.assertEqual(workloads.replay(tree, trace), len(trace))
+        self.assertEqual(list(tree), sorted(live))
+
+    def test_sliding_window(self):
+        trace = workloads.sliding_window_trace(list(range(100)), 10)
+        live = self.check_live_keys([], trace)
+        self.assertEqual(live, set(range(90, 100)))
+
+    def test_save_and_load(self):
+        trace = workloads.mixed_trace(range(50), 200, seed=9)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.txt")
+            workloads.save_trace(path, trace)
+            self.assertEqual(list(workloads.load_trace(path)), trace)
+            with open(path, "a") as f:
+                f.write("# comentario\n\nx 1\n")
+            with self.assertRaises(ValueError):
+                list(workloads.load_trace(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,521 @@
+# wavl/array_wavl.py
+
+import struct
+import sys
+from array import array
+from typing import Optional
+
+# Índice "nulo": equivale a None en la versión con objetos
+NIL = -1
+
+_MAGIC = b"AWVL"
+# magic, little-endian?, n_slots, free_head
+_HEADER = struct.Struct("<4sBqq")
+
+
+class NodeArrays:
+    """
+    Almacén struct-of-arrays de nodos WAVL:
+    - key, left, right, parent: array('q') indexados por entero
+    - rank: array('b') (los rangos nunca superan 2·log2(n))
+    Los huecos liberados forman una free-list enlazada a través de `left`.
+    Varios árboles pueden compartir el mismo almacén (así split/join no copian).
+    """
+
+    def __init__(self):
+        self.key = array('q')
+        self.left = array('q')
+        self.right = array('q')
+        self.parent = array('q')
+        self.rank = array('b')
+        self.free = NIL
+
+    def __len__(self):
+        return len(self.key)
+
+    def alloc(self, key) -> int:
+        i = self.free
+        if i != NIL:
+            self.free = self.left[i]
+            self.key[i] = key
+            self.left[i] = NIL
+            self.right[i] = NIL
+            self.parent[i] = NIL
+            self.rank[i] = 0
+            return i
+        self.key.append(key)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.parent.append(NIL)
+        self.rank.append(0)
+        return len(self.key) - 1
+
+    def release(self, i: int):
+        self.left[i] = self.free
+        self.free = i
+
+    # ----------------------- SNAPSHOT -----------------------
+
+    def dump(self, f):
+        """
+        Escribe el almacén completo: cabecera + un bloque contiguo por arreglo.
+        """
+        f.write(_HEADER.pack(_MAGIC, sys.byteorder == "little", len(self.key), self.free))
+        for arr in (self.key, self.left, self.right, self.parent, self.rank):
+            arr.tofile(f)
+
+    @classmethod
+    def load(cls, f) -> "NodeArrays":
+        magic, little, n, free = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError("snapshot de ArrayWAVLTree inválido")
+        nodes = cls()
+        for arr in (nodes.key, nodes.left, nodes.right, nodes.parent, nodes.rank):
+            arr.fromfile(f, n)
+            if bool(little) != (sys.byteorder == "little"):
+                arr.byteswap()
+        nodes.free = free
+        return nodes
+
+
+class ArrayWAVLTree:
+    """
+    Motor WAVL alternativo sin un objeto por nodo: los nodos viven en un
+    NodeArrays y se referencian por índice. Misma API que WAVLTree:
+    search/insert/delete/split/join, con `search` retornando el índice del
+    nodo (o None). Las claves deben ser enteros de 64 bits.
+    """
+
+    def __init__(self, nodes: Optional[NodeArrays] = None):
+        self._nodes = nodes if nodes is not None else NodeArrays()
+        self.root: int = NIL
+        # Contadores para benchmarking
+        self.promote_count = 0
+        self.demote_count = 0
+        self.rotation_count = 0
+
+    def _rank(self, i: int) -> int:
+        return -1 if i == NIL else self._nodes.rank[i]
+
+    def key_of(self, i: int) -> int:
+        return self._nodes.key[i]
+
+    def rank_of(self, i: int) -> int:
+        return self._nodes.rank[i]
+
+    # ----------------------- SEARCH -----------------------
+
+    def search(self, key) -> Optional[int]:
+        keys = self._nodes.key
+        left = self._nodes.left
+        right = self._nodes.right
+        i = self.root
+        while i != NIL:
+            k = keys[i]
+            if key == k:
+                return i
+            i = left[i] if key < k else right[i]
+        return None
+
+    def __contains__(self, key) -> bool:
+        return self.search(key) is not None
+
+    # ----------------------- INSERT -----------------------
+
+    def insert(self, key):
+        nodes = self._nodes
+        new = nodes.alloc(key)
+        if self.root == NIL:
+            self.root = new
+            return
+
+        keys = nodes.key
+        left = nodes.left
+        right = nodes.right
+        i = self.root
+        while True:
+            if key < keys[i]:
+                if left[i] == NIL:
+                    left[i] = new
+                    break
+                i = left[i]
+            else:
+                if right[i] == NIL:
+                    right[i] = new
+                    break
+                i = right[i]
+        nodes.parent[new] = i
+        self._fix_insert(new)
+
+    def _fix_insert(self, x: int):
+        # Mientras `x` sea 0-hijo de su padre hay violación de rangos
+        nodes = self._nodes
+        left, right, parent, rank = nodes.left, nodes.right, nodes.parent, nodes.rank
+        p = parent[x]
+
+        while p != NIL and rank[p] == rank[x]:
+            is_left = left[p] == x
+            s = right[p] if is_left else left[p]
+
+            # Caso 1: hermano 1-hijo → promovemos p y subimos
+            if rank[p] - self._rank(s) == 1:
+                self._promote(p)
+                x = p
+                p = parent[x]
+                continue
+
+            # Caso 2: p es 0,2 → rotación
+            inner = right[x] if is_left else left[x]
+            outer = left[x] if is_left else right[x]
+            if rank[x] - self._rank(inner) == 2:
+                # Simple: el hijo externo de x es 1-hijo
+                self._rotate_up(x)
+                self._demote(p)
+                return
+            if rank[x] - self._rank(outer) == 2:
+                # Doble: el hijo interno de x es 1-hijo
+                self._rotate_up(inner)
+                self._rotate_up(inner)
+                self._promote(inner)
+                self._demote(x)
+                self._demote(p)
+                return
+            # x es 1,1 (solo ocurre en join): rotación simple, x sube un
+            # rango y puede quedar como 0-hijo de su nuevo padre
+            self._rotate_up(x)
+            self._promote(x)
+            p = parent[x]
+
+    # ----------------------- DELETE -----------------------
+
+    def delete(self, key):
+        i = self.search(key)
+        if i is None:
+            return
+        x, p = self._remove(i)
+        self._fix_delete(x, p)
+
+    def _remove(self, i: int) -> tuple[int, int]:
+        nodes = self._nodes
+        left, right, parent = nodes.left, nodes.right, nodes.parent
+
+        # Dos hijos: copiar la clave del sucesor in-order y quitar el sucesor
+        if left[i] != NIL and right[i] != NIL:
+            succ = right[i]
+            while left[succ] != NIL:
+                succ = left[succ]
+            nodes.key[i] = nodes.key[succ]
+            i = succ
+
+        child = left[i] if left[i] != NIL else right[i]
+        p = parent[i]
+        if child != NIL:
+            parent[child] = p
+        if p == NIL:
+            self.root = child
+        elif left[p] == i:
+            left[p] = child
+        else:
+            right[p] = child
+        nodes.release(i)
+        return child, p
+
+    def _fix_delete(self, x: int, p: int):
+        # `x` ocupa el lugar del nodo eliminado (puede ser NIL) bajo `p`
+        if p == NIL:
+            return
+        nodes = self._nodes
+        left, right, parent, rank = nodes.left, nodes.right, nodes.parent, nodes.rank
+
+        # Hoja 2,2 → demovemos y seguimos desde ella
+        if left[p] == NIL and right[p] == NIL and rank[p] == 1:
+            self._demote(p)
+            x = p
+            p = parent[x]
+
+        # Mientras `x` sea 3-hijo hay violación
+        while p != NIL and rank[p] - self._rank(x) == 3:
+            is_left = left[p] == x
+            s = right[p] if is_left else left[p]
+
+            if rank[p] - self._rank(s) == 2:
+                # Caso 1: hermano 2-hijo
+                self._demote(p)
+            elif rank[s] - self._rank(left[s]) == 2 and rank[s] - self._rank(right[s]) == 2:
+                # Caso 2: hermano 1-hijo y 2,2 → doble democión
+                self._demote(s)
+                self._demote(p)
+            else:
+                # Caso 3: rotación simple o doble y terminamos
+                outer = right[s] if is_left else left[s]
+                inner = left[s] if is_left else right[s]
+                if rank[s] - self._rank(outer) == 1:
+                    self._rotate_up(s)
+                    self._promote(s)
+                    self._demote(p)
+                    if left[p] == NIL and right[p] == NIL:
+                        self._demote(p)
+                else:
+                    self._rotate_up(inner)
+                    self._rotate_up(inner)
+                    self._promote(inner)
+                    self._promote(inner)
+                    self._demote(s)
+                    self._demote(p)
+                    self._demote(p)
+                return
+
+            x = p
+            p = parent[x]
+
+    # ----------------------- PROMOTE / DEMOTE -----------------------
+
+    def _promote(self, i: int):
+        self._nodes.rank[i] += 1
+        self.promote_count += 1
+
+    def _demote(self, i: int):
+        self._nodes.rank[i] -= 1
+        self.demote_count += 1
+
+    # ----------------------- ROTATIONS -----------------------
+
+    def _rotate_up(self, y: int):
+        """
+        Rota `y` por encima de su padre z (rotación derecha si `y` es hijo
+        izquierdo, izquierda si es derecho).
+        """
+        self.rotation_count += 1
+        nodes = self._nodes
+        left, right, parent = nodes.left, nodes.right, nodes.parent
+
+        z = parent[y]
+        pz = parent[z]
+        if left[z] == y:
+            t2 = right[y]
+            right[y] = z
+            left[z] = t2
+        else:
+            t2 = left[y]
+            left[y] = z
+            right[z] = t2
+        if t2 != NIL:
+            parent[t2] = z
+        parent[z] = y
+        parent[y] = pz
+
+        if pz == NIL:
+            self.root = y
+        elif left[pz] == z:
+            left[pz] = y
+        else:
+            right[pz] = y
+
+    # ----------------------- JOIN -----------------------
+
+    def _join(self, l: int, k: int, r: int) -> int:
+        """
+        Une los subárboles `l` <= k <= `r` (raíces sin padre) con el nodo
+        pivote `k`. Baja por la espina del más alto hasta el rango del otro:
+        O(|rank(l) - rank(r)| + 1). Retorna la nueva raíz.
+        """
+        nodes = self._nodes
+        left, right, parent, rank = nodes.left, nodes.right, nodes.parent, nodes.rank
+        rl, rr = self._rank(l), self._rank(r)
+
+        if abs(rl - rr) <= 1:
+            left[k], right[k], parent[k] = l, r, NIL
+            rank[k] = max(rl, rr) + 1
+            if l != NIL:
+                parent[l] = k
+            if r != NIL:
+                parent[r] = k
+            return k
+
+        if rl > rr:
+            # Espina derecha de l hasta un nodo de rango rr o rr + 1
+            p, x = NIL, l
+            while self._rank(x) > rr + 1:
+                p, x = x, right[x]
+            left[k], right[k] = x, r
+            right[p] = k
+            self.root = l
+        else:
+            # Espina izquierda de r hasta un nodo de rango rl o rl + 1
+            p, x = NIL, r
+            while self._rank(x) > rl + 1:
+                p, x = x, left[x]
+            left[k], right[k] = l, x
+            left[p] = k
+            self.root = r
+
+        parent[k] = p
+        if x != NIL:
+            parent[x] = k
+        other = r if rl > rr else l
+        if other != NIL:
+            parent[other] = k
+        rank[k] = max(self._rank(x), self._rank(other)) + 1
+        self._fix_insert(k)
+        return self.root
+
+    def _adopt(self, other: "ArrayWAVLTree") -> int:
+        """
+        Copia los nodos de `other` (de otro almacén) a este almacén,
+        conservando forma y rangos. Retorna el índice de la nueva raíz.
+        """
+        src = other._nodes
+        dst = self._nodes
+        if other.root == NIL:
+            return NIL
+        new_root = dst.alloc(src.key[other.root])
+        dst.rank[new_root] = src.rank[other.root]
+        stack = [(other.root, new_root)]
+        while stack:
+            i, j = stack.pop()
+            for child_arr in (src.left, src.right):
+                c = child_arr[i]
+                if c == NIL:
+                    continue
+                nc = dst.alloc(src.key[c])
+                dst.rank[nc] = src.rank[c]
+                dst.parent[nc] = j
+                if child_arr is src.left:
+                    dst.left[j] = nc
+                else:
+                    dst.right[j] = nc
+                stack.append((c, nc))
+        return new_root
+
+    def join(self, other: "ArrayWAVLTree") -> "ArrayWAVLTree":
+        """
+        Une self (claves menores) con other (claves mayores) en O(log n)
+        si comparten almacén; si no, primero copia other (O(m)).
+        Siempre retorna un árbol nuevo (en el almacén de self); self y other
+        quedan vacíos, también si alguno ya lo estaba.
+        """
+        if self.root == NIL or other.root == NIL:
+            # Con un lado vacío el resultado es el otro, igual que en el caso general
+            # en un árbol nuevo
+            joined = ArrayWAVLTree(self._nodes)
+            if self.root != NIL:
+                joined.root = self.root
+            elif other._nodes is self._nodes:
+                joined.root = other.root
+            else:
+                joined.root = self._adopt(other)
+            self.root = NIL
+            other.root = NIL
+            return joined
+
+        if other._nodes is not self._nodes:
+            other_root = self._adopt(other)
+        else:
+            other_root = other.root
+
+        # Pivote: el mínimo de other, desenganchado de su árbol
+        scratch = ArrayWAVLTree(self._nodes)
+        scratch.root = other_root
+        i = other_root
+        while self._nodes.left[i] != NIL:
+            i = self._nodes.left[i]
+        k = self._nodes.alloc(self._nodes.key[i])
+        x, p = scratch._remove(i)
+        scratch._fix_delete(x, p)
+
+        joined = ArrayWAVLTree(self._nodes)
+        joined.root = joined._join(self.root, k, scratch.root)
+        self.root = NIL
+        other.root = NIL
+        return joined
+
+    # ----------------------- SPLIT -----------------------
+
+    def split(self, key) -> tuple["ArrayWAVLTree", "ArrayWAVLTree"]:
+        """
+        Parte el árbol en (claves < key, claves > key) en O(log n); todas las
+        ocurrencias de `key` se descartan y sus huecos vuelven a la
+        free-list. Ambas mitades comparten el almacén de self, que queda
+        vacío.
+        """
+        lt, rt = self._split_nodes(self.root, key, equal_right=True)
+        # Las copias de `key` son las mínimas de la mitad derecha
+        equal, rt = self._split_nodes(rt, key, equal_right=False)
+        self._release_subtree(equal)
+
+        tree_l = ArrayWAVLTree(self._nodes)
+        tree_r = ArrayWAVLTree(self._nodes)
+        tree_l.root = lt
+        tree_r.root = rt
+        self.root = NIL
+        return tree_l, tree_r
+
+    def _split_nodes(self, root: int, key, equal_right: bool) -> tuple[int, int]:
+        """
+        Parte el subárbol `root` en (claves < key, claves >= key) si
+        equal_right, o en (claves <= key, claves > key) si no. Como en
+        WAVLTree, el camino baja hasta NIL: con claves repetidas las copias
+        pueden estar a ambos lados de un nodo igual.
+        """
+        nodes = self._nodes
+        keys, left, right, parent = nodes.key, nodes.left, nodes.right, nodes.parent
+
+        # 1) Descenso registrando el camino
+        path = []
+        i = root
+        while i != NIL:
+            goes_right = key < keys[i] or (equal_right and key == keys[i])
+            path.append((i, goes_right))
+            i = left[i] if goes_right else right[i]
+
+        # 2) Subida: cada nodo del camino se une como pivote con su otro hijo
+        lt, rt = NIL, NIL
+        for t, goes_right in reversed(path):
+            if goes_right:
+                sub = right[t]
+                if rt != NIL:
+                    parent[rt] = NIL
+                if sub != NIL:
+                    parent[sub] = NIL
+                rt = self._join(rt, t, sub)
+            else:
+                sub = left[t]
+                if lt != NIL:
+                    parent[lt] = NIL
+                if sub != NIL:
+                    parent[sub] = NIL
+                lt = self._join(sub, t, lt)
+
+        if lt != NIL:
+            parent[lt] = NIL
+        if rt != NIL:
+            parent[rt] = NIL
+        return lt, rt
+
+    def _release_subtree(self, i: int):
+        # Devuelve a la free-list todos los nodos del subárbol `i`
+        nodes = self._nodes
+        stack = [i] if i != NIL else []
+        while stack:
+            i = stack.pop()
+            for c in (nodes.left[i], nodes.right[i]):
+                if c != NIL:
+                    stack.append(c)
+            nodes.release(i)
+
+    # ----------------------- SNAPSHOT -----------------------
+
+    def dump(self, f):
+        """
+        Guarda el árbol como una imagen del almacén: la raíz y los arreglos
+        contiguos se escriben tal cual, sin recorrer nodos.
+        """
+        f.write(struct.pack("<q", self.root))
+        self._nodes.dump(f)
+
+    @classmethod
+    def load(cls, f) -> "ArrayWAVLTree":
+        (root,) = struct.unpack("<q", f.read(8))
+        tree = cls(NodeArrays.load(f))
+        tree.root = root
+        return tree
@@ -1,6 +1,8 @@
 # wavl/avl.py
 
 from typing import Optional
+from utils_bst import (build_balanced, climb_for, descend, OrderedTreeMixin,
+                       add_size, update_size)
 
 class NodeAVL:
     """
@@ -9,13 +11,18 @@ class NodeAVL:
     - left, right: hijos (NodeAVL o None)
     - parent: nodo padre (NodeAVL o None)
     - height: altura del subárbol en este nodo
+    - size: número de nodos del subárbol (solo se mantiene con order_stats)
+    Usa __slots__ para no reservar un __dict__ por nodo.
     """
+    __slots__ = ("key", "left", "right", "parent", "height", "size")
+
     def __init__(self, key):
         self.key: int = key
         self.left: Optional[NodeAVL] = None
         self.right: Optional[NodeAVL] = None
         self.parent: Optional[NodeAVL] = None
         self.height: int = 0  # Altura de hoja = 0
+        self.size: int = 1
 
     def __repr__(self):
         left_k = self.left.key if self.left else None
@@ -24,18 +31,43 @@ class NodeAVL:
                 f"left={left_k}, right={right_k})")
 
 
-class AVLTree:
+class AVLTree(OrderedTreeMixin):
     """
     Implementación de un Árbol AVL con:
     - search(key)
     - insert(key)
     - delete(key)
     - Instrumentación: rotation_count (conteo de rotaciones)
+    - order_stats: si es True mantiene tamaños de subárbol (select/rank)
     """
 
-    def __init__(self):
+    def __init__(self, order_stats: bool = False):
         self.root: Optional[NodeAVL] = None
         self.rotation_count: int = 0
+        self.order_stats = order_stats
+        # Se incrementa en cada cambio del conjunto de claves: invalida
+        # cachés derivados (search_many, freeze)
+        self._version = 0
+        self._keys_cache = None
+        self._frozen = None
+
+    @classmethod
+    def from_sorted(cls, iterable, order_stats: bool = False) -> "AVLTree":
+        """
+        Construye un AVL perfectamente balanceado en O(n) a partir de claves
+        ordenadas (si no lo están, se ordenan primero).
+        """
+        keys = sorted(iterable)
+
+        def make_node(key, size, depth):
+            node = NodeAVL(key)
+            node.height = size.bit_length() - 1
+            node.size = size
+            return node
+
+        tree = cls(order_stats)
+        tree.root = build_balanced(keys, make_node)
+        return tree
 
     # -------------------- UTILIDADES --------------------
 
@@ -90,9 +122,12 @@ class AVLTree:
             else:
                 parent_of_z.right = y
 
-        # 4) Actualizar alturas
+        # 4) Actualizar alturas (y tamaños)
         self._update_height(z)
         self._update_height(y)
+        if self.order_stats:
+            update_size(z)
+            update_size(y)
         return y
 
     def _rotate_right(self, z: NodeAVL) -> NodeAVL:
@@ -125,28 +160,66 @@ class AVLTree:
             else:
                 parent_of_z.right = y
 
-        # 4) Actualizar alturas
+        # 4) Actualizar alturas (y tamaños)
         self._update_height(z)
         self._update_height(y)
+        if self.order_stats:
+            update_size(z)
+            update_size(y)
         return y
 
+    # -------------------- REBALANCEO --------------------
+
+    def _rebalance(self, node: NodeAVL) -> NodeAVL:
+        """
+        Aplica la rotación (simple o doble) que corresponda al balance de `node`.
+        Retorna la raíz resultante del subárbol.
+        """
+        balance = self._get_balance(node)
+
+        # LL / LR
+        if balance > 1:
+            if self._get_balance(node.left) < 0:
+                self._rotate_left(node.left)
+            return self._rotate_right(node)
+
+        # RR / RL
+        if balance < -1:
+            if self._get_balance(node.right) > 0:
+                self._rotate_right(node.right)
+            return self._rotate_left(node)
+
+        return node
+
+    def _retrace(self, node: Optional[NodeAVL]):
+        """
+        Sube por los punteros `parent` desde `node` hasta la raíz actualizando
+        alturas y rotando donde haga falta. Se detiene en cuanto la altura de un
+        subárbol no cambia, porque entonces ningún ancestro se ve afectado.
+        """
+        while node is not None:
+            parent = node.parent
+            old_height = node.height
+            self._update_height(node)
+            subroot = self._rebalance(node)
+            if subroot is node and node.height == old_height:
+                break
+            if subroot is not node and subroot.height == old_height:
+                break
+            node = parent
+
     # -------------------- SEARCH --------------------
 
     def search(self, key) -> Optional[NodeAVL]:
         """
-        Busca recursivamente la clave `key` y retorna el nodo, o None si no existe.
+        Busca iterativamente la clave `key` y retorna el nodo, o None si no existe.
         """
-        return self._search_rec(self.root, key)
-
-    def _search_rec(self, node: Optional[NodeAVL], key) -> Optional[NodeAVL]:
-        if node is None:
-            return None
-        if key == node.key:
-            return node
-        elif key < node.key:
-            return self._search_rec(node.left, key)
-        else:
-            return self._search_rec(node.right, key)
+        node = self.root
+        while node is not None:
+            if key == node.key:
+                return node
+            node = node.left if key < node.key else node.right
+        return None
 
     # -------------------- INSERT --------------------
 
@@ -154,63 +227,59 @@ class AVLTree:
         """
         Inserta `key` en el AVL:
         1) Si root es None, crea nuevo nodo como raíz.
-        2) Sino, inserta recursivamente como BST.
-        3) Al volver, actualiza alturas y hace rotaciones según balance factor.
+        2) Sino, desciende iterativamente como BST.
+        3) Sube por los padres actualizando alturas y rotando según balance factor.
         """
         if self.root is None:
             self.root = NodeAVL(key)
+            self._version += 1
             return
 
-        self.root = self._insert_rec(self.root, key)
+        new_node = self._bst_insert(self.root, key)
+        self._retrace(new_node.parent)
 
-    def _insert_rec(self, node: NodeAVL, key) -> NodeAVL:
-        # 1) Inserción BST normal
-        if key < node.key:
-            if node.left is None:
-                new_node = NodeAVL(key)
-                node.left = new_node
-                new_node.parent = node
-            else:
-                node.left = self._insert_rec(node.left, key)
-                node.left.parent = node
-        else:
-            if node.right is None:
-                new_node = NodeAVL(key)
-                node.right = new_node
-                new_node.parent = node
+    def _bst_insert(self, node: NodeAVL, key) -> NodeAVL:
+        """
+        Baja iterativamente desde `node` y cuelga una hoja nueva con `key`.
+        """
+        while True:
+            if key < node.key:
+                if node.left is None:
+                    new_node = NodeAVL(key)
+                    node.left = new_node
+                    break
+                node = node.left
             else:
-                node.right = self._insert_rec(node.right, key)
-                node.right.parent = node
-
-        # 2) Actualizar altura de este nodo
-        self._update_height(node)
-
-        # 3) Chequear balance
-        balance = self._get_balance(node)
-
-        # 4) Rotaciones según el caso
-
-        # LL case (inserción en subárbol izquierdo de hijo izquierdo)
-        if balance > 1 and key < node.left.key:
-            return self._rotate_right(node)
-
-        # RR case (inserción en subárbol derecho de hijo derecho)
-        if balance < -1 and key > node.right.key:
-            return self._rotate_left(node)
-
-        # LR case (inserción en subárbol derecho de hijo izquierdo)
-        if balance > 1 and key > node.left.key:
-            node.left = self._rotate_left(node.left)
-            node.left.parent = node
-            return self._rotate_right(node)
-
-        # RL case (inserción en subárbol izquierdo de hijo derecho)
-        if balance < -1 and key < node.right.key:
-            node.right = self._rotate_right(node.right)
-            node.right.parent = node
-            return self._rotate_left(node)
+                if node.right is None:
+                    new_node = NodeAVL(key)
+                    node.right = new_node
+                    break
+                node = node.right
+
+        new_node.parent = node
+        if self.order_stats:
+            add_size(node, 1)
+        self._version += 1
+        return new_node
+
+    def insert_many(self, keys):
+        """
+        Inserta un lote de claves en una sola pasada ordenada: cada inserción
+        parte de la hoja anterior (finger) en vez de bajar desde la raíz.
+        """
+        finger = self.finger()
+        for key in sorted(keys):
+            finger.insert(key)
 
-        # Si no necesitó rotar, retorna este nodo
+    def _insert_from(self, start: Optional[NodeAVL], key) -> NodeAVL:
+        # Inserta bajando desde `start` (None = la raíz), rebalancea y
+        # retorna el nodo nuevo. Lo usan insert_many y Finger.insert.
+        if self.root is None:
+            self.root = NodeAVL(key)
+            self._version += 1
+            return self.root
+        node = self._bst_insert(self.root if start is None else start, key)
+        self._retrace(node.parent)
         return node
 
     # -------------------- DELETE --------------------
@@ -219,78 +288,56 @@ class AVLTree:
         """
         Elimina `key` del AVL:
         1) Si no existe, retorna.
-        2) Llama a _delete_rec para obtener nueva subraíz.
-        3) Actualiza heights/rotaciones hacia arriba.
+        2) Con dos hijos, copia la clave del sucesor in-order y elimina el sucesor.
+        3) Actualiza heights/rotaciones hacia arriba desde el padre del nodo quitado.
         """
-        self.root = self._delete_rec(self.root, key)
-        if self.root:
-            self.root.parent = None
-
-    def _delete_rec(self, node: Optional[NodeAVL], key) -> Optional[NodeAVL]:
+        node = self.search(key)
         if node is None:
-            return None
-
-        # 1) BST delete
-        if key < node.key:
-            node.left = self._delete_rec(node.left, key)
-            if node.left:
-                node.left.parent = node
-        elif key > node.key:
-            node.right = self._delete_rec(node.right, key)
-            if node.right:
-                node.right.parent = node
-        else:
-            # Encontramos el nodo a borrar
-            if node.left is None and node.right is None:
-                return None
-            elif node.left is None:
-                temp = node.right
-                temp.parent = node.parent
-                return temp
-            elif node.right is None:
-                temp = node.left
-                temp.parent = node.parent
-                return temp
-            else:
-                # Dos hijos: encontrar sucesor in-order (mínimo en subárbol derecho)
-                succ = node.right
-                while succ.left:
-                    succ = succ.left
-                node.key = succ.key
-                node.right = self._delete_rec(node.right, succ.key)
-                if node.right:
-                    node.right.parent = node
-
-        # 2) Si la rama quedó vacía, retornamos
-        if node is None:
-            return None
-
-        # 3) Actualizar altura
-        self._update_height(node)
-
-        # 4) Chequear balance
-        balance = self._get_balance(node)
-
-        # 5) Rotaciones según casos
-
-        # LL case
-        if balance > 1 and self._get_balance(node.left) >= 0:
-            return self._rotate_right(node)
-
-        # LR case
-        if balance > 1 and self._get_balance(node.left) < 0:
-            node.left = self._rotate_left(node.left)
-            node.left.parent = node
-            return self._rotate_right(node)
+            return
+        self._delete_node(node)
 
-        # RR case
-        if balance < -1 and self._get_balance(node.right) <= 0:
-            return self._rotate_left(node)
+    def _delete_node(self, node: NodeAVL) -> Optional[NodeAVL]:
+        """
+        Quita `node` del árbol y rebalancea. Retorna el padre del nodo
+        físicamente eliminado (sigue en el árbol), o None.
+        """
+        # Dos hijos: encontrar sucesor in-order (mínimo en subárbol derecho)
+        if node.left is not None and node.right is not None:
+            succ = node.right
+            while succ.left:
+                succ = succ.left
+            node.key = succ.key
+            node = succ
+
+        # `node` tiene a lo sumo un hijo: reemplazarlo por él
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        if child is not None:
+            child.parent = parent
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        if self.order_stats:
+            add_size(parent, -1)
+        self._version += 1
 
-        # RL case
-        if balance < -1 and self._get_balance(node.right) > 0:
-            node.right = self._rotate_right(node.right)
-            node.right.parent = node
-            return self._rotate_left(node)
+        self._retrace(parent)
+        return parent
 
-        return node
+    def delete_many(self, keys):
+        """
+        Elimina un lote de claves en una sola pasada ordenada, buscando cada
+        una desde donde terminó la eliminación anterior (finger).
+        """
+        finger = self.root
+        for key in sorted(keys):
+            if self.root is None:
+                return
+            node, finger = descend(climb_for(finger, key), key)
+            if node is None:
+                continue
+            parent = self._delete_node(node)
+            finger = parent if parent is not None else self.root
@@ -0,0 +1,86 @@
+# benchmarks/scripts/bench_concurrent.py
+
+import argparse
+import csv
+import os
+import random
+import sys
+import threading
+import time
+from tree_wavl import WAVLTree
+from concurrent_wavl import ConcurrentWAVLTree
+
+
+def gil_enabled() -> bool:
+    # En builds free-threaded (3.13t+) el GIL puede estar desactivado
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def benchmark_threads(n, threads, ops_per_thread, read_fraction=0.95, seed=0):
+    """
+    Throughput total (ops/s) de `threads` hilos sobre un mismo
+    ConcurrentWAVLTree con n claves: `read_fraction` de búsquedas y el resto
+    inserciones/eliminaciones de claves impares (las pares están precargadas).
+    """
+    tree = ConcurrentWAVLTree(WAVLTree.from_sorted(range(0, 2 * n, 2)))
+    plans = []
+    for t in range(threads):
+        rng = random.Random(seed + t)
+        plan = []
+        for _ in range(ops_per_thread):
+            r = rng.random()
+            if r < read_fraction:
+                plan.append((0, rng.randrange(2 * n)))
+            elif r < (1 + read_fraction) / 2:
+                plan.append((1, rng.randrange(1, 2 * n, 2)))
+            else:
+                plan.append((2, rng.randrange(1, 2 * n, 2)))
+        plans.append(plan)
+
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(plan):
+        ops = (tree.__contains__, tree.insert, tree.delete)
+        barrier.wait()
+        for op, key in plan:
+            ops[op](key)
+
+    workers = [threading.Thread(target=worker, args=(plan,)) for plan in plans]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops_per_thread / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput de ConcurrentWAVLTree según número de hilos")
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--ops", type=int, default=50_000, help="operaciones por hilo")
+    parser.add_argument("--reads", type=float, default=0.95)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="data/bench_concurrent.csv")
+    args = parser.parse_args()
+
+    gil = gil_enabled()
+    print(f"Python {sys.version.split()[0]}, GIL {'activo' if gil else 'desactivado'}")
+    results = []
+    base = None
+    for threads in args.threads:
+        ops = benchmark_threads(args.n, threads, args.ops, args.reads, args.seed)
+        base = base or ops
+        results.append({"n": args.n, "threads": threads, "read_fraction": args.reads,
+                        "gil": gil, "ops_per_sec": round(ops), "speedup": round(ops / base, 3)})
+        print(f"{threads} hilos: {ops:,.0f} ops/s ({ops / base:.2f}x)")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, mode='w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Resultados guardados en {args.output}")
@@ -0,0 +1,93 @@
+# benchmarks/scripts/bench_finger.py
+
+import argparse
+import csv
+import gc
+import os
+import time
+from tree_wavl import WAVLTree
+from avl import AVLTree
+from rbt import RBTree
+from workloads import STREAMS, key_stream
+
+STRUCTURES = {"wavl": WAVLTree, "avl": AVLTree, "rbt": RBTree}
+
+
+def best_of(repeat, run):
+    # Mejor de `repeat` corridas, sin pausas del GC en medio
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            best = min(best, run())
+    finally:
+        gc.enable()
+    return best
+
+
+def benchmark_finger(tree_cls, keys, repeat):
+    """
+    Segundos para insertar y luego buscar `keys` en el orden en que llegan,
+    con tree.insert/search (desde la raíz) y con un Finger.
+    """
+    def insert_root():
+        tree = tree_cls()
+        start = time.perf_counter()
+        for key in keys:
+            tree.insert(key)
+        return time.perf_counter() - start
+
+    def insert_finger():
+        finger = tree_cls().finger()
+        start = time.perf_counter()
+        for key in keys:
+            finger.insert(key)
+        return time.perf_counter() - start
+
+    tree = tree_cls.from_sorted(keys)
+
+    def search_root():
+        start = time.perf_counter()
+        for key in keys:
+            tree.search(key)
+        return time.perf_counter() - start
+
+    def search_finger():
+        finger = tree.finger()
+        start = time.perf_counter()
+        for key in keys:
+            finger.search(key)
+        return time.perf_counter() - start
+
+    return (best_of(repeat, insert_root), best_of(repeat, insert_finger),
+            best_of(repeat, search_root), best_of(repeat, search_finger))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Finger search/insert vs operaciones desde la raíz")
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--modes", nargs="+", default=["sequential", "k_swaps", "sawtooth", "random"],
+                        choices=list(STREAMS))
+    parser.add_argument("--structures", nargs="+", default=list(STRUCTURES), choices=list(STRUCTURES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="data/bench_finger.csv")
+    args = parser.parse_args()
+
+    results = []
+    for mode in args.modes:
+        keys = key_stream(mode, args.n, args.seed)
+        for name in args.structures:
+            ins, ins_f, srch, srch_f = benchmark_finger(STRUCTURES[name], keys, args.repeat)
+            results.append({"n": args.n, "mode": mode, "structure": name,
+                            "insert_s": round(ins, 4), "finger_insert_s": round(ins_f, 4),
+                            "search_s": round(srch, 4), "finger_search_s": round(srch_f, 4)})
+            print(f"{mode:>10} {name}: insert {ins:.3f}s / finger {ins_f:.3f}s ({ins / ins_f:.2f}x), "
+                  f"search {srch:.3f}s / finger {srch_f:.3f}s ({srch / srch_f:.2f}x)")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, mode='w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Resultados guardados en {args.output}")
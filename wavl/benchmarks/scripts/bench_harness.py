@@ -0,0 +1,387 @@
+# benchmarks/scripts/bench_harness.py
+#
+# Harness de benchmarks con calentamiento, repeticiones y resumen estadístico.
+# Cada muestra es una pasada completa de una carga de trabajo sobre un árbol
+# recién preparado (la preparación no se mide); se reporta ns/op.
+#
+#   PYTHONPATH=wavl python3 wavl/benchmarks/scripts/bench_harness.py
+#   PYTHONPATH=wavl python3 wavl/benchmarks/scripts/bench_harness.py --revisions HEAD~3 HEAD
+#   python3 wavl/benchmarks/scripts/bench_harness.py --compare base.json nuevo.json
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from workloads import (SEARCH, INSERT, DELETE, load_trace, read_heavy_trace,
+                       sliding_window_trace, write_heavy_trace)
+
+STRUCTURES = ("wavl", "avl", "rbt")
+
+WORKLOADS = ("insert", "search", "delete", "mixed", "read_heavy", "write_heavy",
+             "sliding_window", "split_join")
+
+
+# ----------------------- DATOS -----------------------
+
+class WorkloadData:
+    """
+    Claves de la carga de trabajo, generadas una sola vez con `seed` para que
+    todas las estructuras (y todas las revisiones) vean exactamente lo mismo.
+    """
+
+    def __init__(self, n, ops, seed, trace_path=None):
+        rng = random.Random(seed)
+        # El universo alcanza para las n claves más 2·ops ausentes aun con n chico
+        universe = rng.sample(range(max(n * 10, n + 2 * ops)), n + 2 * ops)
+        self.keys = sorted(universe[:n])
+        self.fresh = universe[n:n + ops]              # claves que no están
+        self.absent = universe[n + ops:]              # pivotes de split
+        self.lookups = [rng.choice(self.keys) for _ in range(ops)]
+        # Con ops > n se borra cada clave a lo sumo una vez
+        self.victims = rng.sample(self.keys, min(ops, n))
+
+        # Mezcla 80% búsquedas, 10% inserciones, 10% eliminaciones
+        self.mixed = []
+        fresh = iter(self.fresh)
+        victims = iter(self.victims)
+        for key in self.lookups:
+            r = rng.random()
+            if r < 0.1:
+                self.mixed.append((1, next(fresh)))
+            elif r < 0.2:
+                # Sin víctimas disponibles (n chico) la operación es una búsqueda
+                victim = next(victims, None)
+                self.mixed.append((0, key) if victim is None else (2, victim))
+            else:
+                self.mixed.append((0, key))
+
+        # Trazas de workloads.py (95/5 con sesgo Zipf, escritura intensiva,
+        # ventana deslizante) y, opcionalmente, una traza grabada
+        self.traces = {
+            "read_heavy": read_heavy_trace(self.keys, ops, seed),
+            "write_heavy": write_heavy_trace(self.keys, ops, seed),
+            "sliding_window": sliding_window_trace(self.fresh, max(1, ops // 4)),
+        }
+        if trace_path:
+            self.traces["trace"] = list(load_trace(trace_path))
+
+
+def build(cls, keys):
+    # Revisiones antiguas pueden no tener from_sorted
+    if hasattr(cls, "from_sorted"):
+        return cls.from_sorted(keys)
+    tree = cls()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+# ----------------------- CARGAS DE TRABAJO -----------------------
+# Cada una prepara un árbol y retorna (función a medir, número de operaciones),
+# o None si la estructura no soporta la carga.
+
+def prepare_insert(cls, data):
+    tree = build(cls, data.keys)
+    insert = tree.insert
+
+    def run():
+        for key in data.fresh:
+            insert(key)
+    return run, len(data.fresh)
+
+
+def prepare_search(cls, data):
+    tree = build(cls, data.keys)
+    search = tree.search
+
+    def run():
+        for key in data.lookups:
+            search(key)
+    return run, len(data.lookups)
+
+
+def prepare_delete(cls, data):
+    tree = build(cls, data.keys)
+    delete = tree.delete
+
+    def run():
+        for key in data.victims:
+            delete(key)
+    return run, len(data.victims)
+
+
+def prepare_mixed(cls, data):
+    tree = build(cls, data.keys)
+    ops = (tree.search, tree.insert, tree.delete)
+
+    def run():
+        for op, key in data.mixed:
+            ops[op](key)
+    return run, len(data.mixed)
+
+
+def make_prepare_trace(name):
+    # Reproduce data.traces[name] sobre el árbol base; los métodos se
+    # resuelven antes de medir para que solo se cuente la operación
+    def prepare(cls, data):
+        tree = build(cls, data.keys)
+        methods = {SEARCH: tree.search, INSERT: tree.insert, DELETE: tree.delete}
+        steps = [(methods[op], key) for op, key in data.traces[name]]
+
+        def run():
+            for method, key in steps:
+                method(key)
+        return run, len(steps)
+    return prepare
+
+
+def prepare_split_join(cls, data):
+    if not (hasattr(cls, "split") and hasattr(cls, "join")):
+        return None
+    pivots = data.absent[:max(1, len(data.absent) // 10)]
+    state = {"tree": build(cls, data.keys)}
+
+    def run():
+        tree = state["tree"]
+        for key in pivots:
+            left, right = tree.split(key)
+            tree = left.join(right)
+        state["tree"] = tree
+    # Cada pivote cuenta como una operación split + join
+    return run, len(pivots)
+
+
+PREPARE = {
+    "insert": prepare_insert,
+    "search": prepare_search,
+    "delete": prepare_delete,
+    "mixed": prepare_mixed,
+    "read_heavy": make_prepare_trace("read_heavy"),
+    "write_heavy": make_prepare_trace("write_heavy"),
+    "sliding_window": make_prepare_trace("sliding_window"),
+    "trace": make_prepare_trace("trace"),
+    "split_join": prepare_split_join,
+}
+
+
+# ----------------------- ESTADÍSTICA -----------------------
+
+def percentile(sorted_values, q):
+    # Percentil por rango más cercano (q en [0, 100])
+    if not sorted_values:
+        return float("nan")
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def bootstrap_ci(samples, stat=statistics.median, confidence=0.95, resamples=1000, seed=0):
+    """
+    Intervalo de confianza percentil por bootstrap para `stat` (por defecto
+    la mediana): no supone normalidad de los tiempos.
+    """
+    if len(samples) < 2:
+        return samples[0], samples[0]
+    rng = random.Random(seed)
+    k = len(samples)
+    estimates = sorted(stat(rng.choices(samples, k=k)) for _ in range(resamples))
+    tail = (1 - confidence) / 2 * 100
+    return percentile(estimates, tail), percentile(estimates, 100 - tail)
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    ci_low, ci_high = bootstrap_ci(samples)
+    return {
+        "median": statistics.median(ordered),
+        "p95": percentile(ordered, 95),
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "min": ordered[0],
+        "ci95": [ci_low, ci_high],
+    }
+
+
+# ----------------------- MEDICIÓN -----------------------
+
+def measure(prepare, cls, data, repeat, warmup):
+    """
+    Ejecuta `warmup` pasadas descartadas y `repeat` pasadas medidas con
+    perf_counter_ns. Retorna la lista de ns/op, o None si no aplica.
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        prepared = prepare(cls, data)
+        if prepared is None:
+            return None
+        run, ops = prepared
+        # Sin pasadas del GC dentro de la ventana de tiempo
+        gc.collect()
+        start = time.perf_counter_ns()
+        run()
+        elapsed = time.perf_counter_ns() - start
+        if i >= warmup:
+            samples.append(elapsed / ops)
+    return samples
+
+
+def git_revision():
+    # Revisión del código medido (el de los módulos importados, no el del script)
+    import tree_wavl
+    cwd = os.path.dirname(os.path.abspath(tree_wavl.__file__))
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=cwd,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               cwd=cwd, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return rev + ("-dirty" if dirty.strip() else "")
+
+
+def load_structures():
+    # Importación diferida: --compare y --revisions no necesitan los árboles
+    # en el proceso principal (cada revisión los importa desde su worktree)
+    from tree_wavl import WAVLTree
+    from avl import AVLTree
+    from rbt import RBTree
+    return {"wavl": WAVLTree, "avl": AVLTree, "rbt": RBTree}
+
+
+def run_harness(n, ops, repeat, warmup, seed, structures, workloads, trace_path=None):
+    classes = load_structures()
+    data = WorkloadData(n, ops, seed, trace_path)
+    results = []
+    for workload in workloads:
+        for name in structures:
+            samples = measure(PREPARE[workload], classes[name], data, repeat, warmup)
+            if samples is None:
+                continue
+            summary = summarize(samples)
+            results.append({"structure": name, "workload": workload, "n": n,
+                            "samples_ns_per_op": samples, **summary})
+            print(f"n={n} {workload:<14} {name:<4}: mediana {summary['median']:8.0f} ns/op  "
+                  f"p95 {summary['p95']:8.0f}  IC95 [{summary['ci95'][0]:.0f}, {summary['ci95'][1]:.0f}]")
+    return results
+
+
+def write_json(path, meta, results):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+    print(f"Resultados guardados en {path}")
+
+
+# ----------------------- COMPARACIÓN -----------------------
+
+def compare(base_path, other_paths):
+    """
+    Imprime, por estructura/carga/n, la mediana de cada archivo y su cociente
+    respecto del primero. Marca con '*' los cambios cuyo IC95 no se solapa.
+    """
+    def load(path):
+        with open(path) as f:
+            doc = json.load(f)
+        table = {(r["structure"], r["workload"], r["n"]): r for r in doc["results"]}
+        return doc["meta"].get("git_rev") or path, table
+
+    base_label, base = load(base_path)
+    others = [load(p) for p in other_paths]
+    print(f"base: {base_label}")
+    for (structure, workload, n), ref in sorted(base.items()):
+        line = f"{workload:<14} {structure:<4} n={n}: {ref['median']:8.0f}"
+        for label, table in others:
+            row = table.get((structure, workload, n))
+            if row is None:
+                line += f" | {label}: -"
+                continue
+            ratio = row["median"] / ref["median"]
+            disjoint = row["ci95"][0] > ref["ci95"][1] or row["ci95"][1] < ref["ci95"][0]
+            line += f" | {label}: {row['median']:8.0f} ({ratio:.2f}x){'*' if disjoint else ''}"
+        print(line)
+
+
+def run_revisions(revisions, argv_rest, output_dir):
+    """
+    Mide cada revisión en un git worktree temporal ejecutando este mismo
+    script con PYTHONPATH apuntando a su carpeta wavl/, y luego compara.
+    """
+    script = os.path.abspath(__file__)
+    repo = subprocess.run(["git", "rev-parse", "--show-toplevel"], cwd=os.path.dirname(script),
+                          capture_output=True, text=True, check=True).stdout.strip()
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for rev in revisions:
+        workdir = tempfile.mkdtemp(prefix="bench_rev_")
+        subprocess.run(["git", "worktree", "add", "--detach", workdir, rev], cwd=repo, check=True)
+        try:
+            out = os.path.join(output_dir, f"bench_harness_{rev.replace('/', '_').replace('~', '-')}.json")
+            env = dict(os.environ, PYTHONPATH=os.path.join(workdir, "wavl"))
+            print(f"== {rev} ==")
+            subprocess.run([sys.executable, script, *argv_rest, "--output", out], env=env, check=True)
+            paths.append(out)
+        finally:
+            subprocess.run(["git", "worktree", "remove", "--force", workdir], cwd=repo)
+            shutil.rmtree(workdir, ignore_errors=True)
+    compare(paths[0], paths[1:])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Harness de benchmarks WAVL/AVL/RBT con estadística")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5])
+    parser.add_argument("--ops", type=int, default=10_000, help="operaciones por muestra")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--structures", nargs="+", default=list(STRUCTURES), choices=STRUCTURES)
+    parser.add_argument("--workloads", nargs="+", default=list(WORKLOADS), choices=list(WORKLOADS))
+    parser.add_argument("--trace", default=None,
+                        help="traza grabada (ver workloads.load_trace) medida como carga 'trace'")
+    parser.add_argument("--output", default="data/bench_harness.json")
+    parser.add_argument("--compare", nargs="+", metavar="JSON",
+                        help="compara archivos JSON ya generados (el primero es la base)")
+    parser.add_argument("--revisions", nargs="+", metavar="REV",
+                        help="mide cada revisión git en un worktree temporal y compara")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.compare[0], args.compare[1:])
+        sys.exit(0)
+
+    if args.revisions:
+        rest = ["--sizes", *map(str, args.sizes), "--ops", str(args.ops),
+                "--repeat", str(args.repeat), "--warmup", str(args.warmup), "--seed", str(args.seed),
+                "--structures", *args.structures, "--workloads", *args.workloads]
+        if args.trace:
+            rest += ["--trace", os.path.abspath(args.trace)]
+        run_revisions(args.revisions, rest, os.path.dirname(args.output) or ".")
+        sys.exit(0)
+
+    meta = {
+        "git_rev": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sizes": args.sizes,
+        "ops": args.ops,
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "trace": args.trace,
+    }
+    workloads = list(args.workloads)
+    if args.trace and "trace" not in workloads:
+        workloads.append("trace")
+    results = []
+    for n in args.sizes:
+        results.extend(run_harness(n, args.ops, args.repeat, args.warmup, args.seed,
+                                   args.structures, workloads, args.trace))
+    write_json(args.output, meta, results)
@@ -0,0 +1,213 @@
+# benchmarks/scripts/bench_latency.py
+#
+#   PYTHONPATH=wavl python3 wavl/benchmarks/scripts/bench_latency.py --sizes 100000 1000000
+#   python3 wavl/benchmarks/scripts/bench_latency.py --commit REV --sizes 100000 1000000 \
+#       --output wavl/benchmarks/data/bench_latency.csv     # REV contra su padre
+
+import argparse
+import csv
+import gc
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Operaciones que se comparan entre revisiones (columna <op>_ns)
+OPS = ("search", "insert", "delete", "insert_many", "delete_many")
+
+
+def structures():
+    # Importación diferida: con --revisions cada revisión importa sus
+    # árboles desde su worktree
+    from tree_wavl import WAVLTree
+    from avl import AVLTree
+    from rbt import RBTree
+    return {"wavl": WAVLTree, "avl": AVLTree, "rbt": RBTree}
+
+
+def search_recursive(node, key):
+    """
+    Búsqueda recursiva de referencia (la que usaban los árboles antes del
+    descenso iterativo). Solo se usa como línea base de comparación.
+    """
+    if node is None:
+        return None
+    if key == node.key:
+        return node
+    elif key < node.key:
+        return search_recursive(node.left, key)
+    else:
+        return search_recursive(node.right, key)
+
+
+def ns_per_op(fn, keys):
+    # Recolectar antes de medir: una pasada completa del GC sobre millones de
+    # nodos dentro de la ventana de tiempo distorsiona la media
+    gc.collect()
+    start = time.perf_counter_ns()
+    for key in keys:
+        fn(key)
+    return (time.perf_counter_ns() - start) / len(keys)
+
+
+def ns_per_op_checked(fn, keys):
+    """
+    Como ns_per_op, pero retorna None si la operación falla: las revisiones
+    anteriores a user-002 tienen un WAVLTree.delete que lanza
+    AttributeError, y con --revisions se miden igual.
+    """
+    try:
+        return ns_per_op(fn, keys)
+    except Exception as exc:
+        print(f"  {getattr(fn, '__qualname__', fn)} falla en esta revisión: {exc!r}")
+        return None
+
+
+def ns_per_key_batch(fn, keys):
+    gc.collect()
+    start = time.perf_counter_ns()
+    fn(keys)
+    return (time.perf_counter_ns() - start) / len(keys)
+
+
+def benchmark_latency(n, queries, seed=0):
+    """
+    Construye cada árbol con n claves aleatorias y mide la latencia media
+    (ns/op) de search iterativo vs recursivo, insert y delete, clave a clave
+    y en lote (insert_many/delete_many; vacío en revisiones sin lotes).
+    """
+    rng = random.Random(seed)
+    keys = rng.sample(range(1, n * 10 + 1), n)
+    lookups = [rng.choice(keys) for _ in range(queries)]
+    present = set(keys)
+    fresh = []
+    while len(fresh) < queries:
+        k = rng.randint(1, n * 10)
+        if k not in present:
+            present.add(k)
+            fresh.append(k)
+
+    rows = []
+    for name, cls in structures().items():
+        tree = cls()
+        for key in keys:
+            tree.insert(key)
+
+        search_iter = ns_per_op(tree.search, lookups)
+        search_rec = ns_per_op(lambda k: search_recursive(tree.root, k), lookups)
+        insert_ns = ns_per_op(tree.insert, fresh)
+        delete_ns = ns_per_op_checked(tree.delete, fresh)
+        # Tras un delete fallido el árbol queda inconsistente: sin lotes
+        batched = hasattr(tree, "insert_many") and delete_ns is not None
+        insert_many_ns = ns_per_key_batch(tree.insert_many, fresh) if batched else None
+        delete_many_ns = ns_per_key_batch(tree.delete_many, fresh) if batched else None
+
+        rows.append({
+            "n": n,
+            "structure": name,
+            "search_ns": round(search_iter, 1),
+            "search_rec_ns": round(search_rec, 1),
+            "search_speedup": round(search_rec / search_iter, 3),
+            "insert_ns": round(insert_ns, 1),
+            "delete_ns": delete_ns and round(delete_ns, 1),
+            "insert_many_ns": insert_many_ns and round(insert_many_ns, 1),
+            "delete_many_ns": delete_many_ns and round(delete_many_ns, 1),
+        })
+        delete = f"{delete_ns:.0f} ns" if delete_ns is not None else "falla"
+        batch = f" (lotes {insert_many_ns:.0f} / {delete_many_ns:.0f} ns)" if batched else ""
+        print(f"n={n} {name}: search {search_iter:.0f} ns (recursivo {search_rec:.0f} ns), "
+              f"insert {insert_ns:.0f} ns, delete {delete}{batch}")
+    return rows
+
+
+def write_csv(path, results):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, mode='w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def run_revisions(revisions, argv_rest, rounds):
+    """
+    Mide cada revisión en un git worktree temporal (como
+    bench_rebalance.py --revisions), alternándolas durante `rounds` rondas
+    y quedándose con la menor latencia de cada operación. Retorna una fila
+    por (revisión, n, estructura, operación) con `speedup` respecto de la
+    primera revisión (latencia vieja / nueva).
+    """
+    script = os.path.abspath(__file__)
+    repo = subprocess.run(["git", "rev-parse", "--show-toplevel"], cwd=os.path.dirname(script),
+                          capture_output=True, text=True, check=True).stdout.strip()
+    workdirs = {}
+    commits = {}
+    best = {}
+    try:
+        for rev in revisions:
+            commits[rev] = subprocess.run(["git", "rev-parse", "--short", rev], cwd=repo,
+                                          capture_output=True, text=True, check=True).stdout.strip()
+            workdirs[rev] = tempfile.mkdtemp(prefix="bench_rev_")
+            subprocess.run(["git", "worktree", "add", "--detach", workdirs[rev], rev], cwd=repo, check=True)
+        for r in range(rounds):
+            for rev in revisions:
+                out = os.path.join(workdirs[rev], "bench_latency.csv")
+                env = dict(os.environ, PYTHONPATH=os.path.join(workdirs[rev], "wavl"))
+                print(f"== {rev} (ronda {r + 1}/{rounds}) ==")
+                subprocess.run([sys.executable, script, *argv_rest, "--output", out], env=env, check=True)
+                with open(out, newline='') as f:
+                    for row in csv.DictReader(f):
+                        for op in OPS:
+                            if not row[f"{op}_ns"]:
+                                continue
+                            key = (rev, int(row["n"]), row["structure"], op)
+                            ns = float(row[f"{op}_ns"])
+                            best[key] = min(best.get(key, ns), ns)
+    finally:
+        for workdir in workdirs.values():
+            subprocess.run(["git", "worktree", "remove", "--force", workdir], cwd=repo)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    results = []
+    for (rev, n, structure, op), ns in best.items():
+        base = best.get((revisions[0], n, structure, op))
+        speedup = round(base / ns, 3) if base else None
+        results.append({"revision": rev, "commit": commits[rev], "n": n, "structure": structure,
+                        "op": op, "ns_per_op": ns, "speedup": speedup})
+        if rev != revisions[0] and speedup:
+            print(f"{rev} n={n} {structure} {op}: {base:.0f} -> {ns:.0f} ns ({speedup:.2f}x)")
+    return results
+
+
+def run_latency(sizes, queries, output_csv, seed=0):
+    results = []
+    for n in sizes:
+        print(f"Corriendo n={n}...")
+        results.extend(benchmark_latency(n, queries, seed))
+    write_csv(output_csv, results)
+    print(f"Resultados guardados en {output_csv}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latencia por operación (ns/op) de WAVL, AVL y RBT")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5, 10**6, 10**7])
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="data/bench_latency.csv")
+    parser.add_argument("--revisions", nargs="+", metavar="REV",
+                        help="mide cada revisión git en un worktree temporal y compara con la primera")
+    parser.add_argument("--commit", metavar="REV",
+                        help="atajo de --revisions REV~1 REV: mide un commit contra su padre")
+    parser.add_argument("--rounds", type=int, default=3, help="rondas alternadas con --revisions")
+    args = parser.parse_args()
+    if args.commit:
+        args.revisions = [f"{args.commit}~1", args.commit]
+
+    if args.revisions:
+        rest = ["--sizes", *map(str, args.sizes), "--queries", str(args.queries), "--seed", str(args.seed)]
+        write_csv(args.output, run_revisions(args.revisions, rest, args.rounds))
+        print(f"Resultados guardados en {args.output}")
+    else:
+        run_latency(args.sizes, args.queries, args.output, args.seed)
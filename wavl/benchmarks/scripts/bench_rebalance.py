@@ -0,0 +1,159 @@
+# benchmarks/scripts/bench_rebalance.py
+#
+#   PYTHONPATH=wavl python3 wavl/benchmarks/scripts/bench_rebalance.py
+#   python3 wavl/benchmarks/scripts/bench_rebalance.py --revisions BASE NUEVA --rounds 5
+#   python3 wavl/benchmarks/scripts/bench_rebalance.py --commit REV --rounds 5 \
+#       --output wavl/benchmarks/data/bench_rebalance.csv     # REV contra su padre
+
+import argparse
+import csv
+import gc
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def ops_per_sec(fn, keys, repeat):
+    """
+    Mejor de `repeat` pasadas de fn sobre todas las claves (operaciones por
+    segundo). `fn` recibe un árbol nuevo por pasada mediante setup().
+    """
+    best = 0.0
+    for _ in range(repeat):
+        tree = fn.setup()
+        gc.collect()
+        start = time.perf_counter()
+        fn(tree, keys)
+        elapsed = time.perf_counter() - start
+        best = max(best, len(keys) / elapsed)
+    return best
+
+
+def make_insert(WAVLTree):
+    def run(tree, keys):
+        insert = tree.insert
+        for key in keys:
+            insert(key)
+    run.setup = WAVLTree
+    return run
+
+
+def make_delete(WAVLTree, base_keys):
+    def run(tree, keys):
+        delete = tree.delete
+        for key in keys:
+            delete(key)
+    run.setup = lambda: WAVLTree.from_sorted(base_keys)
+    return run
+
+
+def benchmark_rebalance(n, repeat, seed=0):
+    """
+    Operaciones/segundo de WAVLTree.insert y delete, dominadas por el bucle
+    de rebalanceo (_fix_insert/_fix_delete).
+    """
+    # Importación diferida: con --revisions cada revisión importa su
+    # tree_wavl desde su worktree
+    from tree_wavl import WAVLTree
+
+    rng = random.Random(seed)
+    random_keys = rng.sample(range(n * 10), n)
+    sequential_keys = list(range(n))
+    delete_keys = random_keys[:]
+    rng.shuffle(delete_keys)
+
+    rows = [
+        ("insert_random", ops_per_sec(make_insert(WAVLTree), random_keys, repeat)),
+        ("insert_sequential", ops_per_sec(make_insert(WAVLTree), sequential_keys, repeat)),
+        ("delete_random", ops_per_sec(make_delete(WAVLTree, random_keys), delete_keys, repeat)),
+    ]
+    for name, ops in rows:
+        print(f"n={n} {name}: {ops:,.0f} ops/s")
+    return [{"n": n, "workload": name, "ops_per_sec": round(ops)} for name, ops in rows]
+
+
+def write_csv(path, results):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, mode='w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def run_revisions(revisions, argv_rest, rounds):
+    """
+    Mide cada revisión en un git worktree temporal (igual que
+    bench_harness.py --revisions) y retorna las filas con la columna
+    `revision` y `speedup` respecto de la primera revisión. Las revisiones
+    se alternan durante `rounds` rondas y se queda el mejor valor de cada
+    una, así una deriva de la máquina afecta a todas por igual.
+    """
+    script = os.path.abspath(__file__)
+    repo = subprocess.run(["git", "rev-parse", "--show-toplevel"], cwd=os.path.dirname(script),
+                          capture_output=True, text=True, check=True).stdout.strip()
+    workdirs = {}
+    commits = {}
+    best = {}
+    try:
+        for rev in revisions:
+            # El hash resuelto queda en el CSV: una referencia relativa
+            # (HEAD~1, REV~1) deja de identificar la revisión tras un rebase
+            commits[rev] = subprocess.run(["git", "rev-parse", "--short", rev], cwd=repo,
+                                          capture_output=True, text=True, check=True).stdout.strip()
+            workdirs[rev] = tempfile.mkdtemp(prefix="bench_rev_")
+            subprocess.run(["git", "worktree", "add", "--detach", workdirs[rev], rev], cwd=repo, check=True)
+        for r in range(rounds):
+            for rev in revisions:
+                out = os.path.join(workdirs[rev], "bench_rebalance.csv")
+                env = dict(os.environ, PYTHONPATH=os.path.join(workdirs[rev], "wavl"))
+                print(f"== {rev} (ronda {r + 1}/{rounds}) ==")
+                subprocess.run([sys.executable, script, *argv_rest, "--output", out], env=env, check=True)
+                with open(out, newline='') as f:
+                    for row in csv.DictReader(f):
+                        key = (rev, int(row["n"]), row["workload"])
+                        best[key] = max(best.get(key, 0), int(row["ops_per_sec"]))
+    finally:
+        for workdir in workdirs.values():
+            subprocess.run(["git", "worktree", "remove", "--force", workdir], cwd=repo)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    results = []
+    for (rev, n, workload), ops in best.items():
+        speedup = ops / best[(revisions[0], n, workload)]
+        results.append({"revision": rev, "commit": commits[rev], "n": n, "workload": workload,
+                        "ops_per_sec": ops, "speedup": round(speedup, 3)})
+        if rev != revisions[0]:
+            print(f"{rev} n={n} {workload}: {speedup:.2f}x")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark del rebalanceo WAVL (ops/s)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**4, 10**5])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="CSV opcional con los resultados")
+    parser.add_argument("--revisions", nargs="+", metavar="REV",
+                        help="mide cada revisión git en un worktree temporal y compara con la primera")
+    parser.add_argument("--commit", metavar="REV",
+                        help="atajo de --revisions REV~1 REV: mide un commit contra su padre")
+    parser.add_argument("--rounds", type=int, default=3, help="rondas alternadas con --revisions")
+    args = parser.parse_args()
+    if args.commit:
+        args.revisions = [f"{args.commit}~1", args.commit]
+
+    if args.revisions:
+        rest = ["--sizes", *map(str, args.sizes), "--repeat", str(args.repeat), "--seed", str(args.seed)]
+        results = run_revisions(args.revisions, rest, args.rounds)
+    else:
+        results = []
+        for n in args.sizes:
+            results.extend(benchmark_rebalance(n, args.repeat, args.seed))
+
+    if args.output:
+        write_csv(args.output, results)
+        print(f"Resultados guardados en {args.output}")
@@ -0,0 +1,82 @@
+# benchmarks/scripts/bench_search_cache.py
+#
+# Efecto de SearchCache (search_cache.py) sobre trazas de workloads.py con
+# lecturas sesgadas (Zipf): solo lecturas y read_heavy (95/2.5/2.5). Compara
+# el árbol sin caché con LRU y CLOCK de varios tamaños; reporta ops/s (mejor
+# de --repeat pasadas, cada una sobre un árbol nuevo) y la tasa de aciertos.
+
+import argparse
+import csv
+import gc
+import os
+import time
+from tree_wavl import WAVLTree
+from search_cache import SearchCache
+from workloads import mixed_trace, random_keys, replay
+
+TRACES = {
+    "zipf_reads": dict(read=1.0, insert=0.0),
+    "read_heavy": dict(read=0.95, insert=0.025),
+}
+
+
+def run_trace(keys, trace, policy, size, repeat):
+    """
+    Retorna (ops/s, stats de la caché o None) de la mejor pasada.
+    """
+    best, stats = float("inf"), None
+    for _ in range(repeat):
+        tree = WAVLTree.from_sorted(keys)
+        cache = SearchCache(tree, size, policy) if policy else None
+        if cache is not None:
+            cache.enable()
+        gc.disable()
+        start = time.perf_counter()
+        replay(tree, trace)
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        if elapsed < best:
+            best = elapsed
+            stats = cache.stats() if cache is not None else None
+    return len(trace) / best, stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Caché de búsqueda LRU/CLOCK delante de WAVLTree.search")
+    parser.add_argument("--n", type=int, default=1_000_000, help="claves iniciales del árbol")
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--skew", type=float, nargs="+", default=[0.8, 1.1, 1.3])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 4096])
+    parser.add_argument("--policies", nargs="+", default=["lru", "clock"], choices=["lru", "clock"])
+    parser.add_argument("--traces", nargs="+", default=list(TRACES), choices=list(TRACES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="data/bench_search_cache.csv")
+    args = parser.parse_args()
+
+    keys = random_keys(args.n, args.seed)
+    configs = [(None, 0)] + [(policy, size) for policy in args.policies for size in args.sizes]
+    results = []
+    for name in args.traces:
+        for skew in args.skew:
+            trace = mixed_trace(keys, args.ops, args.seed, skew=skew, **TRACES[name])
+            base = None
+            for policy, size in configs:
+                rate, stats = run_trace(keys, trace, policy, size, args.repeat)
+                base = base or rate
+                hit_ratio = stats["hit_ratio"] if stats else 0.0
+                results.append({"n": args.n, "trace": name, "skew": skew,
+                                "policy": policy or "none", "size": size,
+                                "ops_per_sec": round(rate), "speedup": round(rate / base, 2),
+                                "hit_ratio": round(hit_ratio, 4),
+                                "invalidations": stats["invalidations"] if stats else 0})
+                label = f"{policy} {size}" if policy else "sin caché"
+                print(f"{name:>10} s={skew}: {label:>12}: {rate:,.0f} ops/s ({rate / base:.2f}x), "
+                      f"aciertos {hit_ratio:.1%}")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, mode='w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Resultados guardados en {args.output}")
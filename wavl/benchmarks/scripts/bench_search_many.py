@@ -0,0 +1,65 @@
+# benchmarks/scripts/bench_search_many.py
+
+import argparse
+import csv
+import os
+import time
+import numpy as np
+from tree_wavl import WAVLTree
+from avl import AVLTree
+from rbt import RBTree
+
+STRUCTURES = {"wavl": WAVLTree, "avl": AVLTree, "rbt": RBTree}
+
+
+def benchmark_batch(tree_cls, n, batch, seed=0):
+    """
+    Segundos para resolver la pertenencia de `batch` claves sobre un árbol de
+    n claves (la mitad presentes): bucle de search(), primer search_many
+    (incluye aplanar el árbol) y search_many con el arreglo ya cacheado.
+    """
+    rng = np.random.default_rng(seed)
+    tree = tree_cls.from_sorted(range(0, 2 * n, 2))
+    probes = rng.integers(0, 2 * n, batch)
+
+    search = tree.search
+    keys = probes.tolist()
+    start = time.perf_counter()
+    [search(key) is not None for key in keys]
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree.search_many(probes)
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree.search_many(probes)
+    cached = time.perf_counter() - start
+    return loop, first, cached
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="search_many vectorizado vs bucle de search")
+    parser.add_argument("--n", type=int, default=200_000)
+    parser.add_argument("--batches", type=int, nargs="+", default=[100, 10_000, 1_000_000])
+    parser.add_argument("--structures", nargs="+", default=list(STRUCTURES), choices=list(STRUCTURES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="data/bench_search_many.csv")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.structures:
+        for batch in args.batches:
+            loop, first, cached = benchmark_batch(STRUCTURES[name], args.n, batch, args.seed)
+            results.append({"structure": name, "n": args.n, "batch": batch, "loop_s": round(loop, 5),
+                            "search_many_s": round(first, 5), "cached_s": round(cached, 5),
+                            "speedup_cached": round(loop / cached, 1)})
+            print(f"{name} lote={batch}: bucle {loop:.4f}s, search_many {first:.4f}s, "
+                  f"cacheado {cached:.4f}s ({loop / cached:.1f}x)")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, mode='w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Resultados guardados en {args.output}")
@@ -0,0 +1,112 @@
+# benchmarks/scripts/bench_server.py
+#
+# Generador de carga para server_wavl.py: `--connections` clientes con
+# `depth` pedidos en vuelo cada uno (pipelining) contra localhost. Mide
+# throughput y latencia por pedido (desde el envío hasta la respuesta).
+# Sin --port/--unix levanta el servidor en un proceso aparte.
+
+import argparse
+import asyncio
+import csv
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from tree_wavl import WAVLTree
+from server_wavl import WAVLServer, WAVLClient
+from instrumentation import LogHistogram
+
+
+def _serve(path, preload, ready):
+    async def main():
+        server = WAVLServer(WAVLTree.from_sorted(range(0, 2 * preload, 2)))
+        await server.start(path=path)
+        ready.set()
+        await server.serve_forever()
+    asyncio.run(main())
+
+
+async def run_load(connect, connections, depth, ops, read_fraction, key_space, seed=0):
+    """
+    Ejecuta `ops` pedidos en total (búsquedas con probabilidad
+    `read_fraction`, el resto inserciones/eliminaciones mitad y mitad) y
+    retorna (pedidos/s, histograma de latencia en µs).
+    """
+    clients = [await WAVLClient.connect(**connect) for _ in range(connections)]
+    histogram = LogHistogram()
+    per_worker = ops // (connections * depth)
+
+    async def worker(client, w):
+        rng = random.Random(seed + w)
+        for _ in range(per_worker):
+            key = rng.randrange(key_space)
+            r = rng.random()
+            start = time.perf_counter_ns()
+            if r < read_fraction:
+                await client.search(key)
+            elif r < (1 + read_fraction) / 2:
+                await client.insert(key)
+            else:
+                await client.delete(key)
+            histogram.record((time.perf_counter_ns() - start) // 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(client, c * depth + d)
+                           for c, client in enumerate(clients) for d in range(depth)))
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        await client.close()
+    return per_worker * connections * depth / elapsed, histogram
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Carga contra el servidor asyncio de WAVLTree")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="servidor TCP ya iniciado")
+    parser.add_argument("--unix", default=None, help="socket Unix de un servidor ya iniciado")
+    parser.add_argument("--preload", type=int, default=100_000, help="claves del servidor propio")
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 8, 32],
+                        help="pedidos en vuelo por conexión")
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--reads", type=float, default=0.9)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="data/bench_server.csv")
+    args = parser.parse_args()
+
+    server = None
+    if args.port is not None:
+        connect = {"host": args.host, "port": args.port}
+    elif args.unix is not None:
+        connect = {"path": args.unix}
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "wavl.sock")
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(target=_serve, args=(path, args.preload, ready), daemon=True)
+        server.start()
+        ready.wait()
+        connect = {"path": path}
+
+    results = []
+    try:
+        for depth in args.depths:
+            rate, hist = asyncio.run(run_load(connect, args.connections, depth, args.ops,
+                                              args.reads, 2 * args.preload, args.seed))
+            stats = hist.summary()
+            results.append({"connections": args.connections, "depth": depth, "read_fraction": args.reads,
+                            "ops_per_sec": round(rate), "p50_us": stats["p50"], "p99_us": stats["p99"],
+                            "p99.9_us": stats["p99.9"], "max_us": stats["max"]})
+            print(f"profundidad {depth:>3}: {rate:,.0f} pedidos/s, p50 {stats['p50']} µs, "
+                  f"p99 {stats['p99']} µs, p99.9 {stats['p99.9']} µs")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, mode='w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Resultados guardados en {args.output}")
@@ -0,0 +1,59 @@
+# benchmarks/scripts/bench_sharded.py
+
+import argparse
+import csv
+import os
+import random
+import time
+from sharded_wavl import ShardedWAVL
+
+
+def benchmark_processes(n, processes, batch, seed=0):
+    """
+    Throughput de inserción (claves/s) de un ShardedWAVL con `processes`
+    shards: n claves aleatorias uniformes enviadas con insert_many en lotes
+    de `batch`. No incluye el arranque de los procesos.
+    """
+    rng = random.Random(seed)
+    keys = [rng.randrange(2 ** 32) for _ in range(n)]
+    with ShardedWAVL(processes, key_range=(0, 2 ** 32)) as tree:
+        start = time.perf_counter()
+        for i in range(0, n, batch):
+            tree.insert_many(keys[i:i + batch])
+        elapsed = time.perf_counter() - start
+        assert len(tree) == n
+    return n / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput de inserción de ShardedWAVL según número de procesos")
+    parser.add_argument("--n", type=int, default=500_000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--batch", type=int, default=50_000, help="claves por insert_many")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None,
+                        help="CSV de salida (por defecto data/bench_sharded_<cpus>cpu.csv)")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count()
+    # Un archivo por cantidad de núcleos: datos de 1 CPU no pasan por escalamiento
+    args.output = args.output or f"data/bench_sharded_{cpus}cpu.csv"
+    print(f"CPUs disponibles: {cpus}")
+    if cpus < max(args.processes):
+        print(f"Aviso: con {cpus} CPU(s) los procesos comparten núcleos; "
+              f"el speedup no mide el escalamiento de {max(args.processes)} procesos")
+    results = []
+    base = None
+    for processes in args.processes:
+        rate = benchmark_processes(args.n, processes, args.batch, args.seed)
+        base = base or rate
+        results.append({"n": args.n, "processes": processes, "batch": args.batch, "cpus": cpus,
+                        "keys_per_sec": round(rate), "speedup": round(rate / base, 3)})
+        print(f"{processes} procesos: {rate:,.0f} claves/s ({rate / base:.2f}x)")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, mode='w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Resultados guardados en {args.output}")
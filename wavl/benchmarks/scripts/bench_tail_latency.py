@@ -0,0 +1,83 @@
+# benchmarks/scripts/bench_tail_latency.py
+
+import argparse
+import csv
+import gc
+import os
+import random
+from tree_wavl import WAVLTree
+from avl import AVLTree
+from rbt import RBTree
+from instrumentation import Instrumentation
+from workloads import STREAMS, key_stream
+
+STRUCTURES = {
+    "wavl": WAVLTree,
+    "avl": AVLTree,
+    "rbt": RBTree,
+}
+
+
+def benchmark_tail(n, mode, seed=0):
+    """
+    Inserta n claves del flujo `mode` y luego las elimina en orden aleatorio
+    con la instrumentación activa. Retorna una fila por estructura y
+    operación con los percentiles de latencia (ns), pasos de rebalanceo y
+    rotaciones por llamada.
+    """
+    keys = key_stream(mode, n, seed)
+    victims = keys[:]
+    random.Random(seed + 1).shuffle(victims)
+
+    rows = []
+    for name, cls in STRUCTURES.items():
+        tree = cls()
+        inst = Instrumentation(tree, operations=("insert", "delete"))
+        gc.collect()
+        with inst:
+            for key in keys:
+                tree.insert(key)
+            for key in victims:
+                tree.delete(key)
+
+        for op, report in inst.report().items():
+            latency, steps, rotations = report["latency"], report["steps"], report["rotations"]
+            rows.append({
+                "n": n,
+                "mode": mode,
+                "structure": name,
+                "op": op,
+                "p50_ns": latency["p50"],
+                "p99_ns": latency["p99"],
+                "p99_9_ns": latency["p99.9"],
+                "max_ns": latency["max"],
+                "steps_p99_9": steps["p99.9"],
+                "steps_max": steps["max"],
+                "rotations_max": rotations["max"],
+            })
+            print(f"n={n} {mode} {name} {op}: p50 {latency['p50']} ns, p99 {latency['p99']} ns, "
+                  f"p99.9 {latency['p99.9']} ns, max {latency['max']} ns, "
+                  f"pasos máx {steps['max']}, rotaciones máx {rotations['max']}")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latencia de cola (p99/p99.9) por operación")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5])
+    parser.add_argument("--modes", nargs="+", default=["random", "sequential", "zipf"],
+                        choices=list(STREAMS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="data/bench_tail_latency.csv")
+    args = parser.parse_args()
+
+    results = []
+    for mode in args.modes:
+        for n in args.sizes:
+            results.extend(benchmark_tail(n, mode, args.seed))
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, mode='w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Resultados guardados en {args.output}")
@@ -1,30 +1,89 @@
 # benchmarks/scripts/bench_wavl_vs_avl_rbt.py
 
-import random
+import argparse
+import math
 import time
+import tracemalloc
 import csv
 import os
+import sys
 from tree_wavl import WAVLTree
 from avl import AVLTree
 from rbt import RBTree  # Supongamos que tienes tu propia implementación de RBT
+from bplus_tree import BPlusTree
+from workloads import STREAMS, key_stream
 
-import sys
-sys.setrecursionlimit(10**6)   
 
 def measure_height(root):
-
+    # Recorrido iterativo por niveles: no depende del límite de recursión
     if root is None:
         return -1
-    return 1 + max(measure_height(root.left), measure_height(root.right))
+    height = -1
+    level = [root]
+    while level:
+        height += 1
+        next_level = []
+        for node in level:
+            if node.left is not None:
+                next_level.append(node.left)
+            if node.right is not None:
+                next_level.append(node.right)
+        level = next_level
+    return height
+
+
+def measure_bytes_per_key(tree_cls, keys):
+    """
+    Bytes asignados por clave al construir el árbol (tracemalloc).
+    Se mide en una pasada aparte porque tracemalloc ralentiza las inserciones.
+    Las claves ya existen en `keys`, así que solo se cuentan los nodos.
+    """
+    tracemalloc.start()
+    tree = tree_cls()
+    base, _ = tracemalloc.get_traced_memory()
+    for key in keys:
+        tree.insert(key)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (current - base) / len(keys)
+
+
+def measure_bulk_time(tree_cls, keys):
+    """
+    Tiempo de construcción con from_sorted (carga masiva O(n), incluye el sort).
+    """
+    start = time.time()
+    tree_cls.from_sorted(keys)
+    return time.time() - start
+
 
+def measure_order_stats_time(tree_cls, keys):
+    """
+    Tiempo de las mismas inserciones con order_stats=True, para medir el
+    costo de mantener los tamaños de subárbol (comparar con *_time).
+    """
+    tree = tree_cls(order_stats=True)
+    start = time.time()
+    for key in keys:
+        tree.insert(key)
+    return time.time() - start
 
-def benchmark_structures(n, mode="random"):
 
-    # 1) Generar lista de claves según el modo
-    if mode == "random":
-        keys = random.sample(range(1, n * 10 + 1), n)
-    else:  # "sequential"
-        keys = list(range(1, n + 1))
+def measure_search_time(tree, keys):
+    """
+    Tiempo de buscar todas las claves (carga de solo lectura, todas presentes).
+    """
+    search = tree.search
+    start = time.time()
+    for key in keys:
+        search(key)
+    return time.time() - start
+
+
+def benchmark_structures(n, mode="random", seed=0):
+
+    # 1) Generar lista de claves según el modo (ver workloads.STREAMS)
+    keys = key_stream(mode, n, seed)
 
     # --- WAVL ---
     wavl = WAVLTree()
@@ -70,6 +129,14 @@ def benchmark_structures(n, mode="random"):
     r_rot = rbt.rotation_count
     r_col = rbt.recolor_count
 
+    # --- B+-tree (hojas como arreglos ordenados; sin rotaciones) ---
+    bplus = BPlusTree()
+
+    start = time.time()
+    for key in keys:
+        bplus.insert(key)
+    insert_time_bplus = time.time() - start
+
     return {
         "n": n,
         "mode": mode,
@@ -79,27 +146,57 @@ def benchmark_structures(n, mode="random"):
         "wavl_rotations": w_rot,
         "wavl_height": height_wavl,
         "wavl_time": insert_time_wavl,
+        "wavl_os_time": measure_order_stats_time(WAVLTree, keys),
+        "wavl_search_time": measure_search_time(wavl, keys),
+        "wavl_bulk_time": measure_bulk_time(WAVLTree, keys),
+        "wavl_bytes_per_key": measure_bytes_per_key(WAVLTree, keys),
         # AVL métricas
         "avl_rotations": a_rot,
         "avl_height": height_avl,
         "avl_time": insert_time_avl,
+        "avl_os_time": measure_order_stats_time(AVLTree, keys),
+        "avl_search_time": measure_search_time(avl, keys),
+        "avl_bulk_time": measure_bulk_time(AVLTree, keys),
+        "avl_bytes_per_key": measure_bytes_per_key(AVLTree, keys),
         # RBT métricas
         "rbt_rotations": r_rot,
         "rbt_recolors": r_col,
         "rbt_height": height_rbt,
-        "rbt_time": insert_time_rbt
+        "rbt_time": insert_time_rbt,
+        "rbt_os_time": measure_order_stats_time(RBTree, keys),
+        "rbt_search_time": measure_search_time(rbt, keys),
+        "rbt_bulk_time": measure_bulk_time(RBTree, keys),
+        "rbt_bytes_per_key": measure_bytes_per_key(RBTree, keys),
+        # B+-tree métricas (altura = niveles de nodos, con fanout 64)
+        "bplus_splits": bplus.split_count,
+        "bplus_height": bplus.height(),
+        "bplus_time": insert_time_bplus,
+        "bplus_search_time": measure_search_time(bplus, keys),
+        "bplus_bulk_time": measure_bulk_time(BPlusTree, keys),
+        "bplus_bytes_per_key": measure_bytes_per_key(BPlusTree, keys),
     }
 
 
-def run_benchmarks(sizes, modes, output_csv):
+def wavl_height_bound(n):
+    """
+    Cota de altura de un WAVL con n nodos: h <= rank(raíz) <= 2·log2(n).
+    """
+    return 2 * math.log2(n) if n > 1 else 0
+
+
+def run_benchmarks(sizes, modes, output_csv, check_height=False, seed=0):
     results = []
+    violations = []
 
     for mode in modes:
         for n in sizes:
             print(f"Corriendo n={n}, mode={mode}...")
-            data = benchmark_structures(n, mode)
+            data = benchmark_structures(n, mode, seed)
             results.append(data)
 
+            if check_height and data["wavl_height"] > wavl_height_bound(n):
+                violations.append(data)
+
     # Guardar en CSV
     os.makedirs(os.path.dirname(output_csv), exist_ok=True)
     with open(output_csv, mode='w', newline='') as f:
@@ -111,11 +208,24 @@ def run_benchmarks(sizes, modes, output_csv):
 
     print(f"Resultados guardados en {output_csv}")
 
+    # Modo regresión: falla si algún WAVL supera la cota 2·log2(n)
+    for data in violations:
+        print(f"ERROR: altura WAVL {data['wavl_height']} > 2·log2(n) = "
+              f"{wavl_height_bound(data['n']):.2f} (n={data['n']}, mode={data['mode']})")
+    if violations:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de inserciones WAVL vs AVL vs RBT vs B+-tree")
     # Definir tamaños de prueba
-    sizes = [1000, 5000, 10000, 20000]
-    # Modos: "random" y "sequential"
-    modes = ["random", "sequential"]
-    output_file = "data/bench_wavl_avl_rbt.csv"
-    run_benchmarks(sizes, modes, output_file)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 20000])
+    # Modos: flujos de claves de workloads.py (random, sequential, zipf, ...)
+    parser.add_argument("--modes", nargs="+", default=["random", "sequential"],
+                        choices=list(STREAMS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="data/bench_wavl_avl_rbt.csv")
+    parser.add_argument("--check-height", action="store_true",
+                        help="termina con error si la altura WAVL supera 2·log2(n)")
+    args = parser.parse_args()
+    run_benchmarks(args.sizes, args.modes, args.output, args.check_height, args.seed)
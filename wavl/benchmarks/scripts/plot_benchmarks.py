@@ -5,10 +5,11 @@ import matplotlib.pyplot as plt
 import os
 
 def plot_metric(df, mode, metric_wavl, metric_avl, metric_rbt,
-                ylabel, title, output_png):
+                ylabel, title, output_png, metric_bplus=None):
     """
     Dibuja en un mismo gráfico WAVL vs AVL vs RBT para el 'mode' dado,
-    usando las columnas metric_wavl, metric_avl, metric_rbt.
+    usando las columnas metric_wavl, metric_avl, metric_rbt (y el B+-tree
+    con metric_bplus, si el CSV la trae).
     Guarda el PNG en output_png.
     """
     sub = df[df["mode"] == mode]
@@ -18,6 +19,8 @@ def plot_metric(df, mode, metric_wavl, metric_avl, metric_rbt,
     plt.plot(xs, sub[metric_wavl], marker='o', label='WAVL')
     plt.plot(xs, sub[metric_avl], marker='s', label='AVL')
     plt.plot(xs, sub[metric_rbt], marker='^', label='RBT')
+    if metric_bplus is not None and metric_bplus in sub:
+        plt.plot(xs, sub[metric_bplus], marker='D', label='B+-tree')
     plt.xlabel('n (número de inserciones)')
     plt.ylabel(ylabel)
     plt.title(f"{title} ({mode})")
@@ -76,7 +79,8 @@ if __name__ == "__main__":
         metric_rbt="rbt_height",
         ylabel="Altura del árbol",
         title="Altura comparada",
-        output_png="benchmarks/plots/height_random.png"
+        output_png="benchmarks/plots/height_random.png",
+        metric_bplus="bplus_height"
     )
     plot_metric(
         df, mode="sequential",
@@ -85,7 +89,8 @@ if __name__ == "__main__":
         metric_rbt="rbt_height",
         ylabel="Altura del árbol",
         title="Altura comparada",
-        output_png="benchmarks/plots/height_sequential.png"
+        output_png="benchmarks/plots/height_sequential.png",
+        metric_bplus="bplus_height"
     )
 
     # 4) Comparar tiempo de inserción
@@ -96,7 +101,8 @@ if __name__ == "__main__":
         metric_rbt="rbt_time",
         ylabel="Tiempo (segundos)",
         title="Tiempo de inserción",
-        output_png="benchmarks/plots/time_random.png"
+        output_png="benchmarks/plots/time_random.png",
+        metric_bplus="bplus_time"
     )
     plot_metric(
         df, mode="sequential",
@@ -105,7 +111,22 @@ if __name__ == "__main__":
         metric_rbt="rbt_time",
         ylabel="Tiempo (segundos)",
         title="Tiempo de inserción",
-        output_png="benchmarks/plots/time_sequential.png"
+        output_png="benchmarks/plots/time_sequential.png",
+        metric_bplus="bplus_time"
     )
 
+    # 5) Comparar tiempo de búsqueda (carga de solo lectura)
+    if "bplus_search_time" in df:
+        for mode in ["random", "sequential"]:
+            plot_metric(
+                df, mode=mode,
+                metric_wavl="wavl_search_time",
+                metric_avl="avl_search_time",
+                metric_rbt="rbt_search_time",
+                ylabel="Tiempo (segundos)",
+                title="Tiempo de búsqueda",
+                output_png=f"benchmarks/plots/search_time_{mode}.png",
+                metric_bplus="bplus_search_time"
+            )
+
     print("Gráficos generados en benchmarks/plots/")
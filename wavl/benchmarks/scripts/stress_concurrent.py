@@ -0,0 +1,113 @@
+# benchmarks/scripts/stress_concurrent.py
+#
+# Prueba de estrés de ConcurrentWAVLTree: escritores y lectores compiten
+# durante `--seconds` y se verifican invariantes bajo contención. Termina con
+# código 1 si alguna falla.
+
+import argparse
+import random
+import sys
+import threading
+import time
+from tree_wavl import WAVLTree
+from concurrent_wavl import ConcurrentWAVLTree
+from utils_wavl import is_valid_wavl
+
+
+def run_stress(readers, writers, seconds, stable, churn, seed=0):
+    """
+    - Claves pares 0..2*stable: se insertan antes y nunca se borran; todo
+      lector debe encontrarlas siempre.
+    - Claves impares: cada escritor inserta y borra las de su propio
+      subconjunto, y lleva su modelo exacto.
+    - Los lectores verifican además que range() venga ordenado y, de vez en
+      cuando, las invariantes WAVL completas dentro de reading().
+    """
+    stable_keys = list(range(0, 2 * stable, 2))
+    tree = ConcurrentWAVLTree(WAVLTree.from_sorted(stable_keys, order_stats=True))
+    deadline = time.monotonic() + seconds
+    errors = []
+    counts = [0] * (readers + writers)
+    models = [set() for _ in range(writers)]
+
+    def writer(w):
+        rng = random.Random(seed + w)
+        own = [k for k in range(1, 2 * churn, 2) if (k // 2) % writers == w]
+        model = models[w]
+        ops = 0
+        while time.monotonic() < deadline:
+            key = rng.choice(own)
+            if key in model:
+                tree.delete(key)
+                model.discard(key)
+            else:
+                tree.insert(key)
+                model.add(key)
+            ops += 1
+        counts[readers + w] = ops
+
+    def reader(r):
+        rng = random.Random(seed + 1000 + r)
+        ops = 0
+        while time.monotonic() < deadline and not errors:
+            key = rng.choice(stable_keys)
+            if key not in tree:
+                errors.append(f"lector {r}: clave estable {key} no encontrada")
+            if ops % 64 == 0:
+                lo = rng.randrange(2 * stable)
+                keys = tree.range(lo, lo + 200)
+                if keys != sorted(keys):
+                    errors.append(f"lector {r}: range({lo}) desordenado")
+                with tree.reading() as t:
+                    if t.count_range(lo, lo + 200) != len(list(t.range(lo, lo + 200))):
+                        errors.append(f"lector {r}: count_range inconsistente")
+            if ops % 2048 == 0:
+                with tree.reading() as t:
+                    if not is_valid_wavl(t.root):
+                        errors.append(f"lector {r}: invariantes WAVL rotas")
+            ops += 1
+        counts[r] = ops
+
+    def guarded(target, i):
+        # Una excepción en un hilo también es una falla del estrés
+        try:
+            target(i)
+        except Exception as exc:
+            errors.append(f"{target.__name__} {i}: {exc!r}")
+
+    threads = [threading.Thread(target=guarded, args=(reader, r)) for r in range(readers)]
+    threads += [threading.Thread(target=guarded, args=(writer, w)) for w in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Estado final: claves estables + la unión de los modelos de escritores
+    expected = sorted(set(stable_keys).union(*models))
+    if tree.keys() != expected:
+        errors.append("el contenido final no coincide con el modelo")
+    with tree.reading() as t:
+        if not is_valid_wavl(t.root) or t.root.size != len(expected):
+            errors.append("invariantes o tamaños finales inválidos")
+
+    print(f"lecturas: {sum(counts[:readers])}, escrituras: {sum(counts[readers:])}, "
+          f"errores: {len(errors)}")
+    return errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estrés concurrente de ConcurrentWAVLTree")
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--stable", type=int, default=10_000)
+    parser.add_argument("--churn", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Cambios de hilo frecuentes para provocar más intercalaciones
+    sys.setswitchinterval(1e-5)
+    errors = run_stress(args.readers, args.writers, args.seconds, args.stable, args.churn, args.seed)
+    for error in errors[:20]:
+        print("ERROR:", error)
+    sys.exit(1 if errors else 0)
@@ -0,0 +1,229 @@
+# benchmarks/scripts/workloads.py
+#
+# Generadores de cargas de trabajo para los benchmarks. Todas las funciones
+# reciben `seed` y usan su propio random.Random: la misma semilla produce
+# siempre la misma secuencia, sin tocar el estado global de `random`.
+#
+# - Flujos de claves (listas de enteros): key_stream(nombre, n, seed)
+# - Trazas de operaciones: listas de pares (op, clave) con op en
+#   SEARCH / INSERT / DELETE, que se aplican con replay(tree, traza)
+# - Trazas en archivo: una operación por línea, "<op> <clave>", donde op es
+#   s/i/d (o search/insert/delete); líneas vacías y '#' se ignoran.
+
+import bisect
+import itertools
+import random
+
+SEARCH = "search"
+INSERT = "insert"
+DELETE = "delete"
+
+_OP_CODES = {"s": SEARCH, "i": INSERT, "d": DELETE,
+             SEARCH: SEARCH, INSERT: INSERT, DELETE: DELETE}
+
+
+# ----------------------- FLUJOS DE CLAVES -----------------------
+
+def random_keys(n, seed=0):
+    # n claves distintas en orden aleatorio (lo que usaban los benchmarks)
+    return random.Random(seed).sample(range(1, n * 10 + 1), n)
+
+
+def sequential_keys(n, seed=0):
+    return list(range(1, n + 1))
+
+
+def descending_keys(n, seed=0):
+    return list(range(n, 0, -1))
+
+
+def zipf_weights(universe, s=1.1):
+    # Pesos acumulados de Zipf: la clave de popularidad i tiene peso 1 / i^s
+    return list(itertools.accumulate(1.0 / (i ** s) for i in range(1, universe + 1)))
+
+
+def zipf_keys(n, seed=0, universe=None, s=1.1):
+    """
+    n claves (con repeticiones) con popularidad Zipf de exponente `s` sobre
+    `universe` claves distintas (por defecto n). Las claves populares se
+    reparten al azar por el rango, no quedan juntas al principio.
+    """
+    rng = random.Random(seed)
+    universe = universe or n
+    ids = rng.sample(range(1, universe * 10 + 1), universe)
+    cum = zipf_weights(universe, s)
+    return [ids[i] for i in _sample_ranks(rng, cum, n)]
+
+
+def _sample_ranks(rng, cum, k):
+    # Muestreo por inversión sobre pesos acumulados, O(log universo) por clave
+    total = cum[-1]
+    last = len(cum) - 1
+    return [min(bisect.bisect_left(cum, rng.random() * total), last) for _ in range(k)]
+
+
+def clustered_keys(n, seed=0, clusters=16, spread=None):
+    """
+    n claves distintas agrupadas alrededor de `clusters` centros elegidos al
+    azar (desvío normal `spread`), en orden aleatorio.
+    """
+    rng = random.Random(seed)
+    span = n * 10
+    spread = spread or max(1, n // (clusters * 2))
+    centers = [rng.randrange(span) for _ in range(clusters)]
+    seen = set()
+    keys = []
+    while len(keys) < n:
+        key = int(rng.gauss(rng.choice(centers), spread))
+        if key not in seen:
+            seen.add(key)
+            keys.append(key)
+    return keys
+
+
+def sawtooth_keys(n, seed=0, teeth=8):
+    """
+    n claves distintas en `teeth` subidas sucesivas: cada diente recorre de
+    forma ascendente todo el rango y el siguiente vuelve a empezar abajo.
+    """
+    per_tooth = -(-n // teeth)
+    keys = [j * teeth + t for t in range(teeth) for j in range(per_tooth)]
+    return keys[:n]
+
+
+def k_swaps_keys(n, seed=0, k=None):
+    """
+    Claves 1..n ordenadas salvo `k` intercambios de pares al azar (casi
+    ordenadas). Por defecto k = n / 100.
+    """
+    rng = random.Random(seed)
+    keys = list(range(1, n + 1))
+    k = max(1, n // 100) if k is None else k
+    for _ in range(k):
+        i, j = rng.randrange(n), rng.randrange(n)
+        keys[i], keys[j] = keys[j], keys[i]
+    return keys
+
+
+STREAMS = {
+    "random": random_keys,
+    "sequential": sequential_keys,
+    "descending": descending_keys,
+    "zipf": zipf_keys,
+    "clustered": clustered_keys,
+    "sawtooth": sawtooth_keys,
+    "k_swaps": k_swaps_keys,
+}
+
+
+def key_stream(name, n, seed=0, **params):
+    # Flujo de claves por nombre (ver STREAMS); `params` van al generador
+    return STREAMS[name](n, seed=seed, **params)
+
+
+# ----------------------- TRAZAS DE OPERACIONES -----------------------
+
+def sliding_window_trace(keys, window):
+    """
+    Inserta cada clave de `keys` y, en cuanto hay más de `window` vivas,
+    elimina la más antigua (ventana deslizante, como una caché por tiempo).
+    """
+    trace = []
+    for i, key in enumerate(keys):
+        trace.append((INSERT, key))
+        if i >= window:
+            trace.append((DELETE, keys[i - window]))
+    return trace
+
+
+def mixed_trace(initial_keys, ops, seed=0, read=0.95, insert=0.025, skew=None):
+    """
+    Traza de `ops` operaciones sobre un árbol que ya contiene `initial_keys`:
+    fracción `read` de búsquedas, `insert` de inserciones de claves nuevas y
+    el resto eliminaciones de claves vivas. Con `skew` (exponente Zipf) las
+    búsquedas se concentran en unas pocas claves calientes; si no, son
+    uniformes. El conjunto de claves vivas se sigue para que cada búsqueda y
+    eliminación apunte a una clave presente.
+    """
+    rng = random.Random(seed)
+    live = list(initial_keys)
+    rng.shuffle(live)
+    used = set(live)
+    top = (max(live) if live else 0) * 2 + ops * 10 + 1
+
+    # Popularidad por posición en `live` (las eliminaciones mueven claves,
+    # así que la popularidad es aproximada, como en un sistema real)
+    cum = zipf_weights(len(live), skew) if skew and live else None
+
+    trace = []
+    for _ in range(ops):
+        r = rng.random()
+        if r < read and live:
+            if cum is not None:
+                i = _sample_ranks(rng, cum, 1)[0]
+                key = live[i] if i < len(live) else rng.choice(live)
+            else:
+                key = rng.choice(live)
+            trace.append((SEARCH, key))
+        elif r < read + insert or not live:
+            key = rng.randrange(1, top)
+            while key in used:
+                key = rng.randrange(1, top)
+            used.add(key)
+            live.append(key)
+            trace.append((INSERT, key))
+        else:
+            # Quitar una clave viva en O(1): se mueve la última a su lugar
+            i = rng.randrange(len(live))
+            key = live[i]
+            live[i] = live[-1]
+            live.pop()
+            trace.append((DELETE, key))
+    return trace
+
+
+def read_heavy_trace(initial_keys, ops, seed=0, skew=1.1):
+    # 95% búsquedas (sesgo Zipf), 2.5% inserciones y 2.5% eliminaciones
+    return mixed_trace(initial_keys, ops, seed, read=0.95, insert=0.025, skew=skew)
+
+
+def write_heavy_trace(initial_keys, ops, seed=0, skew=None):
+    # 10% búsquedas, 45% inserciones y 45% eliminaciones
+    return mixed_trace(initial_keys, ops, seed, read=0.10, insert=0.45, skew=skew)
+
+
+# ----------------------- REPRODUCCIÓN -----------------------
+
+def replay(tree, trace):
+    """
+    Aplica `trace` (iterable de pares (op, clave)) sobre `tree` y retorna el
+    número de operaciones aplicadas.
+    """
+    methods = {SEARCH: tree.search, INSERT: tree.insert, DELETE: tree.delete}
+    count = 0
+    for op, key in trace:
+        methods[op](key)
+        count += 1
+    return count
+
+
+def save_trace(path, trace):
+    with open(path, "w") as f:
+        for op, key in trace:
+            f.write(f"{op[0]} {key}\n")
+
+
+def load_trace(path):
+    """
+    Lee una traza grabada en `path` de forma perezosa (sirve para archivos
+    más grandes que la memoria). Lanza ValueError ante una línea inválida.
+    """
+    with open(path) as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split()
+            if len(parts) != 2 or parts[0].lower() not in _OP_CODES:
+                raise ValueError(f"{path}:{lineno}: línea de traza inválida: {line!r}")
+            yield _OP_CODES[parts[0].lower()], int(parts[1])
@@ -0,0 +1,313 @@
+# wavl/bplus_tree.py
+
+from bisect import bisect_left, insort
+from typing import Optional
+
+
+class NodeBPlus:
+    """
+    Nodo de B+-tree:
+    - keys: lista ordenada. En una hoja son las claves; en un nodo interno,
+      los separadores (keys[i] separa children[i] de children[i + 1]).
+    - children: hijos (None en las hojas)
+    - next: hoja siguiente en orden (solo hojas), para recorridos secuenciales
+    Invariante (admite claves repetidas): toda clave de children[i] es
+    <= keys[i] <= toda clave de children[i + 1].
+    """
+    __slots__ = ("keys", "children", "next")
+
+    def __init__(self, keys=None, children=None):
+        self.keys: list = keys if keys is not None else []
+        self.children: Optional[list] = children
+        self.next: Optional[NodeBPlus] = None
+
+    def __repr__(self):
+        kind = "hoja" if self.children is None else "interno"
+        return f"NodeBPlus({kind}, keys={self.keys[:4]}{'...' if len(self.keys) > 4 else ''})"
+
+
+def _fill(node: NodeBPlus) -> int:
+    # Ocupación: claves en una hoja, hijos en un nodo interno
+    return len(node.keys) if node.children is None else len(node.children)
+
+
+def _chunk_bounds(n: int, fanout: int):
+    # Reparte n elementos en ceil(n / fanout) grupos de tamaños casi iguales
+    groups = -(-n // fanout)
+    base, extra = divmod(n, groups)
+    start = 0
+    for g in range(groups):
+        stop = start + base + (1 if g < extra else 0)
+        yield start, stop
+        start = stop
+
+
+def _chunks(keys: list, fanout: int):
+    for start, stop in _chunk_bounds(len(keys), fanout):
+        yield keys[start:stop]
+
+
+class BPlusTree:
+    """
+    B+-tree con la misma API que WAVLTree (search, insert, delete, range,
+    insert_many, delete_many, from_sorted, iteración):
+    - `fanout`: máximo de claves por hoja y de hijos por nodo interno. Todo
+      nodo salvo la raíz tiene al menos fanout // 2.
+    - Las hojas son listas contiguas que se buscan con bisect y están
+      enlazadas, así range() e iter() recorren listas en vez de perseguir
+      punteros nodo a nodo.
+    - Instrumentación: split_count y merge_count (nodos partidos/fusionados).
+    Las claves repetidas se permiten, como en WAVLTree.
+    """
+
+    def __init__(self, fanout: int = 64):
+        if fanout < 4:
+            raise ValueError("fanout debe ser al menos 4")
+        self.fanout = fanout
+        self.root = NodeBPlus()
+        self.size = 0
+        self.split_count = 0
+        self.merge_count = 0
+
+    @classmethod
+    def from_sorted(cls, iterable, fanout: int = 64) -> "BPlusTree":
+        """
+        Construye el árbol de abajo hacia arriba en O(n): hojas llenas en
+        partes iguales y luego cada nivel interno sobre el anterior.
+        """
+        keys = sorted(iterable)
+        tree = cls(fanout)
+        if not keys:
+            return tree
+
+        level = [NodeBPlus(part) for part in _chunks(keys, fanout)]
+        for left, right in zip(level, level[1:]):
+            left.next = right
+        # Mínimo de cada subárbol: es el separador que lo antecede
+        mins = [leaf.keys[0] for leaf in level]
+        while len(level) > 1:
+            parents, parent_mins = [], []
+            for start, stop in _chunk_bounds(len(level), fanout):
+                parents.append(NodeBPlus(mins[start + 1:stop], level[start:stop]))
+                parent_mins.append(mins[start])
+            level, mins = parents, parent_mins
+        tree.root = level[0]
+        tree.size = len(keys)
+        return tree
+
+    def __len__(self) -> int:
+        return self.size
+
+    def height(self) -> int:
+        # Niveles por debajo de la raíz (una sola hoja = 0)
+        height = 0
+        node = self.root
+        while node.children is not None:
+            node = node.children[0]
+            height += 1
+        return height
+
+    # -------------------- SEARCH --------------------
+
+    def _find_leaf(self, key) -> NodeBPlus:
+        # bisect_left: baja al hijo más a la izquierda que puede contener `key`
+        node = self.root
+        while node.children is not None:
+            node = node.children[bisect_left(node.keys, key)]
+        return node
+
+    def search(self, key) -> Optional[NodeBPlus]:
+        """
+        Retorna la hoja que contiene `key`, o None si no existe.
+        """
+        # Descenso inline (sin llamar a _find_leaf): es el camino más caliente
+        leaf = self.root
+        while leaf.children is not None:
+            leaf = leaf.children[bisect_left(leaf.keys, key)]
+        keys = leaf.keys
+        i = bisect_left(keys, key)
+        if i < len(keys):
+            return leaf if keys[i] == key else None
+        # Todas las claves de la hoja son menores: `key` solo puede ser la
+        # primera de la siguiente
+        leaf = leaf.next
+        return leaf if leaf is not None and leaf.keys[0] == key else None
+
+    def __contains__(self, key) -> bool:
+        return self.search(key) is not None
+
+    # -------------------- INSERT --------------------
+
+    def insert(self, key):
+        path = []
+        node = self.root
+        while node.children is not None:
+            i = bisect_left(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        insort(node.keys, key)
+        self.size += 1
+        if len(node.keys) > self.fanout:
+            self._split(node, path)
+
+    def _split(self, node: NodeBPlus, path: list):
+        """
+        Parte `node` por la mitad y sube el separador al padre; repite
+        mientras el padre se desborde. Si se parte la raíz, crece un nivel.
+        """
+        while True:
+            mid = len(node.keys) // 2
+            if node.children is None:
+                right = NodeBPlus(node.keys[mid:])
+                del node.keys[mid:]
+                right.next = node.next
+                node.next = right
+                separator = right.keys[0]
+            else:
+                separator = node.keys[mid]
+                right = NodeBPlus(node.keys[mid + 1:], node.children[mid + 1:])
+                del node.keys[mid:]
+                del node.children[mid + 1:]
+            self.split_count += 1
+
+            if not path:
+                self.root = NodeBPlus([separator], [node, right])
+                return
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, right)
+            if len(parent.children) <= self.fanout:
+                return
+            node = parent
+
+    def insert_many(self, keys):
+        for key in sorted(keys):
+            self.insert(key)
+
+    # -------------------- DELETE --------------------
+
+    def delete(self, key):
+        """
+        Elimina una ocurrencia de `key` (si existe) y corrige los nodos que
+        queden por debajo de fanout // 2 pidiendo prestado a un hermano o
+        fusionándose con él.
+        """
+        path = []
+        node = self.root
+        while node.children is not None:
+            i = bisect_left(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+
+        i = bisect_left(node.keys, key)
+        if i == len(node.keys):
+            # Igual que en search: la ocurrencia puede abrir la hoja siguiente
+            if node.next is None or node.next.keys[0] != key:
+                return
+            node = self._advance(path)
+            i = 0
+        elif node.keys[i] != key:
+            return
+
+        del node.keys[i]
+        self.size -= 1
+        self._fix_underflow(node, path)
+
+    def _advance(self, path: list) -> NodeBPlus:
+        # Mueve el camino `path` a la hoja siguiente y la retorna
+        while True:
+            parent, i = path.pop()
+            if i + 1 < len(parent.children):
+                break
+        path.append((parent, i + 1))
+        node = parent.children[i + 1]
+        while node.children is not None:
+            path.append((node, 0))
+            node = node.children[0]
+        return node
+
+    def _fix_underflow(self, node: NodeBPlus, path: list):
+        minimum = self.fanout // 2
+        while path:
+            is_leaf = node.children is None
+            if _fill(node) >= minimum:
+                return
+            parent, i = path.pop()
+            children = parent.children
+            left = children[i - 1] if i > 0 else None
+            right = children[i + 1] if i + 1 < len(children) else None
+
+            if left is not None and _fill(left) > minimum:
+                # Préstamo desde la izquierda
+                if is_leaf:
+                    node.keys.insert(0, left.keys.pop())
+                    parent.keys[i - 1] = node.keys[0]
+                else:
+                    node.keys.insert(0, parent.keys[i - 1])
+                    node.children.insert(0, left.children.pop())
+                    parent.keys[i - 1] = left.keys.pop()
+                return
+            if right is not None and _fill(right) > minimum:
+                # Préstamo desde la derecha
+                if is_leaf:
+                    node.keys.append(right.keys.pop(0))
+                    parent.keys[i] = right.keys[0]
+                else:
+                    node.keys.append(parent.keys[i])
+                    node.children.append(right.children.pop(0))
+                    parent.keys[i] = right.keys.pop(0)
+                return
+
+            # Fusión con un hermano (queda en el de la izquierda)
+            j = i - 1 if left is not None else i
+            left, right = children[j], children[j + 1]
+            if is_leaf:
+                left.keys.extend(right.keys)
+                left.next = right.next
+            else:
+                left.keys.append(parent.keys[j])
+                left.keys.extend(right.keys)
+                left.children.extend(right.children)
+            del parent.keys[j]
+            del children[j + 1]
+            self.merge_count += 1
+            node = parent
+
+        # La raíz interna con un solo hijo desaparece (el árbol baja un nivel)
+        if self.root.children is not None and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+
+    def delete_many(self, keys):
+        for key in sorted(keys):
+            self.delete(key)
+
+    # -------------------- RECORRIDOS --------------------
+
+    def _first_leaf(self) -> NodeBPlus:
+        node = self.root
+        while node.children is not None:
+            node = node.children[0]
+        return node
+
+    def __iter__(self):
+        leaf = self._first_leaf()
+        while leaf is not None:
+            yield from leaf.keys
+            leaf = leaf.next
+
+    def range(self, lo=None, hi=None):
+        """
+        Genera en orden las claves k con lo <= k < hi (None = sin cota).
+        """
+        if lo is None:
+            leaf, i = self._first_leaf(), 0
+        else:
+            leaf = self._find_leaf(lo)
+            i = bisect_left(leaf.keys, lo)
+        while leaf is not None:
+            keys = leaf.keys
+            if hi is not None and keys and keys[-1] >= hi:
+                yield from keys[i:bisect_left(keys, hi, i)]
+                return
+            yield from keys[i:]
+            leaf, i = leaf.next, 0
@@ -0,0 +1,161 @@
+# wavl/concurrent_wavl.py
+
+import threading
+from contextlib import contextmanager
+from tree_wavl import WAVLTree
+
+
+class RWLock:
+    """
+    Lock lectores-escritor con preferencia de escritura: varios lectores a
+    la vez o un solo escritor. Un escritor en espera bloquea a los lectores
+    nuevos, así un flujo continuo de lecturas no lo deja sin turno.
+    No es reentrante.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentWAVLTree:
+    """
+    Envoltorio thread-safe de un WAVLTree (u otro árbol con la misma API):
+    las consultas toman el lock de lectura y pueden correr en paralelo; las
+    mutaciones toman el de escritura.
+
+    Cada método es atómico. Para varias lecturas consistentes entre sí (una
+    vista fija del árbol) se usa `with t.reading() as tree:`; dentro del
+    bloque ningún escritor puede modificarlo. Los recorridos (iter, range)
+    se materializan en una lista bajo el lock, porque un generador no puede
+    retener el lock de forma segura.
+
+    `search` retorna el nodo como WAVLTree, pero su contenido solo es
+    estable mientras se tiene el lock (una eliminación puede copiarle la
+    clave del sucesor): fuera de reading() conviene usar `key in t`.
+    """
+
+    def __init__(self, tree=None):
+        self.tree = tree if tree is not None else WAVLTree()
+        self.lock = RWLock()
+
+    @contextmanager
+    def reading(self):
+        with self.lock.read_locked():
+            yield self.tree
+
+    @contextmanager
+    def writing(self):
+        with self.lock.write_locked():
+            yield self.tree
+
+    # ----------------------- LECTURAS -----------------------
+
+    def search(self, key):
+        with self.lock.read_locked():
+            return self.tree.search(key)
+
+    def __contains__(self, key) -> bool:
+        with self.lock.read_locked():
+            return self.tree.search(key) is not None
+
+    def floor(self, key):
+        with self.lock.read_locked():
+            return self.tree.floor(key)
+
+    def ceiling(self, key):
+        with self.lock.read_locked():
+            return self.tree.ceiling(key)
+
+    def successor(self, key):
+        with self.lock.read_locked():
+            return self.tree.successor(key)
+
+    def predecessor(self, key):
+        with self.lock.read_locked():
+            return self.tree.predecessor(key)
+
+    def range(self, lo=None, hi=None) -> list:
+        with self.lock.read_locked():
+            return list(self.tree.range(lo, hi))
+
+    def keys(self) -> list:
+        with self.lock.read_locked():
+            return list(self.tree)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def select(self, i: int):
+        with self.lock.read_locked():
+            return self.tree.select(i)
+
+    def rank(self, key) -> int:
+        with self.lock.read_locked():
+            return self.tree.rank(key)
+
+    def count_range(self, lo=None, hi=None) -> int:
+        with self.lock.read_locked():
+            return self.tree.count_range(lo, hi)
+
+    # ----------------------- ESCRITURAS -----------------------
+
+    def insert(self, key):
+        with self.lock.write_locked():
+            self.tree.insert(key)
+
+    def delete(self, key):
+        with self.lock.write_locked():
+            self.tree.delete(key)
+
+    def insert_many(self, keys):
+        # Un lote completo bajo un solo lock de escritura
+        with self.lock.write_locked():
+            self.tree.insert_many(keys)
+
+    def delete_many(self, keys):
+        with self.lock.write_locked():
+            self.tree.delete_many(keys)
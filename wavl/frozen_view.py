@@ -0,0 +1,120 @@
+# wavl/frozen_view.py
+#
+# Vista de solo lectura de un árbol con las claves en un arreglo contiguo
+# (lista ordenada). Pensada para fases de "construir una vez, consultar
+# mucho": las consultas son búsquedas binarias en C (bisect) y los
+# recorridos son slices de la lista, sin perseguir punteros nodo a nodo.
+# La crea tree.freeze() (ver OrderedTreeMixin), que la cachea hasta la
+# próxima inserción o eliminación del árbol.
+
+import bisect
+
+
+def eytzinger_layout(keys: list) -> list:
+    """
+    Reordena `keys` (ordenadas) en el orden BFS de un árbol binario
+    implícito (Eytzinger): la raíz en la posición 1 y los hijos de k en 2k
+    y 2k + 1. La posición 0 no se usa. La búsqueda recorre posiciones
+    contiguas en los primeros niveles y no necesita punteros.
+    """
+    n = len(keys)
+    layout = [None] * (n + 1)
+    source = iter(keys)
+    # Recorrido in-order del árbol implícito: asigna las claves en orden
+    stack = []
+    k = 1
+    while stack or k <= n:
+        while k <= n:
+            stack.append(k)
+            k = 2 * k
+        k = stack.pop()
+        layout[k] = next(source)
+        k = 2 * k + 1
+    return layout
+
+
+class FrozenView:
+    """
+    Vista inmutable de las claves de un árbol, en orden:
+
+    - `key in view`, `len(view)`, `iter(view)`, `reversed(view)`
+    - `search(key)`, `floor`, `ceiling`, `range(lo, hi)`, `count_range`,
+      `select(i)`, `rank(key)`, todos en O(log n) (o O(log n + k))
+    - con `eytzinger=True`, `search`/`in` usan además el layout BFS
+
+    No se actualiza: refleja el árbol del momento en que se creó.
+    """
+
+    __slots__ = ("_keys", "_layout")
+
+    def __init__(self, keys: list, eytzinger: bool = False):
+        self._keys = keys
+        self._layout = eytzinger_layout(keys) if eytzinger else None
+
+    @property
+    def eytzinger(self) -> bool:
+        return self._layout is not None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __reversed__(self):
+        return reversed(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return self.search(key)
+
+    def search(self, key) -> bool:
+        layout = self._layout
+        if layout is None:
+            keys = self._keys
+            i = bisect.bisect_left(keys, key)
+            return i < len(keys) and keys[i] == key
+        # Baja por el árbol implícito; al salir, k codifica el camino y el
+        # último giro a la izquierda (primer bit 0 desde abajo) es el
+        # sucesor >= key
+        n = len(layout) - 1
+        k = 1
+        while k <= n:
+            k = 2 * k + (layout[k] < key)
+        k >>= (~k & (k + 1)).bit_length()
+        return k != 0 and layout[k] == key
+
+    def floor(self, key):
+        # Mayor clave <= key, o None
+        i = bisect.bisect_right(self._keys, key)
+        return self._keys[i - 1] if i > 0 else None
+
+    def ceiling(self, key):
+        # Menor clave >= key, o None
+        i = bisect.bisect_left(self._keys, key)
+        return self._keys[i] if i < len(self._keys) else None
+
+    def range(self, lo=None, hi=None):
+        # Claves k con lo <= k < hi (None = sin cota), en orden
+        keys = self._keys
+        start = 0 if lo is None else bisect.bisect_left(keys, lo)
+        end = len(keys) if hi is None else bisect.bisect_left(keys, hi)
+        return iter(keys[start:end])
+
+    def count_range(self, lo=None, hi=None) -> int:
+        keys = self._keys
+        start = 0 if lo is None else bisect.bisect_left(keys, lo)
+        end = len(keys) if hi is None else bisect.bisect_left(keys, hi)
+        return max(0, end - start)
+
+    def select(self, i: int):
+        # i-ésima clave más pequeña (i negativo cuenta desde el final)
+        n = len(self._keys)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice fuera de rango")
+        return self._keys[i]
+
+    def rank(self, key) -> int:
+        # Número de claves estrictamente menores que `key`
+        return bisect.bisect_left(self._keys, key)
@@ -0,0 +1,249 @@
+# wavl/instrumentation.py
+#
+# Instrumentación opcional por operación para WAVLTree, AVLTree, RBTree y
+# ArrayWAVLTree: latencia, largo del rebalanceo y rotaciones de cada llamada,
+# acumulados en histogramas logarítmicos (estilo HDR).
+#
+# No cambia el código de los árboles: enable() envuelve los métodos en la
+# instancia y disable() repone lo que había antes. Un árbol sin instrumentar
+# (o ya deshabilitado) ejecuta exactamente los métodos originales de la clase.
+# Se puede combinar con otros envoltorios por instancia (search_cache.py):
+# cada uno envuelve el atributo actual y se pueden desactivar en cualquier
+# orden (ver restore_wrappers).
+
+import time
+
+# Contadores de pasos de rebalanceo que puede tener cada árbol: en WAVL una
+# cascada de promociones suma un paso por nivel; en RBT los recoloreos
+# crecen igual con la altura recorrida.
+STEP_COUNTERS = ("promote_count", "demote_count", "recolor_count")
+
+
+def install_wrapper(tree, op, wrapper, owner):
+    """
+    Pone `wrapper` como atributo `op` de la instancia `tree`. El envoltorio
+    recuerda el atributo previo de la instancia (o None) y la activación de
+    `owner` que lo creó (owner._token): cuando esa activación termina queda
+    muerto y restore_wrappers lo puede sacar de la cadena.
+    """
+    wrapper._previous = tree.__dict__.get(op)
+    wrapper._owner = owner
+    wrapper._token = owner._token
+    setattr(tree, op, wrapper)
+
+
+def _is_dead(wrapper) -> bool:
+    owner = getattr(wrapper, "_owner", None)
+    return owner is not None and owner._token is not wrapper._token
+
+
+def restore_wrappers(tree, ops):
+    """
+    Desenrolla los envoltorios muertos de la cima de cada atributo `op` de
+    `tree`, reponiendo lo que había debajo. Un envoltorio muerto que quedó
+    debajo de uno vivo pasa de largo hasta que el de encima se desactiva, y
+    entonces se quita también; al desactivar todos, la instancia vuelve a
+    exponer exactamente los métodos de la clase.
+    """
+    for op in ops:
+        current = tree.__dict__.get(op)
+        while current is not None and _is_dead(current):
+            current = current._previous
+            if current is None:
+                del tree.__dict__[op]
+            else:
+                tree.__dict__[op] = current
+
+
+class LogHistogram:
+    """
+    Histograma de enteros no negativos con buckets log-lineales: cada
+    potencia de dos se divide en 2**sub_bucket_bits buckets lineales, así
+    que el error relativo de cualquier percentil es < 1 / 2**sub_bucket_bits
+    con memoria O(log(max)). Los valores menores que 2**sub_bucket_bits se
+    guardan exactos.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 4):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: list[int] = []
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self.sub_bucket_bits - 1
+        if shift <= 0:
+            return value
+        # (shift + 1) bloques completos + posición de la mantisa en su bloque
+        return ((shift + 1) << self.sub_bucket_bits) + (value >> shift) - (1 << self.sub_bucket_bits)
+
+    def _upper_bound(self, index: int) -> int:
+        # Mayor valor que cae en el bucket `index`
+        sub = 1 << self.sub_bucket_bits
+        if index < 2 * sub:
+            return index
+        shift = (index >> self.sub_bucket_bits) - 1
+        mantissa = (index & (sub - 1)) + sub
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int):
+        index = self._index(value)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.total += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "LogHistogram"):
+        # Suma los conteos de `other` (con el mismo sub_bucket_bits)
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("los histogramas deben tener el mismo sub_bucket_bits")
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.total += other.total
+        self.sum += other.sum
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float) -> int:
+        """
+        Valor bajo el cual cae el q% de las muestras (q en [0, 100]). Retorna
+        el límite superior de su bucket, acotado por el máximo observado.
+        """
+        if self.total == 0:
+            return 0
+        target = max(1, -(-self.total * q // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "count": self.total,
+            "mean": round(self.mean(), 1),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p99.9": self.percentile(99.9),
+            "max": self.max or 0,
+        }
+
+
+class Instrumentation:
+    """
+    Mide cada llamada a las operaciones `operations` de `tree`:
+    - latency[op]: ns por llamada (perf_counter_ns)
+    - steps[op]: pasos de rebalanceo (promociones + demociones, o recoloreos)
+    - rotations[op]: rotaciones por llamada
+
+    Uso:
+        inst = Instrumentation(tree)
+        with inst:                 # o inst.enable() / inst.disable()
+            for key in keys:
+                tree.insert(key)
+        print(inst.report()["insert"]["latency"]["p99.9"])
+    """
+
+    OPERATIONS = ("insert", "delete", "search")
+
+    def __init__(self, tree, operations=OPERATIONS, sub_bucket_bits: int = 4):
+        self.tree = tree
+        self.operations = tuple(operations)
+        self.step_counters = tuple(name for name in STEP_COUNTERS if hasattr(tree, name))
+        self.latency = {op: LogHistogram(sub_bucket_bits) for op in self.operations}
+        self.steps = {op: LogHistogram(sub_bucket_bits) for op in self.operations}
+        self.rotations = {op: LogHistogram(sub_bucket_bits) for op in self.operations}
+        self.enabled = False
+        # _token identifica la activación vigente: un envoltorio de una
+        # activación anterior que quedó debajo de otro pasa de largo
+        self._token = None
+
+    def enable(self):
+        if self.enabled:
+            return
+        tree = self.tree
+        self._token = object()
+        for op in self.operations:
+            # Se envuelve el atributo actual (quizá ya envuelto por otro)
+            install_wrapper(tree, op, self._wrap(op, getattr(tree, op)), self)
+        self.enabled = True
+
+    def disable(self):
+        # Repone lo que había antes de enable()
+        if not self.enabled:
+            return
+        self._token = None
+        restore_wrappers(self.tree, self.operations)
+        self.enabled = False
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.disable()
+        return False
+
+    def _wrap(self, op, original):
+        tree = self.tree
+        counters = self.step_counters
+        has_rotations = hasattr(tree, "rotation_count")
+        latency, steps, rotations = self.latency[op], self.steps[op], self.rotations[op]
+        clock = time.perf_counter_ns
+        token = self._token
+
+        def instrumented(*args, **kwargs):
+            if self._token is not token:
+                return original(*args, **kwargs)
+            # Los contadores se leen fuera de la ventana de tiempo
+            steps_before = sum(getattr(tree, name) for name in counters)
+            rotations_before = tree.rotation_count if has_rotations else 0
+            start = clock()
+            result = original(*args, **kwargs)
+            elapsed = clock() - start
+            latency.record(elapsed)
+            steps.record(sum(getattr(tree, name) for name in counters) - steps_before)
+            if has_rotations:
+                rotations.record(tree.rotation_count - rotations_before)
+            return result
+
+        instrumented.__wrapped__ = original
+        return instrumented
+
+    def reset(self):
+        for table in (self.latency, self.steps, self.rotations):
+            for op in table:
+                table[op] = LogHistogram(table[op].sub_bucket_bits)
+        if self.enabled:
+            # Los envoltorios guardan referencias a los histogramas viejos
+            self.disable()
+            self.enable()
+
+    def report(self) -> dict:
+        # Resumen por operación: {op: {"latency": {...}, "steps": {...}, "rotations": {...}}}
+        return {
+            op: {
+                "latency": self.latency[op].summary(),
+                "steps": self.steps[op].summary(),
+                "rotations": self.rotations[op].summary(),
+            }
+            for op in self.operations
+            if self.latency[op].total
+        }
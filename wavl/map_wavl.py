@@ -0,0 +1,260 @@
+# wavl/map_wavl.py
+
+from typing import Optional
+from node_wavl import NodeWAVL
+from tree_wavl import WAVLTree
+from utils_bst import build_balanced, climb_for, add_size, first_node, next_node
+
+_MISSING = object()
+
+
+class NodeWAVLMap(NodeWAVL):
+    # Nodo WAVL con un valor asociado a la clave
+    __slots__ = ("value",)
+
+    def __init__(self, key, value=None):
+        super().__init__(key)
+        self.value = value
+
+    def __repr__(self):
+        left_k = self.left.key if self.left else None
+        right_k = self.right.key if self.right else None
+        return (f"NodeWAVLMap(key={self.key}, value={self.value!r}, rank={self.rank}, "
+                f"left={left_k}, right={right_k})")
+
+
+class WAVLMap(WAVLTree):
+    """
+    Diccionario ordenado clave → valor sobre WAVLTree. A diferencia del árbol
+    de claves, una clave repetida no crea otro nodo: se actualiza su valor
+    (upsert). Se recorre en orden de clave y hereda range/floor/ceiling,
+    split/join y las estadísticas de orden.
+
+    `get` recuerda el último nodo encontrado: consultar varias veces seguidas
+    la misma clave cuesta O(1). Ese atajo se invalida en cada eliminación,
+    porque un nodo con dos hijos recibe la clave de su sucesor.
+    """
+
+    def __init__(self, order_stats: bool = False):
+        super().__init__(order_stats)
+        self._count: Optional[int] = 0  # None = desconocido (tras split)
+        self._last: Optional[NodeWAVLMap] = None
+
+    @classmethod
+    def from_sorted(cls, items, order_stats: bool = False) -> "WAVLMap":
+        """
+        Construye el mapa en O(n) a partir de pares (clave, valor) ordenados
+        por clave (si no lo están, se ordenan primero). Con claves repetidas
+        gana el último valor, como en dict.
+        """
+        merged = {}
+        for key, value in items:
+            merged[key] = value
+        pairs = sorted(merged.items(), key=lambda item: item[0])
+
+        def make_node(item, size, depth):
+            node = NodeWAVLMap(item[0], item[1])
+            node.rank = size.bit_length() - 1
+            node.size = size
+            return node
+
+        tree = cls(order_stats)
+        tree.root = build_balanced(pairs, make_node)
+        tree._count = len(pairs)
+        return tree
+
+    def save(self, path):
+        # El snapshot solo guarda claves enteras: perdería los valores
+        raise TypeError("los snapshots son para árboles de solo claves; WAVLMap guarda valores")
+
+    @classmethod
+    def load(cls, path, mmap: bool = True):
+        raise TypeError("los snapshots son para árboles de solo claves; WAVLMap guarda valores")
+
+    # ----------------------- CONSULTA -----------------------
+
+    def get(self, key, default=None):
+        # Sin asignar memoria: solo comparaciones y lectura de punteros
+        last = self._last
+        if last is not None and last.key == key:
+            return last.value
+        node = self.root
+        while node is not None:
+            if key == node.key:
+                self._last = node
+                return node.value
+            node = node.left if key < node.key else node.right
+        return default
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = sum(1 for _ in self)
+        return self._count
+
+    def items(self):
+        node = first_node(self.root)
+        while node is not None:
+            yield node.key, node.value
+            node = next_node(node)
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        node = first_node(self.root)
+        while node is not None:
+            yield node.value
+            node = next_node(node)
+
+    # ----------------------- INSERCIÓN -----------------------
+
+    def _find_or_attach(self, start: NodeWAVLMap, key, value):
+        """
+        Baja desde `start` buscando `key`. Si ya existe retorna (nodo, False);
+        si no, cuelga una hoja nueva con `value`, rebalancea y retorna
+        (hoja, True).
+        """
+        node = start
+        while True:
+            if key == node.key:
+                return node, False
+            if key < node.key:
+                if node.left is None:
+                    new_node = NodeWAVLMap(key, value)
+                    node.left = new_node
+                    break
+                node = node.left
+            else:
+                if node.right is None:
+                    new_node = NodeWAVLMap(key, value)
+                    node.right = new_node
+                    break
+                node = node.right
+
+        new_node.parent = node
+        if self.order_stats:
+            add_size(node, 1)
+        self._version += 1
+        if self._count is not None:
+            self._count += 1
+        self._fix_insert(new_node)
+        return new_node, True
+
+    def __setitem__(self, key, value):
+        if self.root is None:
+            self.root = self._last = NodeWAVLMap(key, value)
+            self._version += 1
+            self._count = 1
+            return
+        node, created = self._find_or_attach(self.root, key, value)
+        if not created:
+            node.value = value
+        self._last = node
+
+    def _insert_from(self, start, key) -> NodeWAVLMap:
+        # Como en WAVLTree, pero con semántica de upsert (valor None si es nueva)
+        if self.root is None:
+            self[key] = None
+            return self.root
+        node, _ = self._find_or_attach(self.root if start is None else start, key, None)
+        self._last = node
+        return node
+
+    def insert(self, key, value=None):
+        # Upsert: equivale a self[key] = value
+        self[key] = value
+
+    def setdefault(self, key, default=None):
+        """
+        Retorna el valor de `key`; si no existe lo inserta con `default`
+        (una sola bajada por el árbol).
+        """
+        if self.root is None:
+            self[key] = default
+            return default
+        node, _ = self._find_or_attach(self.root, key, default)
+        self._last = node
+        return node.value
+
+    def insert_many(self, items):
+        """
+        Upsert de un lote de pares (clave, valor) en una sola pasada ordenada
+        por clave, partiendo cada vez del nodo anterior (finger).
+        """
+        finger = None
+        for key, value in sorted(items, key=lambda item: item[0]):
+            if self.root is None:
+                self[key] = value
+                finger = self.root
+                continue
+            start = self.root if finger is None else climb_for(finger, key)
+            finger, created = self._find_or_attach(start, key, value)
+            if not created:
+                finger.value = value
+
+    # ----------------------- ELIMINACIÓN -----------------------
+
+    def _remove_node(self, node: NodeWAVLMap):
+        # Con dos hijos el nodo hereda clave y valor de su sucesor
+        if node.left is not None and node.right is not None:
+            succ = node.right
+            while succ.left:
+                succ = succ.left
+            node.key, node.value = succ.key, succ.value
+            node = succ
+        self._last = None
+        if self._count is not None:
+            self._count -= 1
+        return super()._remove_node(node)
+
+    def pop(self, key, default=_MISSING):
+        """
+        Elimina `key` y retorna su valor. Si no existe retorna `default`, o
+        lanza KeyError si no se indicó.
+        """
+        node = self.search(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = node.value
+        child, parent = self._remove_node(node)
+        self._fix_delete(child, parent)
+        return value
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    # ----------------------- SPLIT / JOIN -----------------------
+
+    def split(self, key, keep_equal: bool = False) -> tuple["WAVLMap", "WAVLMap"]:
+        # El tamaño de cada mitad se recalcula al pedirlo (o sale de order_stats)
+        self._last = None
+        left, right = super().split(key, keep_equal)
+        if self.order_stats:
+            left._count = left.root.size if left.root is not None else 0
+            right._count = right.root.size if right.root is not None else 0
+        else:
+            left._count = right._count = None
+        self._count = 0
+        return left, right
+
+    def join(self, other: "WAVLMap") -> "WAVLMap":
+        if self._count is None or other._count is None:
+            total = None
+        else:
+            total = self._count + other._count
+        self._last = other._last = None
+        joined = super().join(other)
+        joined._count = total
+        self._count = other._count = 0
+        return joined
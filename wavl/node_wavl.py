@@ -3,12 +3,16 @@
 from typing import Optional
 
 class NodeWAVL:
+    # __slots__: sin __dict__ por instancia (importa con decenas de millones de nodos)
+    __slots__ = ("key", "left", "right", "parent", "rank", "size")
+
     def __init__(self, key):
         self.key: int = key
         self.left: Optional[NodeWAVL] = None
         self.right: Optional[NodeWAVL] = None
         self.parent: Optional[NodeWAVL] = None
         self.rank: int = 0  # Al crear el nodo, asumimos rank = 0
+        self.size: int = 1  # Tamaño del subárbol (solo se mantiene con order_stats)
 
     def __repr__(self):
         left_k = self.left.key if self.left else None
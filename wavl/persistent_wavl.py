@@ -0,0 +1,357 @@
+# wavl/persistent_wavl.py
+#
+# WAVL persistente (inmutable) por copia de camino: insert/delete no
+# modifican ningún nodo, crean copias de los O(log n) nodos del camino y
+# retornan una nueva versión que comparte el resto con la anterior. Toda
+# versión vieja sigue siendo válida y legible (aislamiento de snapshot).
+#
+# Las reglas de rango son las de tree_wavl.py (diferencias 1 o 2, hojas en
+# rango 0) y los casos de rebalanceo son los mismos: promoción, rotación
+# simple o doble al insertar; democión, doble democión o rotación al
+# eliminar. Como no hay punteros parent, el rebalanceo se hace al
+# reconstruir el camino de abajo hacia arriba.
+
+import threading
+from typing import Optional
+from utils_wavl import get_rank
+
+
+class NodePWAVL:
+    # Nodo inmutable: no tiene parent (se comparte entre versiones)
+    __slots__ = ("key", "left", "right", "rank", "size")
+
+    def __init__(self, key, left=None, right=None, rank: int = 0):
+        self.key = key
+        self.left: Optional[NodePWAVL] = left
+        self.right: Optional[NodePWAVL] = right
+        self.rank: int = rank
+        self.size: int = 1 + (left.size if left is not None else 0) + \
+            (right.size if right is not None else 0)
+
+    def __repr__(self):
+        left_k = self.left.key if self.left else None
+        right_k = self.right.key if self.right else None
+        return (f"NodePWAVL(key={self.key}, rank={self.rank}, "
+                f"left={left_k}, right={right_k})")
+
+
+# ----------------------- REBALANCEO (nodos nuevos) -----------------------
+
+def _join_insert(key, left, right, rank: int) -> NodePWAVL:
+    """
+    Crea el nodo (key, left, right) de rango `rank` cuando uno de sus hijos
+    acaba de cambiar por una inserción y puede ser 0-hijo.
+    """
+    if left is not None and left.rank == rank:
+        # Caso 1: el hermano es 1-hijo → promoción (sube el rango)
+        if rank - get_rank(right) == 1:
+            return NodePWAVL(key, left, right, rank + 1)
+        # Caso 2: rotación. LL si el nieto interior es 2-hijo, si no LR
+        inner = left.right
+        if rank - get_rank(inner) == 2:
+            return NodePWAVL(left.key, left.left,
+                             NodePWAVL(key, inner, right, rank - 1), rank)
+        return NodePWAVL(inner.key,
+                         NodePWAVL(left.key, left.left, inner.left, rank - 1),
+                         NodePWAVL(key, inner.right, right, rank - 1), rank)
+
+    if right is not None and right.rank == rank:
+        if rank - get_rank(left) == 1:
+            return NodePWAVL(key, left, right, rank + 1)
+        # RR / RL (simétrico)
+        inner = right.left
+        if rank - get_rank(inner) == 2:
+            return NodePWAVL(right.key, NodePWAVL(key, left, inner, rank - 1),
+                             right.right, rank)
+        return NodePWAVL(inner.key,
+                         NodePWAVL(key, left, inner.left, rank - 1),
+                         NodePWAVL(right.key, inner.right, right.right, rank - 1), rank)
+
+    return NodePWAVL(key, left, right, rank)
+
+
+def _join_delete(key, left, right, rank: int) -> NodePWAVL:
+    """
+    Crea el nodo (key, left, right) de rango `rank` cuando uno de sus hijos
+    acaba de perder un rango (o desaparecer) por una eliminación.
+    """
+    # Hoja: rango 0 (cubre la hoja 2,2 que queda al quitar su único hijo)
+    if left is None and right is None:
+        return NodePWAVL(key, None, None, 0)
+
+    if rank - get_rank(left) == 3:
+        sibling = right
+        s_rank = sibling.rank
+        # Caso 1: el hermano es 2-hijo → democión
+        if rank - s_rank == 2:
+            return NodePWAVL(key, left, right, rank - 1)
+        # Caso 2: hermano 2,2 → doble democión
+        if s_rank - get_rank(sibling.left) == 2 and s_rank - get_rank(sibling.right) == 2:
+            return NodePWAVL(key, left,
+                             NodePWAVL(sibling.key, sibling.left, sibling.right, s_rank - 1),
+                             rank - 1)
+        # Caso 3: rotación simple (RR) si el nieto exterior es 1-hijo
+        if s_rank - get_rank(sibling.right) == 1:
+            # Si el nodo queda como hoja su rango debe ser 0
+            down = 0 if left is None and sibling.left is None else rank - 1
+            return NodePWAVL(sibling.key, NodePWAVL(key, left, sibling.left, down),
+                             sibling.right, rank)
+        # Rotación doble (RL)
+        inner = sibling.left
+        return NodePWAVL(inner.key,
+                         NodePWAVL(key, left, inner.left, rank - 2),
+                         NodePWAVL(sibling.key, inner.right, sibling.right, rank - 2), rank)
+
+    if rank - get_rank(right) == 3:
+        sibling = left
+        s_rank = sibling.rank
+        if rank - s_rank == 2:
+            return NodePWAVL(key, left, right, rank - 1)
+        if s_rank - get_rank(sibling.left) == 2 and s_rank - get_rank(sibling.right) == 2:
+            return NodePWAVL(key,
+                             NodePWAVL(sibling.key, sibling.left, sibling.right, s_rank - 1),
+                             right, rank - 1)
+        # LL / LR (simétrico)
+        if s_rank - get_rank(sibling.left) == 1:
+            down = 0 if right is None and sibling.right is None else rank - 1
+            return NodePWAVL(sibling.key, sibling.left,
+                             NodePWAVL(key, sibling.right, right, down), rank)
+        inner = sibling.right
+        return NodePWAVL(inner.key,
+                         NodePWAVL(sibling.key, sibling.left, inner.left, rank - 2),
+                         NodePWAVL(key, inner.right, right, rank - 2), rank)
+
+    return NodePWAVL(key, left, right, rank)
+
+
+def _build(keys, lo, hi) -> Optional[NodePWAVL]:
+    # Árbol perfectamente balanceado (recursión de profundidad log2(n))
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    size = hi - lo
+    return NodePWAVL(keys[mid], _build(keys, lo, mid), _build(keys, mid + 1, hi),
+                     size.bit_length() - 1)
+
+
+class PersistentWAVLTree:
+    """
+    Versión inmutable de un WAVL. insert/delete retornan una versión nueva
+    (la actual no cambia) creando O(log n) nodos; el resto se comparte.
+    Las claves repetidas van a la derecha, igual que en WAVLTree.
+    """
+
+    __slots__ = ("root", "version")
+
+    def __init__(self, root: Optional[NodePWAVL] = None, version: int = 0):
+        self.root = root
+        self.version = version
+
+    @classmethod
+    def from_sorted(cls, iterable) -> "PersistentWAVLTree":
+        keys = sorted(iterable)
+        return cls(_build(keys, 0, len(keys)))
+
+    # ----------------------- MUTACIONES (nuevas versiones) -----------------------
+
+    def insert(self, key) -> "PersistentWAVLTree":
+        path = []
+        node = self.root
+        while node is not None:
+            go_left = key < node.key
+            path.append((node, go_left))
+            node = node.left if go_left else node.right
+
+        # Reconstruir el camino de abajo hacia arriba rebalanceando
+        sub = NodePWAVL(key)
+        for node, went_left in reversed(path):
+            if went_left:
+                sub = _join_insert(node.key, sub, node.right, node.rank)
+            else:
+                sub = _join_insert(node.key, node.left, sub, node.rank)
+        return PersistentWAVLTree(sub, self.version + 1)
+
+    def delete(self, key) -> "PersistentWAVLTree":
+        """
+        Retorna la versión sin (una ocurrencia de) `key`, o self si no está.
+        """
+        path = []
+        node = self.root
+        while node is not None and node.key != key:
+            go_left = key < node.key
+            path.append((node, go_left))
+            node = node.left if go_left else node.right
+        if node is None:
+            return self
+
+        # Con dos hijos, el nodo se reemplaza por su sucesor in-order, que es
+        # el que se quita físicamente
+        target, succ_key = node, None
+        if node.left is not None and node.right is not None:
+            path.append((node, False))
+            node = node.right
+            while node.left is not None:
+                path.append((node, True))
+                node = node.left
+            succ_key = node.key
+
+        sub = node.left if node.left is not None else node.right
+        for node, went_left in reversed(path):
+            key_here = succ_key if node is target else node.key
+            if went_left:
+                sub = _join_delete(key_here, sub, node.right, node.rank)
+            else:
+                sub = _join_delete(key_here, node.left, sub, node.rank)
+        return PersistentWAVLTree(sub, self.version + 1)
+
+    def insert_many(self, keys) -> "PersistentWAVLTree":
+        tree = self
+        for key in keys:
+            tree = tree.insert(key)
+        return tree
+
+    def delete_many(self, keys) -> "PersistentWAVLTree":
+        tree = self
+        for key in keys:
+            tree = tree.delete(key)
+        return tree
+
+    # ----------------------- CONSULTAS -----------------------
+
+    def search(self, key) -> Optional[NodePWAVL]:
+        node = self.root
+        while node is not None:
+            if key == node.key:
+                return node
+            node = node.left if key < node.key else node.right
+        return None
+
+    def __contains__(self, key) -> bool:
+        return self.search(key) is not None
+
+    def __len__(self) -> int:
+        return self.root.size if self.root is not None else 0
+
+    def __iter__(self):
+        # In-order con pila explícita (no hay punteros parent)
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def range(self, lo=None, hi=None):
+        """
+        Genera en orden las claves k con lo <= k < hi (None = sin cota).
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and node.key >= hi:
+                return
+            yield node.key
+            node = node.right
+
+    def floor(self, key):
+        # Mayor clave <= key, o None
+        best = None
+        node = self.root
+        while node is not None:
+            if node.key <= key:
+                best = node.key
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    def ceiling(self, key):
+        # Menor clave >= key, o None
+        best = None
+        node = self.root
+        while node is not None:
+            if node.key >= key:
+                best = node.key
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def select(self, i: int):
+        # i-ésima clave más pequeña en O(log n) (i negativo cuenta desde el final)
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice fuera de rango")
+        node = self.root
+        while True:
+            left_size = node.left.size if node.left is not None else 0
+            if i < left_size:
+                node = node.left
+            elif i == left_size:
+                return node.key
+            else:
+                i -= left_size + 1
+                node = node.right
+
+    def rank(self, key) -> int:
+        # Número de claves estrictamente menores que `key`
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.key < key:
+                count += (node.left.size if node.left is not None else 0) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+
+class VersionedWAVLTree:
+    """
+    Índice MVCC sobre PersistentWAVLTree: un escritor a la vez publica cada
+    versión nueva reemplazando la referencia `current` (asignación atómica),
+    y los lectores nunca bloquean. snapshot() retorna la versión actual en
+    O(1): un recorrido largo sobre ella no ve las escrituras posteriores y
+    no copia el árbol.
+    """
+
+    def __init__(self, tree: Optional[PersistentWAVLTree] = None):
+        self.current = tree if tree is not None else PersistentWAVLTree()
+        self._write_lock = threading.Lock()
+
+    def snapshot(self) -> PersistentWAVLTree:
+        return self.current
+
+    def insert(self, key):
+        with self._write_lock:
+            self.current = self.current.insert(key)
+
+    def delete(self, key):
+        with self._write_lock:
+            self.current = self.current.delete(key)
+
+    def search(self, key):
+        return self.current.search(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self.current
+
+    def __len__(self) -> int:
+        return len(self.current)
+
+    def __iter__(self):
+        return iter(self.current)
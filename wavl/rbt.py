@@ -1,31 +1,67 @@
 # wavl/rbt.py
 
 from typing import Optional
+from utils_bst import (build_balanced, climb_for, descend, OrderedTreeMixin,
+                       add_size, update_size)
 
-RED = "RED"
-BLACK = "BLACK"
+# El color se guarda como bool (singletons True/False) en lugar de strings
+RED = True
+BLACK = False
 
 class NodeRBT:
+    __slots__ = ("key", "left", "right", "parent", "color", "size")
+
     def __init__(self, key, color=RED):
         self.key: int = key
         self.left: Optional[NodeRBT] = None
         self.right: Optional[NodeRBT] = None
         self.parent: Optional[NodeRBT] = None
-        self.color: str = color
+        self.color: bool = color
+        self.size: int = 1  # Tamaño del subárbol (solo se mantiene con order_stats)
 
     def __repr__(self):
         left_k = self.left.key if self.left else None
         right_k = self.right.key if self.right else None
-        return (f"NodeRBT(key={self.key}, color={self.color}, "
+        color = "RED" if self.color == RED else "BLACK"
+        return (f"NodeRBT(key={self.key}, color={color}, "
                 f"left={left_k}, right={right_k})")
 
 
-class RBTree:
+class RBTree(OrderedTreeMixin):
 
-    def __init__(self):
+    def __init__(self, order_stats: bool = False):
         self.root: Optional[NodeRBT] = None
         self.rotation_count: int = 0
         self.recolor_count: int = 0
+        # Si es True se mantiene el tamaño de cada subárbol (select/rank)
+        self.order_stats = order_stats
+        # Se incrementa en cada cambio del conjunto de claves: invalida
+        # cachés derivados (search_many, freeze)
+        self._version = 0
+        self._keys_cache = None
+        self._frozen = None
+
+    @classmethod
+    def from_sorted(cls, iterable, order_stats: bool = False) -> "RBTree":
+        """
+        Construye un RBT en O(n) a partir de claves ordenadas (si no lo
+        están, se ordenan primero). El árbol queda perfectamente balanceado,
+        con todas las hojas en los dos últimos niveles: los nodos del nivel
+        más profundo se pintan RED y el resto BLACK, así toda ruta tiene la
+        misma altura negra.
+        """
+        keys = sorted(iterable)
+        max_depth = len(keys).bit_length() - 1
+
+        def make_node(key, size, depth):
+            color = RED if depth == max_depth and depth > 0 else BLACK
+            node = NodeRBT(key, color=color)
+            node.size = size
+            return node
+
+        tree = cls(order_stats)
+        tree.root = build_balanced(keys, make_node)
+        return tree
 
     # -------------------- UTILIDADES --------------------
 
@@ -35,7 +71,7 @@ class RBTree:
     def _is_black(self, node: Optional[NodeRBT]) -> bool:
         return node is None or node.color == BLACK
 
-    def _set_color(self, node: Optional[NodeRBT], color: str):
+    def _set_color(self, node: Optional[NodeRBT], color: bool):
         if node is not None:
             node.color = color
             self.recolor_count += 1
@@ -83,6 +119,10 @@ class RBTree:
             else:
                 y.parent.right = y
 
+        if self.order_stats:
+            update_size(x)
+            update_size(y)
+
     def _rotate_right(self, x: NodeRBT):
         self.rotation_count += 1
         y = x.left
@@ -107,20 +147,19 @@ class RBTree:
             else:
                 y.parent.right = y
 
+        if self.order_stats:
+            update_size(x)
+            update_size(y)
+
     # -------------------- SEARCH --------------------
 
     def search(self, key) -> Optional[NodeRBT]:
-        return self._search_rec(self.root, key)
-
-    def _search_rec(self, node: Optional[NodeRBT], key) -> Optional[NodeRBT]:
-        if node is None:
-            return None
-        if key == node.key:
-            return node
-        elif key < node.key:
-            return self._search_rec(node.left, key)
-        else:
-            return self._search_rec(node.right, key)
+        node = self.root
+        while node is not None:
+            if key == node.key:
+                return node
+            node = node.left if key < node.key else node.right
+        return None
 
     # -------------------- INSERT --------------------
 
@@ -129,9 +168,26 @@ class RBTree:
         self._bst_insert(new_node)
         self._fix_insert(new_node)
 
-    def _bst_insert(self, node: NodeRBT):
+    def insert_many(self, keys):
+        """
+        Inserta un lote de claves en una sola pasada ordenada: cada inserción
+        parte del nodo insertado antes (finger) en vez de bajar desde la raíz.
+        """
+        finger = self.finger()
+        for key in sorted(keys):
+            finger.insert(key)
+
+    def _insert_from(self, start: Optional[NodeRBT], key) -> NodeRBT:
+        # Inserta bajando desde `start` (None = la raíz), rebalancea y
+        # retorna el nodo nuevo. Lo usan insert_many y Finger.insert.
+        node = NodeRBT(key, color=RED)
+        self._bst_insert(node, start)
+        self._fix_insert(node)
+        return node
+
+    def _bst_insert(self, node: NodeRBT, start: Optional[NodeRBT] = None):
         parent = None
-        curr = self.root
+        curr = start if start is not None else self.root
         while curr:
             parent = curr
             if node.key < curr.key:
@@ -147,6 +203,9 @@ class RBTree:
                 parent.left = node
             else:
                 parent.right = node
+            if self.order_stats:
+                add_size(parent, 1)
+        self._version += 1
 
     def _fix_insert(self, z: NodeRBT):
         while z.parent and z.parent.color == RED:
@@ -203,6 +262,25 @@ class RBTree:
         z = self.search(key)
         if z is None:
             return
+        self._delete_node(z)
+
+    def delete_many(self, keys):
+        """
+        Elimina un lote de claves en una sola pasada ordenada, buscando cada
+        una desde donde terminó la eliminación anterior (finger).
+        """
+        finger = self.root
+        for key in sorted(keys):
+            if self.root is None:
+                return
+            z, finger = descend(climb_for(finger, key), key)
+            if z is None:
+                continue
+            parent = self._delete_node(z)
+            finger = parent if parent is not None else self.root
+
+    def _delete_node(self, z: NodeRBT) -> Optional[NodeRBT]:
+        # Retorna el padre del nodo físicamente quitado (sigue en el árbol)
         if z.left and z.right:
             succ = self._minimum(z.right)
             z.key = succ.key
@@ -223,9 +301,13 @@ class RBTree:
                 else:
                     z.parent.right = None
             replacement = None
-        
+        if self.order_stats:
+            add_size(z.parent, -1)
+        self._version += 1
+
         if original_color == BLACK:
             self._fix_delete(replacement, z.parent)
+        return z.parent
 
     def _fix_delete(self, x: Optional[NodeRBT], parent: Optional[NodeRBT]):
 
@@ -0,0 +1,319 @@
+# wavl/search_cache.py
+#
+# Caché acotada de resultados de search() para cargas con claves calientes
+# (lecturas con sesgo Zipf). Se activa por instancia, igual que
+# Instrumentation: enable() envuelve search() y los puntos donde el árbol
+# cambia (lo que haya en la instancia, así se combina con Instrumentation) y
+# disable() repone lo anterior (los dos se pueden desactivar en cualquier
+# orden). Un árbol sin caché ejecuta exactamente los métodos originales de
+# la clase.
+#
+# Invalidación:
+# - insert / _insert_from (finger, insert_many): se descarta la clave (un
+#   "no existe" cacheado deja de ser cierto).
+# - _remove_node (WAVL) / _delete_node (AVL, RBT): se descarta la clave del
+#   nodo y, si tiene dos hijos, también la de su sucesor, porque el nodo
+#   hereda la clave del sucesor (node.key = succ.key) y el nodo del sucesor
+#   sale del árbol.
+# - Cualquier otro cambio (split, join, from_sorted sobre el mismo objeto,
+#   WAVLMap...) se detecta por el contador _version del árbol y vacía la
+#   caché completa en la siguiente búsqueda.
+
+from collections import OrderedDict
+from instrumentation import install_wrapper, restore_wrappers
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Least recently used: OrderedDict en orden de uso; un acierto mueve la
+    entrada al final y se expulsa la del principio.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def wrap(self, original, cache):
+        """
+        Retorna el envoltorio de `original` (tree.search) que consulta esta
+        caché y cuenta aciertos y fallos en `cache` (la SearchCache).
+        """
+        tree = cache.tree
+        token = cache._token
+        entries = self._entries
+        get, move_to_end, popitem = entries.get, entries.move_to_end, entries.popitem
+        capacity = self.capacity
+
+        def search(key):
+            if cache._token is not token:
+                return original(key)
+            if tree._version != cache.version:
+                cache._sync()
+            node = get(key, _MISSING)
+            if node is not _MISSING:
+                move_to_end(key)
+                cache.hits += 1
+                return node
+            cache.misses += 1
+            node = original(key)
+            entries[key] = node
+            if len(entries) > capacity:
+                popitem(last=False)
+                self.evictions += 1
+            return node
+
+        return search
+
+    def discard(self, key) -> bool:
+        return self._entries.pop(key, _MISSING) is not _MISSING
+
+    def clear(self):
+        self._entries.clear()
+
+
+class ClockCache:
+    """
+    CLOCK (segunda oportunidad): las entradas ocupan `capacity` ranuras fijas
+    con un bit de referencia. Un acierto solo marca el bit (sin reordenar
+    nada); para expulsar, la manecilla avanza limpiando bits hasta encontrar
+    una ranura sin marcar. Aproxima LRU con menos trabajo por acierto.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.evictions = 0
+        self._slot = {}                      # clave -> ranura
+        self._keys = [_MISSING] * capacity
+        self._values = [None] * capacity
+        self._ref = bytearray(capacity)
+        self._free = list(range(capacity - 1, -1, -1))
+        self._hand = 0
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+    def wrap(self, original, cache):
+        tree = cache.tree
+        token = cache._token
+        slots, keys, values, ref, free = self._slot, self._keys, self._values, self._ref, self._free
+
+        def search(key):
+            if cache._token is not token:
+                return original(key)
+            if tree._version != cache.version:
+                cache._sync()
+            slot = slots.get(key)
+            if slot is not None:
+                ref[slot] = 1
+                cache.hits += 1
+                return values[slot]
+            cache.misses += 1
+            node = original(key)
+            slot = free.pop() if free else self._evict()
+            slots[key] = slot
+            keys[slot] = key
+            values[slot] = node
+            # La segunda oportunidad se gana con un acierto posterior
+            ref[slot] = 0
+            return node
+
+        return search
+
+    def _evict(self) -> int:
+        # Solo se llama con todas las ranuras ocupadas
+        ref, hand, capacity = self._ref, self._hand, self.capacity
+        while ref[hand]:
+            ref[hand] = 0
+            hand = (hand + 1) % capacity
+        self._hand = (hand + 1) % capacity
+        del self._slot[self._keys[hand]]
+        self.evictions += 1
+        return hand
+
+    def discard(self, key) -> bool:
+        slot = self._slot.pop(key, None)
+        if slot is None:
+            return False
+        self._keys[slot] = _MISSING
+        self._values[slot] = None
+        self._ref[slot] = 0
+        self._free.append(slot)
+        return True
+
+    def clear(self):
+        # Vacía en el lugar: el envoltorio de search guarda estas listas
+        self._slot.clear()
+        self._keys[:] = [_MISSING] * self.capacity
+        self._values[:] = [None] * self.capacity
+        self._ref[:] = bytes(self.capacity)
+        self._free[:] = range(self.capacity - 1, -1, -1)
+        self._hand = 0
+
+
+POLICIES = {"lru": LRUCache, "clock": ClockCache}
+
+
+class SearchCache:
+    """
+    Memoiza tree.search(key) (el nodo encontrado o None) para las claves
+    más consultadas, con a lo sumo `size` entradas y política de expulsión
+    `policy` ("lru" o "clock"). Pensada para WAVLTree; también sirve con
+    AVLTree y RBTree.
+    - hits / misses: búsquedas resueltas por la caché o por el árbol
+    - invalidations: entradas descartadas por inserciones y eliminaciones
+    - flushes: vaciados completos por cambios que no pasan por los hooks
+
+    Uso:
+        cache = SearchCache(tree, size=4096, policy="clock")
+        with cache:                # o cache.enable() / cache.disable()
+            for key in keys:
+                tree.search(key)
+        print(cache.stats()["hit_ratio"])
+    """
+
+    INSERT_HOOKS = ("insert", "_insert_from")
+    DELETE_HOOKS = ("_remove_node", "_delete_node")
+
+    def __init__(self, tree, size: int = 1024, policy: str = "lru"):
+        if size < 1:
+            raise ValueError("size debe ser al menos 1")
+        if policy not in POLICIES:
+            raise ValueError(f"política desconocida: {policy!r} (usar {', '.join(POLICIES)})")
+        self.tree = tree
+        self.policy = policy
+        self.entries = POLICIES[policy](size)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.flushes = 0
+        self.version = getattr(tree, "_version", 0)
+        self.enabled = False
+        # Operaciones envueltas; _token identifica la activación vigente, así
+        # un envoltorio viejo que quedó debajo de otro pasa de largo
+        self._hooked = ()
+        self._token = None
+
+    def enable(self):
+        if self.enabled:
+            return
+        tree = self.tree
+        cls = type(tree)
+        hooked = [("search", self._wrap_search)]
+        hooked += [(op, self._wrap_insert) for op in self.INSERT_HOOKS if hasattr(cls, op)]
+        hooked += [(op, self._wrap_delete) for op in self.DELETE_HOOKS if hasattr(cls, op)]
+        self._token = object()
+        self.clear()
+        for op, wrap in hooked:
+            # Se envuelve el atributo actual (quizá ya envuelto por otro)
+            install_wrapper(tree, op, wrap(getattr(tree, op)), self)
+        self._hooked = tuple(op for op, _ in hooked)
+        self.enabled = True
+
+    def disable(self):
+        # Repone lo anterior; lo cacheado deja de poder invalidarse
+        if not self.enabled:
+            return
+        self._token = None
+        restore_wrappers(self.tree, self._hooked)
+        self._hooked = ()
+        self.clear()
+        self.enabled = False
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.disable()
+        return False
+
+    def clear(self):
+        self.entries.clear()
+        self.version = getattr(self.tree, "_version", 0)
+
+    def _sync(self):
+        # El árbol cambió por un camino sin hook: nada de lo cacheado es seguro
+        if self.tree._version != self.version:
+            self.entries.clear()
+            self.version = self.tree._version
+            self.flushes += 1
+
+    # ----------------------- ENVOLTORIOS -----------------------
+
+    def _wrap_search(self, original):
+        # Cada política arma su propio envoltorio: un acierto no paga
+        # llamadas a métodos de Python, solo el acceso a su diccionario
+        search = self.entries.wrap(original, self)
+        search.__wrapped__ = original
+        return search
+
+    def _wrap_insert(self, original):
+        tree = self.tree
+        discard = self.entries.discard
+        token = self._token
+
+        def insert(*args):
+            if self._token is not token:
+                return original(*args)
+            # La clave es el último argumento: insert(key) / _insert_from(start, key)
+            self._sync()
+            result = original(*args)
+            if discard(args[-1]):
+                self.invalidations += 1
+            self.version = tree._version
+            return result
+
+        insert.__wrapped__ = original
+        return insert
+
+    def _wrap_delete(self, original):
+        tree = self.tree
+        discard = self.entries.discard
+        token = self._token
+
+        def remove(node):
+            if self._token is not token:
+                return original(node)
+            self._sync()
+            keys = [node.key]
+            if node.left is not None and node.right is not None:
+                succ = node.right
+                while succ.left is not None:
+                    succ = succ.left
+                keys.append(succ.key)
+            result = original(node)
+            for key in keys:
+                if discard(key):
+                    self.invalidations += 1
+            self.version = tree._version
+            return result
+
+        remove.__wrapped__ = original
+        return remove
+
+    # ----------------------- REPORTE -----------------------
+
+    def reset(self):
+        # Pone los contadores en cero sin vaciar la caché
+        self.hits = self.misses = self.invalidations = self.flushes = 0
+        self.entries.evictions = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "policy": self.policy,
+            "capacity": self.entries.capacity,
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.entries.evictions,
+            "invalidations": self.invalidations,
+            "flushes": self.flushes,
+        }
@@ -0,0 +1,332 @@
+# wavl/server_wavl.py
+#
+# Servicio asyncio que expone un WAVLTree por TCP o socket Unix, y su
+# cliente. Protocolo binario compacto, una trama por pedido o respuesta:
+#
+#   cabecera <BBII (10 bytes): op|estado, flags, id de pedido, n
+#   seguida de n claves int64 little-endian
+#
+# El servidor rechaza con ERROR las tramas de más de MAX_FRAME_KEYS claves
+# (descarta sus bytes sin guardarlos) y cualquier pedido que falle, sin
+# cortar la conexión.
+#
+# Pedidos: SEARCH (1 clave), INSERT / DELETE (n claves), RANGE (lo, hi; los
+# bits de flags marcan cota ausente). Respuestas: estado OK / NOT_FOUND /
+# ERROR con el mismo id; RANGE trae las claves encontradas.
+#
+# Pipelining: el cliente puede enviar muchos pedidos sin esperar respuesta.
+# El servidor procesa todas las tramas completas de cada lectura del socket;
+# las escrituras de todas las conexiones se acumulan y se aplican juntas una
+# vez por vuelta del event loop (insert_many / delete_many ordenados). Antes
+# de atender una lectura se aplica lo pendiente, así toda consulta ve las
+# escrituras recibidas antes que ella.
+
+import argparse
+import asyncio
+import struct
+from array import array
+from tree_wavl import WAVLTree
+
+_HEADER = struct.Struct("<BBII")
+
+# Máximo de claves por trama que acepta el servidor (8 MiB de datos)
+MAX_FRAME_KEYS = 1 << 20
+
+OP_SEARCH = 1
+OP_INSERT = 2
+OP_DELETE = 3
+OP_RANGE = 4
+
+ST_OK = 0
+ST_NOT_FOUND = 1
+ST_ERROR = 2
+
+# flags de RANGE
+_NO_LO = 1
+_NO_HI = 2
+
+
+def encode_frame(code: int, req_id: int, keys=(), flags: int = 0) -> bytes:
+    data = array("q", keys)
+    return _HEADER.pack(code, flags, req_id, len(data)) + data.tobytes()
+
+
+def decode_frames(buffer, max_keys=None):
+    """
+    Decodifica las tramas completas de `buffer`. Retorna la lista de
+    (código, flags, id, claves) y los bytes consumidos; una trama
+    incompleta al final queda para la siguiente lectura.
+
+    Una trama con más de `max_keys` claves se entrega con claves None y se
+    da por consumida entera: los bytes consumidos pueden superar
+    len(buffer), y el resto de la trama se descarta a medida que llega.
+    """
+    frames = []
+    offset = 0
+    header = _HEADER.size
+    size = len(buffer)
+    while offset + header <= size:
+        code, flags, req_id, n = _HEADER.unpack_from(buffer, offset)
+        end = offset + header + 8 * n
+        if max_keys is not None and n > max_keys:
+            frames.append((code, flags, req_id, None))
+            offset = end
+            break
+        if end > size:
+            break
+        keys = array("q")
+        keys.frombytes(buffer[offset + header:end])
+        frames.append((code, flags, req_id, keys))
+        offset = end
+    return frames, offset
+
+
+# ----------------------- SERVIDOR -----------------------
+
+class WAVLServer:
+    """
+    Servidor de un WAVLTree (`tree`). Las escrituras se confirman después de
+    aplicarse; `batches` y `batched_writes` cuentan los lotes aplicados y
+    los pedidos de escritura que agruparon.
+    """
+
+    def __init__(self, tree=None):
+        self.tree = tree if tree is not None else WAVLTree()
+        self.requests = 0
+        self.batches = 0
+        self.batched_writes = 0
+        self._pending = []           # (op, claves, writer, id)
+        self._flush_scheduled = False
+        self._server = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, path=None):
+        # Con `path` escucha en un socket Unix; si no, en TCP (port=0: libre)
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    @property
+    def address(self):
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        self._flush()
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        buffer = bytearray()
+        skip = 0            # bytes pendientes de una trama rechazada
+        try:
+            while True:
+                data = await reader.read(1 << 16)
+                if not data:
+                    break
+                if skip:
+                    dropped = min(skip, len(data))
+                    data = data[dropped:]
+                    skip -= dropped
+                buffer += data
+                frames, consumed = decode_frames(buffer, MAX_FRAME_KEYS)
+                skip += max(0, consumed - len(buffer))
+                del buffer[:consumed]
+                for frame in frames:
+                    try:
+                        self._dispatch(frame, writer)
+                    except Exception:
+                        # Un pedido que falla no corta la conexión
+                        writer.write(_HEADER.pack(ST_ERROR, 0, frame[2], 0))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            # Confirmar lo pendiente de esta conexión antes de cerrarla
+            self._flush()
+            writer.close()
+
+    def _dispatch(self, frame, writer):
+        code, flags, req_id, keys = frame
+        self.requests += 1
+        if keys is None:
+            # Trama demasiado grande: se rechaza sin leer sus claves
+            writer.write(_HEADER.pack(ST_ERROR, 0, req_id, 0))
+            return
+        if code == OP_INSERT or code == OP_DELETE:
+            self._pending.append((code, keys, writer, req_id))
+            if not self._flush_scheduled:
+                # Se ejecuta al final de esta vuelta del loop, después de
+                # las demás conexiones que ya tienen datos listos
+                self._flush_scheduled = True
+                asyncio.get_running_loop().call_soon(self._flush)
+            return
+
+        if self._pending:
+            self._flush()
+        tree = self.tree
+        if code == OP_SEARCH and len(keys) == 1:
+            status = ST_OK if tree.search(keys[0]) is not None else ST_NOT_FOUND
+            writer.write(_HEADER.pack(status, 0, req_id, 0))
+        elif code == OP_RANGE and len(keys) == 2:
+            lo = None if flags & _NO_LO else keys[0]
+            hi = None if flags & _NO_HI else keys[1]
+            writer.write(encode_frame(ST_OK, req_id, tree.range(lo, hi)))
+        else:
+            writer.write(_HEADER.pack(ST_ERROR, 0, req_id, 0))
+
+    def _flush(self):
+        """
+        Aplica las escrituras pendientes de todas las conexiones: cada tramo
+        consecutivo de la misma operación es un solo insert_many o
+        delete_many (el orden entre inserciones y eliminaciones se respeta).
+        Después envía las confirmaciones.
+        """
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        run_op, run = pending[0][0], []
+        for op, keys, _, _ in pending:
+            if op != run_op:
+                self._apply(run_op, run)
+                run_op, run = op, []
+            run.extend(keys)
+        self._apply(run_op, run)
+        self.batches += 1
+        self.batched_writes += len(pending)
+
+        for _, _, writer, req_id in pending:
+            if not writer.is_closing():
+                writer.write(_HEADER.pack(ST_OK, 0, req_id, 0))
+
+    def _apply(self, op, keys):
+        if op == OP_INSERT:
+            self.tree.insert_many(keys)
+        else:
+            self.tree.delete_many(keys)
+
+
+# ----------------------- CLIENTE -----------------------
+
+class WAVLClient:
+    """
+    Cliente asyncio. Cada método envía su trama y espera la respuesta con
+    el mismo id; varias corutinas pueden usar la misma conexión a la vez
+    (asyncio.gather), y sus pedidos viajan en pipeline.
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._futures = {}
+        self._next_id = 0
+        self._task = asyncio.get_running_loop().create_task(self._read_responses())
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 7070, path=None) -> "WAVLClient":
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _read_responses(self):
+        buffer = bytearray()
+        error = ConnectionError("conexión cerrada por el servidor")
+        try:
+            while True:
+                data = await self._reader.read(1 << 16)
+                if not data:
+                    break
+                buffer += data
+                frames, consumed = decode_frames(buffer)
+                del buffer[:consumed]
+                for status, _, req_id, keys in frames:
+                    future = self._futures.pop(req_id, None)
+                    if future is not None and not future.done():
+                        future.set_result((status, keys))
+        except ConnectionError as exc:
+            error = exc
+        finally:
+            # Los pedidos sin respuesta fallan en vez de quedar colgados
+            for future in self._futures.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._futures.clear()
+
+    async def _request(self, op: int, keys, flags: int = 0):
+        req_id = self._next_id
+        self._next_id = (req_id + 1) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self._futures[req_id] = future
+        self._writer.write(encode_frame(op, req_id, keys, flags))
+        await self._writer.drain()
+        status, result = await future
+        if status == ST_ERROR:
+            raise ValueError("pedido rechazado por el servidor")
+        return status, result
+
+    async def search(self, key) -> bool:
+        status, _ = await self._request(OP_SEARCH, (key,))
+        return status == ST_OK
+
+    async def insert(self, key):
+        await self._request(OP_INSERT, (key,))
+
+    async def delete(self, key):
+        await self._request(OP_DELETE, (key,))
+
+    async def insert_many(self, keys):
+        # Un solo pedido con todas las claves
+        await self._request(OP_INSERT, keys)
+
+    async def delete_many(self, keys):
+        await self._request(OP_DELETE, keys)
+
+    async def range(self, lo=None, hi=None) -> list:
+        flags = (_NO_LO if lo is None else 0) | (_NO_HI if hi is None else 0)
+        _, keys = await self._request(OP_RANGE, (lo or 0, hi or 0), flags)
+        return keys.tolist()
+
+    async def close(self):
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
+
+
+async def _main(args):
+    server = WAVLServer(WAVLTree(order_stats=args.order_stats))
+    await server.start(args.host, args.port, args.unix)
+    print(f"Sirviendo WAVLTree en {args.unix or server.address}")
+    await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor asyncio de WAVLTree")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7070)
+    parser.add_argument("--unix", default=None, help="ruta de socket Unix (en vez de TCP)")
+    parser.add_argument("--order-stats", action="store_true")
+    try:
+        asyncio.run(_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
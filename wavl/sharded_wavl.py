@@ -0,0 +1,292 @@
+# wavl/sharded_wavl.py
+#
+# Árbol particionado por rangos entre procesos: cada worker es un proceso
+# con su propio WAVLTree (sin GIL compartido) y el front-end reparte las
+# claves según las fronteras `boundaries`. El shard i guarda las claves k con
+# boundaries[i-1] <= k < boundaries[i].
+
+import bisect
+import multiprocessing
+from tree_wavl import WAVLTree
+
+
+# ----------------------- WORKER -----------------------
+
+def _worker(conn):
+    """
+    Bucle de un shard: recibe (operación, argumento) por el pipe y responde.
+    Los lotes llegan sin ordenar: insert_many/delete_many los ordenan acá,
+    en paralelo entre shards, y después aprovechan el finger.
+    """
+    tree = WAVLTree(order_stats=True)
+    while True:
+        op, arg = conn.recv()
+        if op == "insert_many":
+            tree.insert_many(arg)
+            conn.send(_size(tree))
+        elif op == "delete_many":
+            tree.delete_many(arg)
+            conn.send(_size(tree))
+        elif op == "search_many":
+            conn.send([tree.search(key) is not None for key in arg])
+        elif op == "range":
+            conn.send(list(tree.range(*arg)))
+        elif op == "size":
+            conn.send(_size(tree))
+        elif op == "median":
+            n = _size(tree)
+            conn.send(tree.select(n // 2) if n else None)
+        elif op == "split_off":
+            # Entrega las claves >= key (upper=True) o < key (upper=False)
+            key, upper = arg
+            left, right = tree.split(key, keep_equal=True)
+            if upper:
+                tree, moved = left, right
+            else:
+                tree, moved = right, left
+            conn.send(list(moved))
+        elif op == "absorb":
+            # Claves contiguas a las del shard: from_sorted + join en O(k + log n)
+            keys, upper = arg
+            extra = WAVLTree.from_sorted(keys, order_stats=True)
+            tree = tree.join(extra) if upper else extra.join(tree)
+            conn.send(_size(tree))
+        elif op == "close":
+            conn.send(None)
+            conn.close()
+            return
+        else:
+            conn.send(ValueError(f"operación desconocida: {op}"))
+
+
+def _size(tree: WAVLTree) -> int:
+    return tree.root.size if tree.root is not None else 0
+
+
+# ----------------------- FRONT-END -----------------------
+
+class ShardedWAVL:
+    """
+    Front-end de `processes` shards. Las escrituras se acumulan por shard y
+    se envían en lotes de `batch_size` claves (o al leer, al llamar a
+    flush() o a las operaciones *_many). Las lecturas se reparten en
+    paralelo: primero se envían todos los pedidos y luego se recogen las
+    respuestas, así los workers trabajan a la vez.
+
+    Fronteras iniciales: `boundaries` explícitas, o `processes` rangos
+    iguales de `key_range`. Si un shard supera `imbalance` veces el tamaño
+    medio (y `min_rebalance` claves), rebalance() mueve la mitad de sus
+    claves a un vecino con split/join.
+    """
+
+    def __init__(self, processes: int = 4, boundaries=None, key_range=(0, 2 ** 32),
+                 batch_size: int = 4096, imbalance: float = 2.0,
+                 min_rebalance: int = 10_000, auto_rebalance: bool = True):
+        if boundaries is None:
+            lo, hi = key_range
+            step = (hi - lo) / processes
+            boundaries = [lo + round(step * i) for i in range(1, processes)]
+        if len(boundaries) != processes - 1 or boundaries != sorted(boundaries):
+            raise ValueError("se necesitan processes - 1 fronteras ordenadas")
+
+        self.boundaries = list(boundaries)
+        self.batch_size = batch_size
+        self.imbalance = imbalance
+        self.min_rebalance = min_rebalance
+        self.auto_rebalance = auto_rebalance
+        self.sizes = [0] * processes
+        self.rebalance_count = 0
+        self._pending_insert = [[] for _ in range(processes)]
+        self._pending_delete = [[] for _ in range(processes)]
+
+        self._conns = []
+        self._procs = []
+        for _ in range(processes):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            proc = multiprocessing.Process(target=_worker, args=(child_conn,), daemon=True)
+            proc.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._procs.append(proc)
+
+    # ----------------------- COMUNICACIÓN -----------------------
+
+    def _shard_of(self, key) -> int:
+        return bisect.bisect_right(self.boundaries, key)
+
+    def _partition(self, keys) -> list:
+        parts = [[] for _ in self._conns]
+        for key in keys:
+            parts[bisect.bisect_right(self.boundaries, key)].append(key)
+        return parts
+
+    def _call_all(self, requests: dict) -> dict:
+        # Fan-out: enviar todo y después recibir (los shards trabajan en paralelo)
+        for shard, message in requests.items():
+            self._conns[shard].send(message)
+        replies = {}
+        for shard in requests:
+            reply = self._conns[shard].recv()
+            if isinstance(reply, Exception):
+                raise reply
+            replies[shard] = reply
+        return replies
+
+    def _call(self, shard: int, op: str, arg=None):
+        return self._call_all({shard: (op, arg)})[shard]
+
+    # ----------------------- ESCRITURAS -----------------------
+
+    def insert(self, key):
+        shard = self._shard_of(key)
+        # Los lotes aplican inserciones antes que eliminaciones: una
+        # eliminación pendiente del mismo shard se envía primero
+        if self._pending_delete[shard]:
+            self.flush()
+        pending = self._pending_insert[shard]
+        pending.append(key)
+        if len(pending) >= self.batch_size:
+            self.flush()
+
+    def delete(self, key):
+        shard = self._shard_of(key)
+        # Una inserción pendiente de la misma clave se aplica antes
+        if self._pending_insert[shard]:
+            self.flush()
+        pending = self._pending_delete[shard]
+        pending.append(key)
+        if len(pending) >= self.batch_size:
+            self.flush()
+
+    def insert_many(self, keys):
+        # flush() aplica inserciones antes que eliminaciones: las
+        # eliminaciones pendientes se envían primero
+        self.flush()
+        for shard, part in enumerate(self._partition(keys)):
+            self._pending_insert[shard].extend(part)
+        self.flush()
+
+    def delete_many(self, keys):
+        self.flush()
+        for shard, part in enumerate(self._partition(keys)):
+            self._pending_delete[shard].extend(part)
+        self.flush()
+
+    def flush(self):
+        """
+        Envía los lotes pendientes (inserciones antes que eliminaciones) a
+        todos los shards a la vez.
+        """
+        for op, pending in (("insert_many", self._pending_insert),
+                            ("delete_many", self._pending_delete)):
+            # Sin ordenar: el front-end es la parte serial del throughput y
+            # cada worker ya ordena su lote
+            requests = {shard: (op, keys) for shard, keys in enumerate(pending) if keys}
+            if not requests:
+                continue
+            for shard, size in self._call_all(requests).items():
+                self.sizes[shard] = size
+                pending[shard] = []
+        if self.auto_rebalance:
+            self.rebalance()
+
+    # ----------------------- LECTURAS -----------------------
+
+    def search_many(self, keys) -> list:
+        """
+        Pertenencia de cada clave de `keys` (en el mismo orden), consultando
+        todos los shards en paralelo.
+        """
+        self.flush()
+        keys = list(keys)
+        positions = [[] for _ in self._conns]
+        parts = [[] for _ in self._conns]
+        for i, key in enumerate(keys):
+            shard = self._shard_of(key)
+            positions[shard].append(i)
+            parts[shard].append(key)
+        requests = {shard: ("search_many", part) for shard, part in enumerate(parts) if part}
+        result = [False] * len(keys)
+        for shard, found in self._call_all(requests).items():
+            for i, hit in zip(positions[shard], found):
+                result[i] = hit
+        return result
+
+    def __contains__(self, key) -> bool:
+        self.flush()
+        return self._call(self._shard_of(key), "search_many", [key])[0]
+
+    def range(self, lo=None, hi=None) -> list:
+        """
+        Claves k con lo <= k < hi. Solo se consultan los shards cuyo rango
+        se cruza con [lo, hi); como la partición es por rangos, unir los
+        resultados es concatenarlos en orden de shard.
+        """
+        self.flush()
+        first = 0 if lo is None else self._shard_of(lo)
+        last = len(self._conns) - 1 if hi is None else self._shard_of(hi)
+        requests = {shard: ("range", (lo, hi)) for shard in range(first, last + 1)}
+        replies = self._call_all(requests)
+        merged = []
+        for shard in range(first, last + 1):
+            merged.extend(replies[shard])
+        return merged
+
+    def __len__(self) -> int:
+        self.flush()
+        return sum(self.sizes)
+
+    # ----------------------- REBALANCEO -----------------------
+
+    def rebalance(self):
+        """
+        Mientras algún shard supere `imbalance` veces el tamaño medio, parte
+        sus claves por la mediana (split en el worker) y pasa una mitad al
+        vecino, que la une con join; la frontera se mueve a la mediana.
+        """
+        total = sum(self.sizes)
+        shards = len(self._conns)
+        if shards < 2:
+            return
+        mean = total / shards
+        for _ in range(shards):
+            shard = max(range(shards), key=self.sizes.__getitem__)
+            size = self.sizes[shard]
+            if size < self.min_rebalance or size <= self.imbalance * mean:
+                return
+            # Vecino más chico (el último shard solo puede ceder hacia abajo)
+            if shard == 0:
+                target = 1
+            elif shard == shards - 1:
+                target = shard - 1
+            else:
+                target = shard + 1 if self.sizes[shard + 1] <= self.sizes[shard - 1] else shard - 1
+            median = self._call(shard, "median")
+            upper = target > shard
+            moved = self._call(shard, "split_off", (median, upper))
+            if not moved:
+                return
+            self.sizes[target] = self._call(target, "absorb", (moved, not upper))
+            self.sizes[shard] = size - len(moved)
+            # La frontera entre shard y target pasa a ser la mediana
+            self.boundaries[min(shard, target)] = median
+            self.rebalance_count += 1
+
+    # ----------------------- CIERRE -----------------------
+
+    def close(self):
+        if not self._procs:
+            return
+        self.flush()
+        self._call_all({shard: ("close", None) for shard in range(len(self._conns))})
+        for conn, proc in zip(self._conns, self._procs):
+            conn.close()
+            proc.join()
+        self._conns, self._procs = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
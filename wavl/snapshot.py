@@ -0,0 +1,165 @@
+# wavl/snapshot.py
+#
+# Formato de snapshot en disco para WAVLTree: cabecera de 16 bytes seguida de
+# las claves en orden, como un bloque contiguo de int64. No hace falta guardar
+# rangos ni punteros: from_sorted reconstruye un árbol WAVL válido en O(n), y
+# mientras tanto el bloque ordenado se puede mapear en memoria (mmap) y
+# consultar por búsqueda binaria sin copiar nada.
+
+import bisect
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+_MAGIC = b"WVLS"
+_VERSION = 1
+# magic, versión, little-endian, flags (bit 0: order_stats), relleno, n
+_HEADER = struct.Struct("<4sBBBxq")
+_FLAG_ORDER_STATS = 1
+
+
+def write_snapshot(path, keys, order_stats: bool = False):
+    """
+    Escribe `keys` (iterable ya ordenado de enteros de 64 bits) en `path`.
+    Se escribe en un archivo temporal y se renombra al final, así un
+    proceso que lee el snapshot nunca ve uno a medio escribir.
+    """
+    try:
+        data = array("q", keys)
+    except (TypeError, OverflowError) as exc:
+        raise ValueError("el snapshot solo admite claves enteras de 64 bits") from exc
+
+    flags = _FLAG_ORDER_STATS if order_stats else 0
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, sys.byteorder == "little", flags, len(data)))
+        data.tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def _read_header(f, path):
+    raw = f.read(_HEADER.size)
+    if len(raw) < _HEADER.size:
+        raise ValueError(f"snapshot WAVL inválido: {path}")
+    magic, version, little, flags, n = _HEADER.unpack(raw)
+    if magic != _MAGIC:
+        raise ValueError(f"snapshot WAVL inválido: {path}")
+    if version != _VERSION:
+        raise ValueError(f"versión de snapshot no soportada: {version}")
+    return bool(little), bool(flags & _FLAG_ORDER_STATS), n
+
+
+def read_snapshot(path):
+    """
+    Lee el snapshot completo a memoria. Retorna (claves como array('q'),
+    order_stats).
+    """
+    with open(path, "rb") as f:
+        little, order_stats, n = _read_header(f, path)
+        keys = array("q")
+        keys.fromfile(f, n)
+    if little != (sys.byteorder == "little"):
+        keys.byteswap()
+    return keys, order_stats
+
+
+class SnapshotView:
+    """
+    Vista de solo lectura de un snapshot mapeado en memoria. Las claves se
+    leen directamente de las páginas del archivo: abrir la vista es O(1) y
+    cada consulta es una búsqueda binaria O(log n), sin construir nodos.
+
+    - `key in view`, `len(view)`, `iter(view)`
+    - `search(key)`, `floor`, `ceiling`, `range(lo, hi)`, `select(i)`, `rank(key)`
+    - `inflate()`: construye el árbol completo (from_sorted, O(n))
+
+    Si el archivo se escribió con otro orden de bytes se copia y convierte
+    en memoria (ya no es zero-copy, pero la interfaz es la misma).
+    """
+
+    def __init__(self, path, tree_cls):
+        self.path = path
+        self._tree_cls = tree_cls
+        self._mmap = None
+        with open(path, "rb") as f:
+            little, self.order_stats, n = _read_header(f, path)
+            if little == (sys.byteorder == "little") and n > 0:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                view = memoryview(self._mmap)[_HEADER.size:_HEADER.size + 8 * n]
+                self._keys = view.cast("q")
+                return
+        keys, _ = read_snapshot(path)
+        self._keys = keys
+
+    def close(self):
+        # Libera el mapeo; la vista deja de ser utilizable
+        if self._mmap is not None:
+            self._keys.release()
+            self._mmap.close()
+            self._mmap = None
+        self._keys = array("q")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # ----------------------- CONSULTAS -----------------------
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return self.search(key)
+
+    def search(self, key) -> bool:
+        keys = self._keys
+        i = bisect.bisect_left(keys, key)
+        return i < len(keys) and keys[i] == key
+
+    def floor(self, key):
+        # Mayor clave <= key, o None
+        i = bisect.bisect_right(self._keys, key)
+        return self._keys[i - 1] if i > 0 else None
+
+    def ceiling(self, key):
+        # Menor clave >= key, o None
+        i = bisect.bisect_left(self._keys, key)
+        return self._keys[i] if i < len(self._keys) else None
+
+    def range(self, lo=None, hi=None):
+        # Claves k con lo <= k < hi (None = sin cota), en orden
+        start = 0 if lo is None else bisect.bisect_left(self._keys, lo)
+        end = len(self._keys) if hi is None else bisect.bisect_left(self._keys, hi)
+        for i in range(start, end):
+            yield self._keys[i]
+
+    def select(self, i: int):
+        # i-ésima clave más pequeña (i negativo cuenta desde el final)
+        n = len(self._keys)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice fuera de rango")
+        return self._keys[i]
+
+    def rank(self, key) -> int:
+        # Número de claves estrictamente menores que `key`
+        return bisect.bisect_left(self._keys, key)
+
+    def inflate(self):
+        """
+        Construye el árbol en memoria con from_sorted (O(n), sin rebalanceos).
+        La vista sigue abierta; se puede cerrar después.
+        """
+        return self._tree_cls.from_sorted(self._keys, order_stats=self.order_stats)
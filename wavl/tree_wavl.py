@@ -2,112 +2,199 @@
 
 from typing import Optional
 from node_wavl import NodeWAVL
-from utils_wavl import get_rank, rank_differences
+from utils_wavl import get_rank
+from utils_bst import (build_balanced, climb_for, descend, OrderedTreeMixin,
+                       add_size, get_size, update_size)
+from snapshot import SnapshotView, read_snapshot, write_snapshot
 
-class WAVLTree:
-    def __init__(self):
+class WAVLTree(OrderedTreeMixin):
+    def __init__(self, order_stats: bool = False):
         self.root: Optional[NodeWAVL] = None
+        # Si es True se mantiene el tamaño de cada subárbol (select/rank)
+        self.order_stats = order_stats
         # Contadores para benchmarking
         self.promote_count = 0
         self.demote_count = 0
         self.rotation_count = 0
-
-    def search(self, key) -> Optional[NodeWAVL]:
-        return self._search_rec(self.root, key)
-
-    def _search_rec(self, node: Optional[NodeWAVL], key) -> Optional[NodeWAVL]:
-        if node is None:
-            return None
-        if key == node.key:
+        # Se incrementa en cada cambio del conjunto de claves: invalida
+        # cachés derivados (search_many, freeze)
+        self._version = 0
+        self._keys_cache = None
+        self._frozen = None
+
+    @classmethod
+    def from_sorted(cls, iterable, order_stats: bool = False) -> "WAVLTree":
+        """
+        Construye el árbol en O(n) a partir de claves ordenadas, sin pasar por
+        insert. Con entrada desordenada ordena primero (sorted es O(n) si ya
+        viene ordenada). Cada rango es la altura de su subárbol: un árbol
+        perfectamente balanceado cumple las reglas WAVL.
+        """
+        keys = sorted(iterable)
+
+        def make_node(key, size, depth):
+            node = NodeWAVL(key)
+            node.rank = size.bit_length() - 1
+            node.size = size
             return node
-        elif key < node.key:
-            return self._search_rec(node.left, key)
-        else:
-            return self._search_rec(node.right, key)
 
+        tree = cls(order_stats)
+        tree.root = build_balanced(keys, make_node)
+        return tree
+
+    # ----------------------- SNAPSHOT -----------------------
+
+    def save(self, path):
+        """
+        Guarda las claves en orden en un snapshot binario (ver snapshot.py).
+        Solo admite claves enteras de 64 bits. Retorna el número de claves.
+        """
+        return write_snapshot(path, iter(self), self.order_stats)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True):
+        """
+        Abre un snapshot guardado con save(). Con mmap=True retorna una
+        SnapshotView: el archivo se mapea en memoria y se puede consultar de
+        inmediato (búsqueda binaria), y view.inflate() construye el árbol
+        cuando haga falta. Con mmap=False lee las claves y retorna el árbol
+        construido con from_sorted, en O(n).
+        """
+        if mmap:
+            return SnapshotView(path, cls)
+        keys, order_stats = read_snapshot(path)
+        return cls.from_sorted(keys, order_stats=order_stats)
+
+    def search(self, key) -> Optional[NodeWAVL]:
+        # Descenso iterativo: sin un frame de Python por nivel
+        node = self.root
+        while node is not None:
+            if key == node.key:
+                return node
+            node = node.left if key < node.key else node.right
+        return None
 
     def insert(self, key):
         if self.root is None:
             self.root = NodeWAVL(key)
+            self._version += 1
             return
 
-        new_node = self._insert_rec(self.root, key)
+        new_node = self._bst_insert(self.root, key)
         self._fix_insert(new_node)
 
-    def _insert_rec(self, node: NodeWAVL, key) -> NodeWAVL:
-        if key < node.key:
-            if node.left is None:
-                new_node = NodeWAVL(key)
-                node.left = new_node
-                new_node.parent = node
-                return new_node
+    def _bst_insert(self, node: NodeWAVL, key) -> NodeWAVL:
+        # Baja iterativamente hasta la hoja donde cuelga la nueva clave
+        # (las claves repetidas van al subárbol derecho).
+        while True:
+            if key < node.key:
+                if node.left is None:
+                    new_node = NodeWAVL(key)
+                    node.left = new_node
+                    break
+                node = node.left
             else:
-                return self._insert_rec(node.left, key)
-        else:
-            if node.right is None:
-                new_node = NodeWAVL(key)
-                node.right = new_node
-                new_node.parent = node
-                return new_node
-            else:
-                return self._insert_rec(node.right, key)
+                if node.right is None:
+                    new_node = NodeWAVL(key)
+                    node.right = new_node
+                    break
+                node = node.right
+
+        new_node.parent = node
+        if self.order_stats:
+            add_size(node, 1)
+        self._version += 1
+        return new_node
+
+    def insert_many(self, keys):
+        """
+        Inserta un lote de claves en una sola pasada ordenada: cada inserción
+        parte de la hoja insertada antes (finger) y solo sube hasta el
+        ancestro que cubre la nueva clave, en vez de bajar desde la raíz.
+        """
+        finger = self.finger()
+        for key in sorted(keys):
+            finger.insert(key)
+
+    def _insert_from(self, start: Optional[NodeWAVL], key) -> NodeWAVL:
+        # Inserta bajando desde `start` (None = la raíz), rebalancea y
+        # retorna el nodo nuevo. Lo usan insert_many y Finger.insert.
+        if self.root is None:
+            self.root = NodeWAVL(key)
+            self._version += 1
+            return self.root
+        node = self._bst_insert(self.root if start is None else start, key)
+        self._fix_insert(node)
+        return node
 
     def _fix_insert(self, node: NodeWAVL):
-        current = node.parent
-
-        while current is not None:
-            rd_left, rd_right = rank_differences(current)
-
-            # Si ambas diferencias >= 2 → no hubo violación → terminamos
-            if rd_left >= 2 and rd_right >= 2:
-                break
-
-            # Si alguna diferencia < 1 → promovemos current
-            if rd_left < 1 or rd_right < 1:
-                self._promote(current)
-
-                # Recalculamos tras la promoción
-                new_rd_left, new_rd_right = rank_differences(current)
-                # Si ambas diferencias < 1 tras promover → caso doble 0-0
-                if new_rd_left < 1 and new_rd_right < 1:
-                    left_child = current.left
-                    right_child = current.right
-
-                    # LL case: izquierda-izquierda
-                    if left_child is not None and rank_differences(left_child)[0] < 1:
-                        new_root = self._rotate_right(current)
-                        new_root.rank += 1    # promoción adicional
-                        current.rank -= 1     # democión
-
-                    # LR case: izquierda-derecha
-                    elif left_child is not None:
-                        self._rotate_left(left_child)
-                        new_root = self._rotate_right(current)
-                        new_root.rank += 1
-                        new_root.right.rank -= 1
-
-                    # RR case: derecha-derecha
-                    elif right_child is not None and rank_differences(right_child)[1] < 1:
-                        new_root = self._rotate_left(current)
-                        new_root.rank += 1
-                        current.rank -= 1
-
-                    # RL case: derecha-izquierda
-                    elif right_child is not None:
-                        self._rotate_right(right_child)
-                        new_root = self._rotate_left(current)
-                        new_root.rank += 1
-                        new_root.left.rank -= 1
-
-                    # Tras rotar, terminamos
-                    return
-
-                # Si no fue doble 0-0, subimos y seguimos
-                current = current.parent
+        # `node` acaba de entrar (o de ser promovido). Mientras sea 0-hijo de su
+        # padre hay violación de la regla de rangos.
+        # Los rangos se leen una vez por nivel y se guardan en locales: el bucle
+        # no crea tuplas ni llama a get_rank/rank_differences.
+        parent = node.parent
+        rank = node.rank
+
+        while parent is not None and parent.rank == rank:
+            is_left = parent.left is node
+            sibling = parent.right if is_left else parent.left
+            sibling_rank = -1 if sibling is None else sibling.rank
+
+            # Caso 1: el hermano es 1-hijo → promovemos parent y subimos
+            if rank - sibling_rank == 1:
+                rank += 1
+                parent.rank = rank
+                self.promote_count += 1
+                node = parent
+                parent = node.parent
                 continue
 
-            # Si llegamos aquí, ambas diferencias estaban en {1,2} → no violación
-            break
+            # Caso 2: parent es 0,2 → rotación (simple o doble)
+            left, right = node.left, node.right
+            rd_left = rank - (-1 if left is None else left.rank)
+            rd_right = rank - (-1 if right is None else right.rank)
+            if is_left:
+                if rd_right == 2:
+                    # LL: rotación simple a la derecha
+                    self._rotate_right(parent)
+                    parent.rank -= 1
+                    self.demote_count += 1
+                    return
+                if rd_left == 2:
+                    # LR: rotación doble (right es el nieto interior)
+                    self._rotate_left(node)
+                    self._rotate_right(parent)
+                    right.rank += 1
+                    node.rank -= 1
+                    parent.rank -= 1
+                    self.promote_count += 1
+                    self.demote_count += 2
+                    return
+                # node es 1,1 (solo ocurre en join): rotación simple y node
+                # sube un rango; puede quedar como 0-hijo de su nuevo padre
+                self._rotate_right(parent)
+            else:
+                if rd_left == 2:
+                    # RR: rotación simple a la izquierda
+                    self._rotate_left(parent)
+                    parent.rank -= 1
+                    self.demote_count += 1
+                    return
+                if rd_right == 2:
+                    # RL: rotación doble (left es el nieto interior)
+                    self._rotate_right(node)
+                    self._rotate_left(parent)
+                    left.rank += 1
+                    node.rank -= 1
+                    parent.rank -= 1
+                    self.promote_count += 1
+                    self.demote_count += 2
+                    return
+                self._rotate_left(parent)
+            rank += 1
+            node.rank = rank
+            self.promote_count += 1
+            parent = node.parent
 
     # ----------------------- DELETE -----------------------
 
@@ -116,120 +203,144 @@ class WAVLTree:
         if target is None:
             return
 
-        parent = target.parent
-        new_subroot = self._delete_rec(self.root, key)
-        if new_subroot is not None and new_subroot.parent is None:
-            self.root = new_subroot
-
-        if parent is not None:
-            self._fix_delete(parent)
-        else:
-            if self.root is not None:
-                self._fix_delete(self.root)
-
-    def _delete_rec(self, node: Optional[NodeWAVL], key) -> Optional[NodeWAVL]:
-
-        if node is None:
-            return None
-
-        if key < node.key:
-            node.left = self._delete_rec(node.left, key)
-            if node.left:
-                node.left.parent = node
-        elif key > node.key:
-            node.right = self._delete_rec(node.right, key)
-            if node.right:
-                node.right.parent = node
+        node, parent = self._remove_node(target)
+        self._fix_delete(node, parent)
+
+    def delete_many(self, keys):
+        """
+        Elimina un lote de claves en una sola pasada ordenada, buscando cada
+        una desde el punto donde terminó la eliminación anterior (finger).
+        """
+        finger = self.root
+        for key in sorted(keys):
+            if self.root is None:
+                return
+            target, finger = descend(climb_for(finger, key), key)
+            if target is None:
+                continue
+            node, parent = self._remove_node(target)
+            self._fix_delete(node, parent)
+            # El padre del nodo quitado sigue en el árbol tras rebalancear
+            finger = parent if parent is not None else self.root
+
+    def _remove_node(self, node: NodeWAVL) -> tuple[Optional[NodeWAVL], Optional[NodeWAVL]]:
+        # Dos hijos: copiar la clave del sucesor in-order y eliminar el sucesor
+        if node.left is not None and node.right is not None:
+            succ = node.right
+            while succ.left:
+                succ = succ.left
+            node.key = succ.key
+            node = succ
+
+        # Ahora `node` tiene a lo sumo un hijo: lo reemplazamos por él
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        if child is not None:
+            child.parent = parent
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
         else:
-            # Encontramos el nodo a eliminar
-            if node.left is None and node.right is None:
-                return None
-            elif node.left is None:
-                replacement = node.right
-                replacement.parent = node.parent
-                return replacement
-            elif node.right is None:
-                replacement = node.left
-                replacement.parent = node.parent
-                return replacement
-            else:
-                # Intercambiar con sucesor in-order
-                succ = node.right
-                while succ.left:
-                    succ = succ.left
-                node.key = succ.key
-                node.right = self._delete_rec(node.right, succ.key)
-                if node.right:
-                    node.right.parent = node
-
-        return node
+            parent.right = child
+        if self.order_stats:
+            add_size(parent, -1)
+        self._version += 1
 
-    def _fix_delete(self, node: NodeWAVL):
-        current = node
+        # Retorna el hijo que ocupó el hueco (puede ser None) y su padre
+        return child, parent
 
-        while current is not None:
-            rd_left, rd_right = rank_differences(current)
+    def _fix_delete(self, node: Optional[NodeWAVL], parent: Optional[NodeWAVL]):
+        # `node` ocupa el lugar del nodo eliminado (puede ser None) bajo `parent`
+        if parent is None:
+            return
 
-            # 1) Si ambas diferencias en {1,2}, terminamos
-            if 1 <= rd_left <= 2 and 1 <= rd_right <= 2:
+        # Si parent quedó como hoja 2,2 → demovemos y seguimos desde él
+        if parent.left is None and parent.right is None and parent.rank == 1:
+            parent.rank = 0
+            self.demote_count += 1
+            node = parent
+            parent = node.parent
+
+        # Mientras `node` sea 3-hijo de su padre hay violación. Igual que en
+        # _fix_insert, los rangos viajan en locales (sin tuplas por nivel).
+        rank = -1 if node is None else node.rank
+        while parent is not None:
+            parent_rank = parent.rank
+            if parent_rank - rank != 3:
                 break
-
-            # 2) Si alguna diferencia > 2 → demovemos current
-            if rd_left > 2 or rd_right > 2:
-                self._demote(current)
-                new_rd_left, new_rd_right = rank_differences(current)
-
-                # 2a) Si ahora ambas diferencias en {1,2} → subimos
-                if 1 <= new_rd_left <= 2 and 1 <= new_rd_right <= 2:
-                    current = current.parent
-                    continue
-
-                # 2b) Si alguna diferencia < 1 tras demover → rotación y terminamos
-                left_child = current.left
-                right_child = current.right
-
-                # Caso “lado izquierdo demasiado bajo” (rd_left > 2 antes)
-                if rd_left > 2:
-                    if left_child is not None and rank_differences(left_child)[0] > 1:
-                        # LL deletion case
-                        new_root = self._rotate_right(current)
-                        new_root.rank -= 1
-                        current.rank -= 1
-                    else:
-                        # LR deletion case
-                        self._rotate_left(left_child)
-                        new_root = self._rotate_right(current)
-                        new_root.rank -= 1
-                        new_root.right.rank += 1
-                    return
-
-                # Caso “lado derecho demasiado bajo” (rd_right > 2 antes)
-                if rd_right > 2:
-                    if right_child is not None and rank_differences(right_child)[1] > 1:
-                        # RR deletion case
-                        new_root = self._rotate_left(current)
-                        new_root.rank -= 1
-                        current.rank -= 1
-                    else:
-                        # RL deletion case
-                        self._rotate_right(right_child)
-                        new_root = self._rotate_left(current)
-                        new_root.rank -= 1
-                        new_root.left.rank += 1
+            is_left = parent.left is node
+            # Un 3-hijo siempre tiene hermano (rango >= parent_rank - 2 >= 0)
+            sibling = parent.right if is_left else parent.left
+            sibling_rank = sibling.rank
+
+            # Caso 1: el hermano es 2-hijo → demovemos parent y subimos
+            if parent_rank - sibling_rank == 2:
+                parent.rank = parent_rank - 1
+                self.demote_count += 1
+            else:
+                s_left, s_right = sibling.left, sibling.right
+                rd_left = sibling_rank - (-1 if s_left is None else s_left.rank)
+                rd_right = sibling_rank - (-1 if s_right is None else s_right.rank)
+                # Caso 2: hermano 1-hijo y 2,2 → doble democión y subimos
+                if rd_left == 2 and rd_right == 2:
+                    sibling.rank = sibling_rank - 1
+                    parent.rank = parent_rank - 1
+                    self.demote_count += 2
+                else:
+                    # Caso 3: rotación (simple o doble) y terminamos
+                    self._rotate_delete(parent, sibling, is_left, rd_left, rd_right)
                     return
 
-                # 2c) Si tras demover alguna diferencia sigue > 2 → subimos y continuamos
-                current = current.parent
-                continue
-
-            # 3) Si alguna diferencia < 1 tras eliminación directa → demovemos y subimos
-            if rd_left < 1 or rd_right < 1:
-                self._demote(current)
-                current = current.parent
-                continue
+            node = parent
+            rank = parent_rank - 1
+            parent = node.parent
+
+    def _rotate_delete(self, parent: NodeWAVL, sibling: NodeWAVL, is_left: bool,
+                       rd_left: int, rd_right: int):
+        # rd_left/rd_right: diferencias de rango de los hijos de `sibling`
+        if is_left:
+            inner = sibling.left
+            if rd_right == 1:
+                # RR: rotación simple a la izquierda
+                self._rotate_left(parent)
+                self._rotate_delete_single(parent, sibling)
+            else:
+                # RL: rotación doble
+                self._rotate_right(sibling)
+                self._rotate_left(parent)
+                self._rotate_delete_double(parent, sibling, inner)
+        else:
+            inner = sibling.right
+            if rd_left == 1:
+                # LL: rotación simple a la derecha
+                self._rotate_right(parent)
+                self._rotate_delete_single(parent, sibling)
+            else:
+                # LR: rotación doble
+                self._rotate_left(sibling)
+                self._rotate_right(parent)
+                self._rotate_delete_double(parent, sibling, inner)
+
+    def _rotate_delete_single(self, parent: NodeWAVL, sibling: NodeWAVL):
+        # sibling sube un rango y parent baja uno; si parent quedó hoja debe
+        # tener rango 0 (baja otro más)
+        sibling.rank += 1
+        self.promote_count += 1
+        if parent.left is None and parent.right is None:
+            parent.rank -= 2
+            self.demote_count += 2
+        else:
+            parent.rank -= 1
+            self.demote_count += 1
 
-            # 4) Si llegamos aquí, no hay más violaciones → terminamos
-            break
+    def _rotate_delete_double(self, parent: NodeWAVL, sibling: NodeWAVL, inner: NodeWAVL):
+        # El nieto interior sube dos rangos, sibling baja uno y parent dos
+        inner.rank += 2
+        sibling.rank -= 1
+        parent.rank -= 2
+        self.promote_count += 2
+        self.demote_count += 3
 
     # ----------------------- PROMOTE / DEMOTE -----------------------
 
@@ -269,6 +380,10 @@ class WAVLTree:
             else:
                 parent_of_z.right = y
 
+        if self.order_stats:
+            update_size(z)
+            update_size(y)
+
         return y
 
     def _rotate_left(self, z: NodeWAVL) -> NodeWAVL:
@@ -297,63 +412,165 @@ class WAVLTree:
             else:
                 parent_of_z.right = y
 
+        if self.order_stats:
+            update_size(z)
+            update_size(y)
+
         return y
 
-    # ----------------------- SPLIT -----------------------
-    def split(self, key) -> tuple["WAVLTree", "WAVLTree"]:
-        node = self.search(key)
-        if node is None:
-            self.insert(key)
-            node = self.search(key)
-
-        left_sub = node.left
-        right_sub = node.right
-        node.left = None
-        node.right = None
-        if left_sub:
-            left_sub.parent = None
-        if right_sub:
-            right_sub.parent = None
-
-        treeL = WAVLTree()
-        treeR = WAVLTree()
-        treeL.root = left_sub
-        treeR.root = right_sub
-
-        if treeL.root is not None:
-            treeL._fix_delete(treeL.root)
-        if treeR.root is not None:
-            treeR._fix_delete(treeR.root)
+    # ----------------------- JOIN (nodos) -----------------------
+
+    def _join(self, left: Optional[NodeWAVL], pivot: NodeWAVL,
+              right: Optional[NodeWAVL]) -> NodeWAVL:
+        """
+        Une los subárboles `left` <= pivot <= `right` (raíces sin padre) usando
+        `pivot` como nodo de enlace. Baja por la espina del subárbol de mayor
+        rango hasta alcanzar el rango del otro, cuelga ahí el pivote y
+        rebalancea como en una inserción: O(|rank(left) - rank(right)| + 1).
+        Retorna la nueva raíz (usa self.root como raíz de trabajo).
+        """
+        r_left, r_right = get_rank(left), get_rank(right)
+
+        if abs(r_left - r_right) <= 1:
+            pivot.left, pivot.right, pivot.parent = left, right, None
+            pivot.rank = max(r_left, r_right) + 1
+            if left is not None:
+                left.parent = pivot
+            if right is not None:
+                right.parent = pivot
+            if self.order_stats:
+                update_size(pivot)
+            return pivot
+
+        if r_left > r_right:
+            # Espina derecha de `left` hasta un nodo de rango r_right o r_right + 1
+            parent, node = None, left
+            while get_rank(node) > r_right + 1:
+                parent, node = node, node.right
+            pivot.left, pivot.right = node, right
+            parent.right = pivot
+            other = right
+            self.root = left
+        else:
+            # Espina izquierda de `right` hasta un nodo de rango r_left o r_left + 1
+            parent, node = None, right
+            while get_rank(node) > r_left + 1:
+                parent, node = node, node.left
+            pivot.left, pivot.right = left, node
+            parent.left = pivot
+            other = left
+            self.root = right
+
+        pivot.parent = parent
+        if node is not None:
+            node.parent = pivot
+        if other is not None:
+            other.parent = pivot
+        pivot.rank = max(get_rank(node), get_rank(other)) + 1
+        if self.order_stats:
+            # La espina sobre el pivote gana el pivote y el subárbol `other`
+            update_size(pivot)
+            add_size(parent, get_size(other) + 1)
+
+        # El pivote puede quedar como 0-hijo de `parent`
+        self._fix_insert(pivot)
+        return self.root
 
+    # ----------------------- SPLIT -----------------------
+    def split(self, key, keep_equal: bool = False) -> tuple["WAVLTree", "WAVLTree"]:
+        """
+        Parte el árbol en (claves < key, claves > key) en O(log n). Todas las
+        ocurrencias de `key` se descartan; con keep_equal=True van a la
+        mitad derecha, que queda con las claves >= key.
+        Los nodos se reutilizan: self queda vacío.
+        """
+        left_root, right_root = self._split_nodes(self.root, key, equal_right=True)
+        if not keep_equal:
+            # Las copias de `key` son las mínimas de la mitad derecha
+            _, right_root = self._split_nodes(right_root, key, equal_right=False)
+
+        treeL = type(self)(self.order_stats)
+        treeR = type(self)(self.order_stats)
+        treeL.root = left_root
+        treeR.root = right_root
+
+        self.root = None
+        self._version += 1
         return treeL, treeR
 
+    def _split_nodes(self, root: Optional[NodeWAVL], key, equal_right: bool):
+        """
+        Parte el subárbol `root` en (claves < key, claves >= key) si
+        equal_right, o en (claves <= key, claves > key) si no. No se detiene
+        en una clave igual: con claves repetidas las copias pueden estar en
+        los dos subárboles de un nodo igual, así que el camino baja hasta
+        una hoja y cada copia cae del lado que le corresponde.
+        """
+        # 1) Descenso registrando el camino
+        path = []
+        node = root
+        while node is not None:
+            goes_right = key < node.key or (equal_right and key == node.key)
+            path.append((node, goes_right))
+            node = node.left if goes_right else node.right
+
+        # 2) Subida: cada nodo del camino actúa como pivote de un join con su
+        # otro subárbol. Los rangos crecen a lo largo del camino, así que el
+        # costo total de los joins es telescópico: O(log n).
+        left_root, right_root = None, None
+        for node, goes_right in reversed(path):
+            if goes_right:
+                sub = node.right
+                if right_root is not None:
+                    right_root.parent = None
+                if sub is not None:
+                    sub.parent = None
+                right_root = self._join(right_root, node, sub)
+            else:
+                sub = node.left
+                if left_root is not None:
+                    left_root.parent = None
+                if sub is not None:
+                    sub.parent = None
+                left_root = self._join(sub, node, left_root)
+
+        if left_root is not None:
+            left_root.parent = None
+        if right_root is not None:
+            right_root.parent = None
+        return left_root, right_root
+
     # ----------------------- JOIN -----------------------
     def join(self, other: "WAVLTree") -> "WAVLTree":
-        if self.root is None:
-            return other
-        if other.root is None:
-            return self
-
-        min_node = other.root
-        while min_node.left:
-            min_node = min_node.left
-        k = min_node.key
-        other.delete(k)
-
-        pivot = NodeWAVL(k)
-        left_rank = get_rank(self.root)
-        right_rank = get_rank(other.root)
-        pivot.rank = max(left_rank, right_rank) + 1
-
-        pivot.left = self.root
-        self.root.parent = pivot
-
-        pivot.right = other.root
-        if other.root:
-            other.root.parent = pivot
-
-        joined = WAVLTree()
-        joined.root = pivot
-        joined._fix_delete(pivot)
+        """
+        Une self con `other`, cuyas claves deben ser todas mayores o iguales,
+        en O(log n). El mínimo de `other` se desengancha y sirve de pivote.
+        Siempre retorna un árbol nuevo; los nodos se reutilizan y self y
+        other quedan vacíos (también si alguno ya lo estaba).
+        """
+        if self.root is None or other.root is None:
+            # Con un lado vacío el resultado es el otro, igual que en el caso general
+            # en un árbol nuevo
+            source = other if self.root is None else self
+            joined = type(self)(source.order_stats)
+            joined.root = source.root
+            self.root = None
+            other.root = None
+            self._version += 1
+            other._version += 1
+            return joined
+
+        pivot = other.root
+        while pivot.left:
+            pivot = pivot.left
+        node, parent = other._remove_node(pivot)
+        other._fix_delete(node, parent)
+
+        # Los tamaños solo son válidos si ambos árboles los mantenían
+        joined = type(self)(self.order_stats and other.order_stats)
+        joined.root = joined._join(self.root, pivot, other.root)
+        self.root = None
+        other.root = None
+        self._version += 1
+        other._version += 1
         return joined
-
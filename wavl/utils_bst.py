@@ -0,0 +1,510 @@
+# wavl/utils_bst.py
+#
+# Funciones auxiliares comunes a WAVLTree, AVLTree y RBTree: solo usan los
+# campos key/left/right/parent que comparten los tres tipos de nodo.
+
+import bisect
+import gc
+from frozen_view import FrozenView
+
+try:
+    import numpy as np
+except ImportError:     # numpy es opcional: sin él search_many usa listas y bisect
+    np = None
+
+# search_many aplana el árbol (O(n), ~8 veces más barato por clave que una
+# bajada completa) solo para lotes de al menos n / 8 claves, y nunca para
+# menos de SEARCH_MANY_MIN_BATCH, salvo que el arreglo ya esté cacheado
+SEARCH_MANY_MIN_BATCH = 256
+
+
+def build_balanced(keys, make_node):
+    """
+    Construye en O(n) un BST perfectamente balanceado a partir de `keys`
+    (lista ya ordenada) y retorna su raíz.
+    `make_node(key, size, depth)` crea cada nodo: `size` es el número de
+    claves de su subárbol (su altura es size.bit_length() - 1) y `depth` su
+    profundidad, para que cada árbol fije su rango, altura, color y tamaño.
+    El recorrido es iterativo.
+    """
+    if not keys:
+        return None
+
+    # La construcción no genera basura, pero sí muchos objetos enlazados en
+    # ciclos (parent): pausamos el GC para que no recorra el árbol una y
+    # otra vez mientras crece.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _build_balanced(keys, make_node)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _build_balanced(keys, make_node):
+    root = None
+    stack = [(0, len(keys), None, False, 0)]
+    while stack:
+        lo, hi, parent, is_left, depth = stack.pop()
+        mid = (lo + hi) // 2
+        node = make_node(keys[mid], hi - lo, depth)
+        node.parent = parent
+        if parent is None:
+            root = node
+        elif is_left:
+            parent.left = node
+        else:
+            parent.right = node
+
+        if lo < mid:
+            stack.append((lo, mid, node, True, depth + 1))
+        if mid + 1 < hi:
+            stack.append((mid + 1, hi, node, False, depth + 1))
+    return root
+
+
+def climb_for(node, key):
+    """
+    Sube desde `node` por los punteros parent hasta el primer ancestro cuyo
+    subárbol puede contener `key` (finger). Desde ahí basta un descenso
+    normal, así que el costo depende de la distancia entre claves y no de
+    la altura del árbol. Las claves repetidas van a la derecha.
+
+    Retorna el nodo más profundo del camino desde el que el descenso es
+    válido: al subir como hijo derecho (yendo a la derecha) la cota que
+    falta no cambia, así que no hace falta bajar desde ese ancestro. Si la
+    clave cae fuera de todo el árbol (p. ej. claves crecientes que se
+    agregan al final) se baja desde el nodo del borde y no desde la raíz.
+    """
+    start = node
+    if key >= node.key:
+        # Hacia la derecha: la cota inferior ya está garantizada, se busca
+        # un ancestro del que colguemos por la izquierda con key < parent.key
+        while node.parent is not None:
+            parent = node.parent
+            if parent.left is node:
+                if key < parent.key:
+                    break
+                start = parent
+            node = parent
+    else:
+        # Hacia la izquierda: estricto, para que una clave igual a la del
+        # ancestro no se busque solo en su subárbol derecho
+        while node.parent is not None:
+            parent = node.parent
+            if parent.right is node:
+                if key > parent.key:
+                    break
+                start = parent
+            node = parent
+    return start
+
+
+def descend(node, key):
+    """
+    Busca `key` bajando desde `node`. Retorna (nodo encontrado o None,
+    último nodo visitado), que sirve como finger para la siguiente búsqueda.
+    """
+    last = node
+    while node is not None:
+        if key == node.key:
+            return node, node
+        last = node
+        node = node.left if key < node.key else node.right
+    return None, last
+
+
+class Finger:
+    """
+    Posición recordada dentro de un árbol (la crea tree.finger(key)). Cada
+    search/insert sube desde el último nodo visitado hasta el ancestro que
+    cubre la clave (climb_for) y baja desde ahí, así el costo es O(log d)
+    en la distancia d (en orden) desde la operación anterior, no O(log n).
+
+    Además recuerda el primer y el último nodo del árbol: una clave fuera
+    del rango actual (claves crecientes que se agregan al final, como una
+    serie de tiempo) se inserta directo junto al borde, sin subir.
+
+    Si el árbol cambió por otro camino (tree.insert, delete, split, ...)
+    los nodos recordados pudieron salir del árbol o recibir otra clave: el
+    finger lo detecta con el contador _version del árbol y vuelve a la raíz.
+    """
+
+    __slots__ = ("tree", "node", "_first", "_last", "_version")
+
+    def __init__(self, tree, node=None):
+        self.tree = tree
+        self.node = node
+        self._first = None
+        self._last = None
+        self._version = tree._version
+
+    def _start(self, key):
+        tree = self.tree
+        if self._version != tree._version:
+            self.node = self._first = self._last = None
+            self._version = tree._version
+        node = self.node
+        if node is None:
+            return tree.root
+        # Bordes: el primer y el último nodo en orden siguen siéndolo tras
+        # las rotaciones, que no cambian el orden
+        if key >= node.key:
+            last = self._last
+            if last is None:
+                last = self._last = last_node(tree.root)
+            if key >= last.key:
+                return last
+        else:
+            first = self._first
+            if first is None:
+                first = self._first = first_node(tree.root)
+            if key <= first.key:
+                return first
+        return climb_for(node, key)
+
+    def search(self, key):
+        """
+        Como tree.search(key): retorna el nodo o None, y deja el finger en
+        el último nodo visitado.
+        """
+        start = self._start(key)
+        if start is None:
+            return None
+        found, self.node = descend(start, key)
+        return found
+
+    def insert(self, key):
+        # Como tree.insert(key); el finger queda en el nodo nuevo
+        tree = self.tree
+        node = tree._insert_from(self._start(key), key)
+        if self._last is not None and key >= self._last.key:
+            self._last = node
+        if self._first is not None and key < self._first.key:
+            self._first = node
+        self.node = node
+        self._version = tree._version
+
+
+# ----------------------- TAMAÑO DE SUBÁRBOL -----------------------
+
+def get_size(node) -> int:
+    if node is None:
+        return 0
+    return node.size
+
+
+def update_size(node):
+    # Recalcula el tamaño de `node` a partir de sus hijos (tras una rotación)
+    node.size = 1 + get_size(node.left) + get_size(node.right)
+
+
+def add_size(node, delta: int):
+    # Suma `delta` al tamaño de `node` y de todos sus ancestros
+    while node is not None:
+        node.size += delta
+        node = node.parent
+
+
+# ----------------------- NAVEGACIÓN ORDENADA -----------------------
+
+def first_node(node):
+    # Nodo mínimo del subárbol (o None)
+    if node is None:
+        return None
+    while node.left is not None:
+        node = node.left
+    return node
+
+
+def last_node(node):
+    # Nodo máximo del subárbol (o None)
+    if node is None:
+        return None
+    while node.right is not None:
+        node = node.right
+    return node
+
+
+def next_node(node):
+    """
+    Sucesor in-order usando solo punteros parent: O(1) memoria extra y
+    O(1) amortizado al recorrer el árbol completo.
+    """
+    if node.right is not None:
+        return first_node(node.right)
+    parent = node.parent
+    while parent is not None and parent.right is node:
+        node = parent
+        parent = node.parent
+    return parent
+
+
+def prev_node(node):
+    # Predecesor in-order (simétrico de next_node)
+    if node.left is not None:
+        return last_node(node.left)
+    parent = node.parent
+    while parent is not None and parent.left is node:
+        node = parent
+        parent = node.parent
+    return parent
+
+
+def ceiling_node(root, key):
+    # Primer nodo (in-order) con clave >= key
+    best = None
+    node = root
+    while node is not None:
+        if node.key >= key:
+            best = node
+            node = node.left
+        else:
+            node = node.right
+    return best
+
+
+def higher_node(root, key):
+    # Primer nodo con clave > key
+    best = None
+    node = root
+    while node is not None:
+        if node.key > key:
+            best = node
+            node = node.left
+        else:
+            node = node.right
+    return best
+
+
+def floor_node(root, key):
+    # Último nodo con clave <= key
+    best = None
+    node = root
+    while node is not None:
+        if node.key <= key:
+            best = node
+            node = node.right
+        else:
+            node = node.left
+    return best
+
+
+def lower_node(root, key):
+    # Último nodo con clave < key
+    best = None
+    node = root
+    while node is not None:
+        if node.key < key:
+            best = node
+            node = node.right
+        else:
+            node = node.left
+    return best
+
+
+class OrderedTreeMixin:
+    """
+    Recorridos ordenados para cualquier árbol con atributo `root` y nodos con
+    key/left/right/parent (WAVLTree, AVLTree, RBTree). Los iteradores son
+    generadores perezosos que avanzan por punteros parent: O(log n + k) para
+    k claves y O(1) memoria extra. No se debe modificar el árbol mientras se
+    itera sobre él.
+    """
+
+    def __iter__(self):
+        node = first_node(self.root)
+        while node is not None:
+            yield node.key
+            node = next_node(node)
+
+    def __reversed__(self):
+        node = last_node(self.root)
+        while node is not None:
+            yield node.key
+            node = prev_node(node)
+
+    def range(self, lo=None, hi=None):
+        """
+        Genera en orden las claves k con lo <= k < hi (None = sin cota).
+        """
+        node = first_node(self.root) if lo is None else ceiling_node(self.root, lo)
+        while node is not None and (hi is None or node.key < hi):
+            yield node.key
+            node = next_node(node)
+
+    def floor(self, key):
+        # Mayor clave <= key, o None
+        node = floor_node(self.root, key)
+        return None if node is None else node.key
+
+    def ceiling(self, key):
+        # Menor clave >= key, o None
+        node = ceiling_node(self.root, key)
+        return None if node is None else node.key
+
+    def successor(self, key):
+        # Menor clave estrictamente mayor que key, o None
+        node = higher_node(self.root, key)
+        return None if node is None else node.key
+
+    def predecessor(self, key):
+        # Mayor clave estrictamente menor que key, o None
+        node = lower_node(self.root, key)
+        return None if node is None else node.key
+
+    # ----------------------- ESTADÍSTICAS DE ORDEN -----------------------
+    # Requieren que el árbol mantenga tamaños de subárbol (order_stats=True).
+
+    def _require_order_stats(self, operation: str):
+        if not self.order_stats:
+            raise RuntimeError(f"{operation} requiere crear el árbol con order_stats=True")
+
+    def select(self, i: int):
+        """
+        Retorna la i-ésima clave más pequeña (desde 0; i negativo cuenta
+        desde el final) en O(log n). Lanza IndexError si está fuera de rango.
+        """
+        self._require_order_stats("select")
+        n = get_size(self.root)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice fuera de rango")
+
+        node = self.root
+        while True:
+            left_size = get_size(node.left)
+            if i < left_size:
+                node = node.left
+            elif i == left_size:
+                return node.key
+            else:
+                i -= left_size + 1
+                node = node.right
+
+    def rank(self, key) -> int:
+        """
+        Número de claves estrictamente menores que `key`, en O(log n).
+        """
+        self._require_order_stats("rank")
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.key < key:
+                count += get_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def count_range(self, lo=None, hi=None) -> int:
+        """
+        Número de claves k con lo <= k < hi (None = sin cota), en O(log n).
+        """
+        self._require_order_stats("count_range")
+        low = 0 if lo is None else self.rank(lo)
+        high = get_size(self.root) if hi is None else self.rank(hi)
+        return max(0, high - low)
+
+    def finger(self, key=None) -> Finger:
+        """
+        Crea un Finger ubicado en `key` (o donde terminaría su búsqueda);
+        sin clave empieza en la raíz.
+        """
+        finger = Finger(self)
+        if key is not None:
+            finger.search(key)
+        return finger
+
+    # ----------------------- BÚSQUEDA EN LOTE / VISTAS -----------------------
+    # Requieren los atributos _version, _keys_cache y _frozen que inicializa
+    # cada árbol.
+
+    def freeze(self, eytzinger: bool = False) -> FrozenView:
+        """
+        Retorna una FrozenView inmutable con las claves en un arreglo
+        contiguo (ver frozen_view.py). Se construye en O(n) la primera vez y
+        se reutiliza hasta la próxima inserción o eliminación; con
+        eytzinger=True agrega el layout BFS para search.
+        """
+        cached = self._frozen
+        if cached is not None and cached[0] == self._version:
+            view = cached[1]
+            if view.eytzinger or not eytzinger:
+                return view
+            # Mismas claves: solo falta el layout
+            view = FrozenView(view._keys, eytzinger=True)
+        else:
+            view = FrozenView(list(self), eytzinger)
+        self._frozen = (self._version, view)
+        return view
+
+    def sorted_keys(self):
+        """
+        Claves en orden como arreglo contiguo (numpy.ndarray, o list sin
+        numpy). Se construye en O(n) y queda cacheado hasta la próxima
+        inserción o eliminación. No se debe modificar.
+        """
+        cached = self._keys_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        keys = list(self)
+        if np is not None:
+            keys = np.array(keys)
+        self._keys_cache = (self._version, keys)
+        return keys
+
+    def _flatten_pays_off(self, batch: int) -> bool:
+        cached = self._keys_cache
+        if cached is not None:
+            if cached[0] == self._version:
+                return True
+            n = len(cached[1])      # tamaño de la última versión cacheada
+        elif self.order_stats:
+            n = get_size(self.root)
+        else:
+            n = 0
+        return batch >= max(SEARCH_MANY_MIN_BATCH, n // 8)
+
+    def search_many(self, keys, return_index: bool = False):
+        """
+        Busca un lote de claves. Retorna un arreglo de booleanos (pertenencia)
+        o, con return_index=True, la posición de cada clave en sorted_keys()
+        (la de su primera ocurrencia; -1 si no está).
+        - Lotes grandes (al menos n / 8 claves) o si sorted_keys() ya está
+          cacheado: búsqueda binaria vectorizada (np.searchsorted) sobre las
+          claves aplanadas.
+        - Lotes chicos: una bajada por el árbol por clave, sin aplanarlo.
+        Con numpy el resultado es un ndarray; sin numpy, una lista.
+        """
+        if np is not None:
+            keys = np.asarray(keys)
+        elif not isinstance(keys, list):
+            keys = list(keys)
+
+        if not return_index and not self._flatten_pays_off(len(keys)):
+            search = self.search
+            found = [search(key) is not None
+                     for key in (keys.tolist() if np is not None else keys)]
+            return np.array(found, dtype=bool) if np is not None else found
+
+        flat = self.sorted_keys()
+        n = len(flat)
+        if np is None:
+            result = []
+            for key in keys:
+                i = bisect.bisect_left(flat, key)
+                hit = i < n and flat[i] == key
+                result.append((i if hit else -1) if return_index else hit)
+            return result
+
+        positions = np.searchsorted(flat, keys)
+        if n == 0:
+            found = np.zeros(len(keys), dtype=bool)
+        else:
+            found = (positions < n) & (flat[np.minimum(positions, n - 1)] == keys)
+        if return_index:
+            return np.where(found, positions, -1)
+        return found
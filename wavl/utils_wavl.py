@@ -22,3 +22,40 @@ def print_tree(root: Optional[NodeWAVL], level: int = 0):
         print_tree(root.right, level + 1)
         print('    ' * level + f"({root.key}, r={root.rank})")
         print_tree(root.left, level + 1)
+
+
+def is_valid_wavl(root: Optional[NodeWAVL], check_parents: bool = True) -> bool:
+    """
+    Verifica (de forma iterativa) las invariantes del árbol con raíz `root`:
+    orden BST, punteros parent coherentes, diferencias de rango en {1, 2}
+    y hojas con rango 0. Con check_parents=False no se revisan los punteros
+    parent (nodos persistentes, que no los tienen).
+    """
+    if root is None:
+        return True
+    if check_parents and root.parent is not None:
+        return False
+
+    prev_key = None
+    stack = []
+    node = root
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+
+        if prev_key is not None and node.key < prev_key:
+            return False
+        prev_key = node.key
+
+        for child in (node.left, node.right):
+            if check_parents and child is not None and child.parent is not node:
+                return False
+            if node.rank - get_rank(child) not in (1, 2):
+                return False
+        if node.left is None and node.right is None and node.rank != 0:
+            return False
+
+        node = node.right
+    return True
@@ -0,0 +1,332 @@
+# wavl/wal.py
+#
+# Durabilidad para WAVLTree: write-ahead log (WAL) de solo-append con
+# group commit, recuperación desde el último snapshot + replay del log y
+# compactación (checkpoint).
+#
+# Archivos dentro de `directory`, numerados por generación g:
+#   snapshot-<g>.wvl   claves en orden (formato de snapshot.py)
+#   wal-<g>.log        mutaciones posteriores a snapshot-<g>
+# Un checkpoint escribe snapshot-<g+1> de forma atómica, abre wal-<g+1>
+# vacío y recién entonces borra los archivos de la generación g. Si el
+# proceso cae en medio, la recuperación usa la generación más alta con
+# snapshot válido, así que nunca se reaplica un registro ya incluido.
+
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from typing import Optional
+from tree_wavl import WAVLTree
+from snapshot import read_snapshot, write_snapshot
+
+_MAGIC = b"WVLW"
+_VERSION = 1
+_LOG_HEADER = struct.Struct("<4sBxxxq")    # magic, versión, relleno, generación
+_RECORD = struct.Struct("<BqI")             # op, clave, crc32(op + clave)
+_BODY = struct.Struct("<Bq")
+
+OP_INSERT = 1
+OP_DELETE = 2
+
+_FILE_RE = re.compile(r"^(snapshot|wal)-(\d+)\.(wvl|log)$")
+
+
+def _encode(op: int, key: int) -> bytes:
+    body = _BODY.pack(op, key)
+    return body + struct.pack("<I", zlib.crc32(body))
+
+
+def _fsync_dir(directory):
+    # Persiste las entradas de directorio (creación/rename/borrado); no todas
+    # las plataformas permiten abrir un directorio
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def read_log(path):
+    """
+    Lee un WAL y retorna (generación, registros válidos [(op, clave)],
+    bytes válidos). La lectura se detiene en el primer registro incompleto o
+    con CRC incorrecto (escritura cortada por una caída): lo que sigue se
+    descarta.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _LOG_HEADER.size:
+        raise ValueError(f"WAL inválido: {path}")
+    magic, version, generation = _LOG_HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"WAL inválido: {path}")
+
+    records = []
+    offset = _LOG_HEADER.size
+    size = _RECORD.size
+    while offset + size <= len(data):
+        op, key, crc = _RECORD.unpack_from(data, offset)
+        if zlib.crc32(data[offset:offset + _BODY.size]) != crc or op not in (OP_INSERT, OP_DELETE):
+            break
+        records.append((op, key))
+        offset += size
+    return generation, records, offset
+
+
+class DurableWAVLTree:
+    """
+    WAVLTree cuyas inserciones y eliminaciones se registran en un WAL antes
+    de aplicarse. Las lecturas van directo al árbol en memoria (`tree`).
+
+    Group commit: los registros se acumulan en un buffer y se escriben con
+    un solo write + fsync cada `group_commit` operaciones, cuando pasan
+    `max_delay` segundos desde el primer registro pendiente (un timer en un
+    hilo aparte sincroniza aunque no lleguen más escrituras), o al llamar
+    a sync()/checkpoint()/close(). Solo lo sincronizado sobrevive a una
+    caída del sistema; las operaciones pendientes pueden perderse.
+
+    Con `compact_every` se hace un checkpoint automático cada esa cantidad
+    de registros en el log. Solo admite claves enteras de 64 bits.
+    """
+
+    def __init__(self, directory, group_commit: int = 128, max_delay: Optional[float] = None,
+                 compact_every: Optional[int] = None, order_stats: bool = False):
+        self.directory = directory
+        self.group_commit = max(1, group_commit)
+        self.max_delay = max_delay
+        self.compact_every = compact_every
+        self.order_stats = order_stats
+
+        self._buffer = bytearray()
+        self._pending = 0
+        self._pending_since = 0.0
+        self._log_records = 0
+        self._log = None
+        # El timer de max_delay sincroniza desde otro hilo: el buffer y el
+        # archivo del log se tocan solo con este lock
+        self._lock = threading.RLock()
+        self._timer = None
+
+        # Contadores
+        self.records_logged = 0
+        self.sync_count = 0
+        self.replayed = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+    # ----------------------- RECUPERACIÓN -----------------------
+
+    def _path(self, kind: str, generation: int) -> str:
+        ext = "wvl" if kind == "snapshot" else "log"
+        return os.path.join(self.directory, f"{kind}-{generation}.{ext}")
+
+    def _scan(self):
+        generations = {"snapshot": set(), "wal": set()}
+        for name in os.listdir(self.directory):
+            match = _FILE_RE.match(name)
+            if match:
+                generations[match.group(1)].add(int(match.group(2)))
+        return generations
+
+    def _recover(self):
+        """
+        Carga el snapshot de generación más alta (o un árbol vacío), aplica
+        los registros válidos de su WAL, recorta una cola corrupta y borra
+        los archivos de generaciones viejas.
+        """
+        found = self._scan()
+        generation = max(found["snapshot"] | found["wal"], default=0)
+        # El WAL de g solo vale sobre snapshot-g (o sobre el árbol vacío si
+        # g = 0); un WAL sin su snapshot se ignora
+        while generation > 0 and generation not in found["snapshot"]:
+            generation -= 1
+
+        if generation in found["snapshot"]:
+            keys, _ = read_snapshot(self._path("snapshot", generation))
+            self.tree = WAVLTree.from_sorted(keys, order_stats=self.order_stats)
+        else:
+            self.tree = WAVLTree(self.order_stats)
+        self.generation = generation
+
+        log_path = self._path("wal", generation)
+        # Una caída en _create_log puede dejar el WAL sin cabecera completa:
+        # todavía no tenía registros, así que equivale a un log vacío
+        if generation in found["wal"] and os.path.getsize(log_path) < _LOG_HEADER.size:
+            found["wal"].discard(generation)
+        if generation in found["wal"]:
+            log_generation, records, valid_bytes = read_log(log_path)
+            if log_generation != generation:
+                raise ValueError(f"generación inconsistente en {log_path}")
+            for op, key in records:
+                if op == OP_INSERT:
+                    self.tree.insert(key)
+                else:
+                    self.tree.delete(key)
+            self.replayed = len(records)
+            self._log_records = len(records)
+            # Recortar la cola inválida para que los nuevos registros no
+            # queden detrás de basura
+            self._log = open(log_path, "r+b")
+            self._log.truncate(valid_bytes)
+            self._log.seek(valid_bytes)
+            os.fsync(self._log.fileno())
+        else:
+            self._log = self._create_log(generation)
+
+        self._remove_older(generation)
+
+    def _create_log(self, generation: int):
+        # La cabecera se escribe en un temporal que se renombra: el WAL
+        # aparece completo o no aparece
+        path = self._path("wal", generation)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_LOG_HEADER.pack(_MAGIC, _VERSION, generation))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        _fsync_dir(self.directory)
+        log = open(path, "r+b")
+        log.seek(0, os.SEEK_END)
+        return log
+
+    def _remove_older(self, generation: int):
+        found = self._scan()
+        for kind, generations in found.items():
+            for g in generations:
+                if g != generation:
+                    os.remove(self._path(kind, g))
+        for name in os.listdir(self.directory):
+            if name.endswith(".tmp"):
+                os.remove(os.path.join(self.directory, name))
+
+    # ----------------------- MUTACIONES -----------------------
+
+    def _append(self, op: int, key: int):
+        with self._lock:
+            if self._log is None:
+                raise ValueError("el árbol durable está cerrado")
+            if self._pending == 0:
+                self._pending_since = time.monotonic()
+                if self.max_delay is not None and self._timer is None:
+                    self._timer = threading.Timer(self.max_delay, self._sync_due)
+                    self._timer.daemon = True
+                    self._timer.start()
+            self._buffer += _encode(op, key)
+            self._pending += 1
+            self._log_records += 1
+            self.records_logged += 1
+
+            if self._pending >= self.group_commit or (
+                    self.max_delay is not None
+                    and time.monotonic() - self._pending_since >= self.max_delay):
+                self.sync()
+
+    def _sync_due(self):
+        # Vence max_delay sin que una escritura haya disparado el sync
+        with self._lock:
+            self._timer = None
+            self.sync()
+
+    def insert(self, key: int):
+        # Se registra antes de aplicar (write-ahead)
+        self._append(OP_INSERT, key)
+        self.tree.insert(key)
+        self._maybe_compact()
+
+    def delete(self, key: int):
+        self._append(OP_DELETE, key)
+        self.tree.delete(key)
+        self._maybe_compact()
+
+    def insert_many(self, keys):
+        keys = sorted(keys)
+        for key in keys:
+            self._append(OP_INSERT, key)
+        self.tree.insert_many(keys)
+        self._maybe_compact()
+
+    def delete_many(self, keys):
+        keys = sorted(keys)
+        for key in keys:
+            self._append(OP_DELETE, key)
+        self.tree.delete_many(keys)
+        self._maybe_compact()
+
+    def _maybe_compact(self):
+        if self.compact_every is not None and self._log_records >= self.compact_every:
+            self.checkpoint()
+
+    # ----------------------- LECTURAS -----------------------
+
+    def search(self, key):
+        return self.tree.search(key)
+
+    def __contains__(self, key) -> bool:
+        return self.tree.search(key) is not None
+
+    def __iter__(self):
+        return iter(self.tree)
+
+    # ----------------------- SYNC / CHECKPOINT -----------------------
+
+    def sync(self):
+        """
+        Escribe los registros pendientes con un solo write y fsync: todas
+        las operaciones previas quedan durables.
+        """
+        with self._lock:
+            if self._pending == 0 or self._log is None:
+                return
+            self._log.write(self._buffer)
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._buffer.clear()
+            self._pending = 0
+            self.sync_count += 1
+
+    def checkpoint(self):
+        """
+        Compactación: escribe el árbol actual como snapshot de la siguiente
+        generación, abre un WAL vacío para ella y borra snapshot y WAL
+        anteriores. El log deja de crecer sin límite y la recuperación solo
+        tiene que reaplicar lo posterior al checkpoint.
+        """
+        with self._lock:
+            self.sync()
+            generation = self.generation + 1
+            write_snapshot(self._path("snapshot", generation), iter(self.tree), self.order_stats)
+            new_log = self._create_log(generation)
+            self._log.close()
+            self._log = new_log
+            self.generation = generation
+            self._log_records = 0
+            self._remove_older(generation)
+            _fsync_dir(self.directory)
+
+    def close(self):
+        with self._lock:
+            if self._log is None:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self.sync()
+            self._log.close()
+            self._log = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False